@@ -1,28 +1,44 @@
 # coding=utf-8
 
+import argparse
+import hashlib
+import heapq
 import json
 import os
 import random
 import re
+import signal
 import time
 import webbrowser
 import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.header import Header
 from email.utils import formataddr, formatdate, make_msgid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Callable, Dict, List, Tuple, Optional, Union
+from urllib.parse import urlparse
 
 import pytz
 import requests
 import yaml
 
 # 导入工具函数
-from utils.html_renderer import render_html_content
+from utils.cron_schedule import CronSchedule
+from utils.crawl_scheduler import (
+    CRAWL_SCHEDULE_FILE,
+    AdaptiveCrawlScheduler,
+    new_title_ratio,
+)
+from utils.html_renderer import publish_html_copy, write_html_report
 from utils.html_escape import html_escape
 from utils.time_utils import get_beijing_time
+from utils.history_store import HISTORY_DB_NAME, HistoryStore
+from utils.snapshot_store import SNAPSHOT_DB_NAME, SnapshotStore
+from utils.word_matcher import WordGroupMatcher
 
 
 VERSION = "3.4.1"
@@ -61,9 +77,38 @@ SMTP_CONFIGS = {
 
 
 # === 配置管理 ===
+def get_config_path() -> str:
+    """配置文件路径"""
+    return os.environ.get("CONFIG_PATH", "config/config.yaml")
+
+
+def get_config_signature() -> Optional[Tuple[int, int]]:
+    """配置文件的 (修改时间, 大小)，文件不存在时返回 None"""
+    try:
+        file_stat = Path(get_config_path()).stat()
+    except OSError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def _get_env_positive_int(name: str) -> Optional[int]:
+    """读取正整数环境变量，未设置、为 0 或取值无效时返回 None（沿用配置文件中的值）"""
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        print(f"环境变量 {name}={value!r} 不是有效的正整数，将使用配置文件中的值")
+        return None
+    return number or None
+
+
 def load_config():
     """加载配置文件"""
-    config_path = os.environ.get("CONFIG_PATH", "config/config.yaml")
+    config_path = get_config_path()
 
     if not Path(config_path).exists():
         raise FileNotFoundError(f"配置文件 {config_path} 不存在")
@@ -78,6 +123,36 @@ def load_config():
         "VERSION_CHECK_URL": config_data["app"]["version_check_url"],
         "SHOW_VERSION_UPDATE": config_data["app"]["show_version_update"],
         "REQUEST_INTERVAL": config_data["crawler"]["request_interval"],
+        # GitHub Actions 只提交 txt 快照（快照库为本地缓存，不进仓库），因此始终导出 txt
+        "TXT_EXPORT": config_data["crawler"].get("txt_export", True)
+        or os.environ.get("GITHUB_ACTIONS") == "true",
+        "HISTORY_DB": os.environ.get("HISTORY_DB_ENABLED", "").strip().lower()
+        in ("true", "1")
+        if os.environ.get("HISTORY_DB_ENABLED", "").strip()
+        else config_data["crawler"].get("history_db", True),
+        "HTTP_POOL_CONNECTIONS": config_data["crawler"].get(
+            "http_pool_connections", 10
+        ),
+        "HTTP_POOL_MAXSIZE": config_data["crawler"].get("http_pool_maxsize", 10),
+        "ADAPTIVE_INTERVAL": {
+            "ENABLED": os.environ.get("ADAPTIVE_INTERVAL_ENABLED", "").strip().lower()
+            in ("true", "1")
+            if os.environ.get("ADAPTIVE_INTERVAL_ENABLED", "").strip()
+            else config_data["crawler"]
+            .get("adaptive_interval", {})
+            .get("enabled", False),
+            "MIN_INTERVAL": config_data["crawler"]
+            .get("adaptive_interval", {})
+            .get("min_interval", 30),
+            "MAX_INTERVAL": config_data["crawler"]
+            .get("adaptive_interval", {})
+            .get("max_interval", 180),
+            "TARGET_NEW_RATIO": config_data["crawler"]
+            .get("adaptive_interval", {})
+            .get("target_new_ratio", 0.2),
+        },
+        "CRAWLER_MAX_WORKERS": _get_env_positive_int("CRAWLER_MAX_WORKERS")
+        or config_data["crawler"].get("max_workers", 1),
         "REPORT_MODE": os.environ.get("REPORT_MODE", "").strip()
         or config_data["report"]["mode"],
         "RANK_THRESHOLD": config_data["report"]["rank_threshold"],
@@ -255,11 +330,43 @@ def load_config():
 
 
 print("正在加载配置...")
+_config_signature = get_config_signature()
 CONFIG = load_config()
 print(f"TrendRadar v{VERSION} 配置加载完成")
 print(f"监控平台数量: {len(CONFIG['PLATFORMS'])}")
 
 
+def reload_config_if_changed() -> bool:
+    """配置文件变化时重新加载（常驻模式每轮执行前调用）
+
+    CONFIG 原地更新，各处引用立即生效；连接池参数变化时重建 HTTP 会话。
+    新配置加载失败时保留原配置。返回是否重新加载。
+    """
+    global _config_signature
+    signature = get_config_signature()
+    if signature is None or signature == _config_signature:
+        return False
+
+    print("检测到配置文件变化，重新加载配置...")
+    try:
+        new_config = load_config()
+    except Exception as e:
+        print(f"重新加载配置失败，继续使用原配置: {e}")
+        return False
+
+    pool_changed = any(
+        new_config[key] != CONFIG[key]
+        for key in ("HTTP_POOL_CONNECTIONS", "HTTP_POOL_MAXSIZE")
+    )
+    CONFIG.clear()
+    CONFIG.update(new_config)
+    _config_signature = signature
+    if pool_changed:
+        reset_http_sessions()
+    print(f"配置已重新加载，监控平台数量: {len(CONFIG['PLATFORMS'])}")
+    return True
+
+
 # === 工具函数 ===
 
 
@@ -296,14 +403,58 @@ def get_output_path(subfolder: str, filename: str) -> str:
     return str(output_dir / filename)
 
 
+# === HTTP 连接池 ===
+_http_sessions: Dict[Optional[str], requests.Session] = {}
+_http_sessions_lock = threading.Lock()
+
+
+def get_http_session(proxy_url: Optional[str] = None) -> requests.Session:
+    """获取进程内共享的 HTTP 会话（按代理地址区分）
+
+    爬虫、推送和版本检查共用这些会话，连接保持复用。代理不设置在会话上，
+    调用方需在每次请求时传入 proxies=get_request_proxies(proxy_url)：
+    会话级代理会被环境变量 HTTP(S)_PROXY 覆盖，而请求级代理优先于环境变量。
+    """
+    session = _http_sessions.get(proxy_url)
+    if session is not None:
+        return session
+
+    with _http_sessions_lock:
+        session = _http_sessions.get(proxy_url)
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=CONFIG["HTTP_POOL_CONNECTIONS"],
+                pool_maxsize=CONFIG["HTTP_POOL_MAXSIZE"],
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _http_sessions[proxy_url] = session
+    return session
+
+
+def get_request_proxies(proxy_url: Optional[str]) -> Optional[Dict[str, str]]:
+    """构造 requests 的 proxies 参数，未配置代理时返回 None"""
+    if not proxy_url:
+        return None
+    return {"http": proxy_url, "https": proxy_url}
+
+
+def reset_http_sessions() -> None:
+    """关闭并丢弃已创建的 HTTP 会话（连接池参数变化后按新参数重建）"""
+    with _http_sessions_lock:
+        for session in _http_sessions.values():
+            session.close()
+        _http_sessions.clear()
+
+
 def check_version_update(
     current_version: str, version_url: str, proxy_url: Optional[str] = None
 ) -> Tuple[bool, Optional[str]]:
     """检查版本更新"""
     try:
-        proxies = None
-        if proxy_url:
-            proxies = {"http": proxy_url, "https": proxy_url}
+        session = get_http_session(proxy_url)
+        proxies = get_request_proxies(proxy_url)
 
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
@@ -311,7 +462,7 @@ def check_version_update(
             "Cache-Control": "no-cache",
         }
 
-        response = requests.get(
+        response = session.get(
             version_url, proxies=proxies, headers=headers, timeout=10
         )
         response.raise_for_status()
@@ -342,14 +493,7 @@ def check_version_update(
 
 def is_first_crawl_today() -> bool:
     """检测是否是当天第一次爬取"""
-    date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
-
-    if not txt_dir.exists():
-        return True
-
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
-    return len(files) <= 1
+    return len(list_today_snapshots()) <= 1
 
 
 
@@ -459,6 +603,32 @@ class PushRecordManager:
 
 
 # === 数据获取 ===
+class HostRateLimiter:
+    """按主机限速：同一主机两次请求的发起时间至少间隔 interval（带随机抖动）"""
+
+    def __init__(self, interval_ms: int):
+        self.interval_ms = interval_ms
+        self._guard = threading.Lock()
+        self._host_locks: Dict[str, threading.Lock] = {}
+        self._next_allowed: Dict[str, float] = {}
+
+    def wait(self, url: str) -> None:
+        """阻塞直到该主机允许发起下一次请求"""
+        host = urlparse(url).netloc
+        with self._guard:
+            host_lock = self._host_locks.setdefault(host, threading.Lock())
+
+        # 持有主机锁期间等待，同一主机的请求按顺序依次放行
+        with host_lock:
+            wait_time = self._next_allowed.get(host, 0.0) - time.monotonic()
+            if wait_time > 0:
+                time.sleep(wait_time)
+
+            actual_interval = self.interval_ms + random.randint(-10, 20)
+            actual_interval = max(50, actual_interval)
+            self._next_allowed[host] = time.monotonic() + actual_interval / 1000
+
+
 class DataFetcher:
     """数据获取器"""
 
@@ -471,6 +641,7 @@ class DataFetcher:
         max_retries: int = 2,
         min_retry_wait: int = 3,
         max_retry_wait: int = 5,
+        rate_limiter: Optional[HostRateLimiter] = None,
     ) -> Tuple[Optional[str], str, str]:
         """获取指定ID数据，支持重试"""
         if isinstance(id_info, tuple):
@@ -481,9 +652,8 @@ class DataFetcher:
 
         url = f"https://newsnow.busiyi.world/api/s?id={id_value}&latest"
 
-        proxies = None
-        if self.proxy_url:
-            proxies = {"http": self.proxy_url, "https": self.proxy_url}
+        session = get_http_session(self.proxy_url)
+        proxies = get_request_proxies(self.proxy_url)
 
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -496,7 +666,9 @@ class DataFetcher:
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
+                if rate_limiter:
+                    rate_limiter.wait(url)
+                response = session.get(
                     url, proxies=proxies, headers=headers, timeout=10
                 )
                 response.raise_for_status()
@@ -525,120 +697,389 @@ class DataFetcher:
                     return None, id_value, alias
         return None, id_value, alias
 
+    def _parse_items(self, response: str) -> Dict:
+        """解析接口响应为 {标题: {ranks, url, mobileUrl}}"""
+        data = json.loads(response)
+        title_data = {}
+        for index, item in enumerate(data.get("items", []), 1):
+            title = item.get("title")
+            # 跳过无效标题（None、float、空字符串）
+            if title is None or isinstance(title, float) or not str(title).strip():
+                continue
+            title = str(title).strip()
+            url = item.get("url", "")
+            mobile_url = item.get("mobileUrl", "")
+
+            if title in title_data:
+                title_data[title]["ranks"].append(index)
+            else:
+                title_data[title] = {
+                    "ranks": [index],
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+        return title_data
+
     def crawl_websites(
         self,
         ids_list: List[Union[str, Tuple[str, str]]],
-        request_interval: int = CONFIG["REQUEST_INTERVAL"],
+        request_interval: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ) -> Tuple[Dict, Dict, List]:
-        """爬取多个网站数据"""
+        """爬取多个网站数据
+
+        各平台由线程池并发获取，同一主机的请求由 HostRateLimiter 按
+        request_interval 错开；结果仍按 ids_list 的顺序汇总。
+        """
+        if request_interval is None:
+            request_interval = CONFIG["REQUEST_INTERVAL"]
+        if max_workers is None:
+            max_workers = CONFIG["CRAWLER_MAX_WORKERS"]
+        max_workers = max(1, min(max_workers, len(ids_list) or 1))
+
+        rate_limiter = HostRateLimiter(request_interval)
         results = {}
         id_to_name = {}
         failed_ids = []
 
-        for i, id_info in enumerate(ids_list):
-            if isinstance(id_info, tuple):
-                id_value, name = id_info
-            else:
-                id_value = id_info
-                name = id_value
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="crawler"
+        ) as executor:
+            futures = [
+                executor.submit(self.fetch_data, id_info, rate_limiter=rate_limiter)
+                for id_info in ids_list
+            ]
 
-            id_to_name[id_value] = name
-            response, _, _ = self.fetch_data(id_info)
+            for id_info, future in zip(ids_list, futures):
+                if isinstance(id_info, tuple):
+                    id_value, name = id_info
+                else:
+                    id_value = id_info
+                    name = id_value
 
-            if response:
-                try:
-                    data = json.loads(response)
-                    results[id_value] = {}
-                    for index, item in enumerate(data.get("items", []), 1):
-                        title = item.get("title")
-                        # 跳过无效标题（None、float、空字符串）
-                        if title is None or isinstance(title, float) or not str(title).strip():
-                            continue
-                        title = str(title).strip()
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
-
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
-                        else:
-                            results[id_value][title] = {
-                                "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
-                            }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
-                except Exception as e:
-                    print(f"处理 {id_value} 数据出错: {e}")
-                    failed_ids.append(id_value)
-            else:
-                failed_ids.append(id_value)
+                id_to_name[id_value] = name
+                response, _, _ = future.result()
 
-            if i < len(ids_list) - 1:
-                actual_interval = request_interval + random.randint(-10, 20)
-                actual_interval = max(50, actual_interval)
-                time.sleep(actual_interval / 1000)
+                if response:
+                    try:
+                        results[id_value] = self._parse_items(response)
+                    except json.JSONDecodeError:
+                        print(f"解析 {id_value} 响应失败")
+                        failed_ids.append(id_value)
+                    except Exception as e:
+                        print(f"处理 {id_value} 数据出错: {e}")
+                        failed_ids.append(id_value)
+                else:
+                    failed_ids.append(id_value)
 
         print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
         return results, id_to_name, failed_ids
 
 
 # === 数据处理 ===
-def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> str:
-    """保存标题到文件"""
-    file_path = get_output_path("txt", f"{format_time_filename()}.txt")
-
-    with open(file_path, "w", encoding="utf-8") as f:
-        for id_value, title_data in results.items():
-            # id | name 或 id
-            name = id_to_name.get(id_value)
-            if name and name != id_value:
-                f.write(f"{id_value} | {name}\n")
+def render_titles_text(results: Dict, id_to_name: Dict, failed_ids: List) -> str:
+    """生成标题快照的 txt 文本"""
+    lines = []
+    for id_value, title_data in results.items():
+        # id | name 或 id
+        name = id_to_name.get(id_value)
+        if name and name != id_value:
+            lines.append(f"{id_value} | {name}\n")
+        else:
+            lines.append(f"{id_value}\n")
+
+        # 按排名排序标题
+        sorted_titles = []
+        for title, info in title_data.items():
+            cleaned_title = clean_title(title)
+            if isinstance(info, dict):
+                ranks = info.get("ranks", [])
+                url = info.get("url", "")
+                mobile_url = info.get("mobileUrl", "")
             else:
-                f.write(f"{id_value}\n")
-
-            # 按排名排序标题
-            sorted_titles = []
-            for title, info in title_data.items():
-                cleaned_title = clean_title(title)
-                if isinstance(info, dict):
-                    ranks = info.get("ranks", [])
-                    url = info.get("url", "")
-                    mobile_url = info.get("mobileUrl", "")
-                else:
-                    ranks = info if isinstance(info, list) else []
-                    url = ""
-                    mobile_url = ""
+                ranks = info if isinstance(info, list) else []
+                url = ""
+                mobile_url = ""
+
+            rank = ranks[0] if ranks else 1
+            sorted_titles.append((rank, cleaned_title, url, mobile_url))
+
+        sorted_titles.sort(key=lambda x: x[0])
+
+        for rank, cleaned_title, url, mobile_url in sorted_titles:
+            line = f"{rank}. {cleaned_title}"
 
-                rank = ranks[0] if ranks else 1
-                sorted_titles.append((rank, cleaned_title, url, mobile_url))
+            if url:
+                line += f" [URL:{url}]"
+            if mobile_url:
+                line += f" [MOBILE:{mobile_url}]"
+            lines.append(line + "\n")
 
-            sorted_titles.sort(key=lambda x: x[0])
+        lines.append("\n")
 
-            for rank, cleaned_title, url, mobile_url in sorted_titles:
-                line = f"{rank}. {cleaned_title}"
+    if failed_ids:
+        lines.append("==== 以下ID请求失败 ====\n")
+        for id_value in failed_ids:
+            lines.append(f"{id_value}\n")
 
-                if url:
-                    line += f" [URL:{url}]"
-                if mobile_url:
-                    line += f" [MOBILE:{mobile_url}]"
-                f.write(line + "\n")
+    return "".join(lines)
 
-            f.write("\n")
 
-        if failed_ids:
-            f.write("==== 以下ID请求失败 ====\n")
-            for id_value in failed_ids:
-                f.write(f"{id_value}\n")
+def save_titles_to_file(
+    results: Dict,
+    id_to_name: Dict,
+    failed_ids: List,
+    time_info: Optional[str] = None,
+) -> str:
+    """保存标题快照
+
+    快照写入当日快照库（output/<日期>/snapshots.db）；开启 txt 导出时同时写出
+    txt 文件。快照库中保存的是 txt 文本解析后的结果，两种格式读出的数据一致。
+    内容与上次相同的平台在库中只记录引用，变化情况可由 get_snapshot_changes 查询。
+    返回 txt 文件路径（未导出 txt 时返回快照库路径）。
+    """
+    global _last_snapshot_changes
+    if time_info is None:
+        time_info = format_time_filename()
+
+    content = render_titles_text(results, id_to_name, failed_ids)
+    titles_by_id, parsed_id_to_name = parse_titles_text(content)
+    changed_ids = get_snapshot_store().save_snapshot(
+        time_info,
+        titles_by_id,
+        parsed_id_to_name,
+        failed_ids,
+        len(content.encode("utf-8")),
+    )
+    _last_snapshot_changes = (format_date_folder(), time_info, changed_ids)
+
+    unchanged_count = len(titles_by_id) - len(
+        [source_id for source_id in changed_ids if source_id in titles_by_id]
+    )
+    if unchanged_count:
+        print(f"{unchanged_count} 个平台的内容与上次快照相同，仅记录引用")
+
+    if not CONFIG["TXT_EXPORT"]:
+        return str(get_snapshot_store().db_path)
+
+    file_path = get_output_path("txt", f"{time_info}.txt")
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write(content)
 
     return file_path
 
 
+# === 当日快照 ===
+_snapshot_store: Optional[Tuple[str, SnapshotStore]] = None
+# 本进程最近一次保存快照的 (日期文件夹, time_info, 内容有变化的平台ID)
+_last_snapshot_changes: Optional[Tuple[str, str, List[str]]] = None
+
+
+def get_snapshot_changes(time_info: str) -> Optional[List[str]]:
+    """返回本进程保存的当天快照中，与上一个快照相比内容有变化的平台ID
+
+    该快照不是本进程保存的最近一次快照时返回 None（变化情况未知）。
+    """
+    if _last_snapshot_changes is None:
+        return None
+    date_folder, saved_time_info, changed_ids = _last_snapshot_changes
+    if date_folder != format_date_folder() or saved_time_info != time_info:
+        return None
+    return changed_ids
+
+
+def get_snapshot_store() -> SnapshotStore:
+    """获取当天的快照库（跨日后自动切换到新日期）"""
+    global _snapshot_store
+    date_folder = format_date_folder()
+    if _snapshot_store is None or _snapshot_store[0] != date_folder:
+        if _snapshot_store is not None:
+            _snapshot_store[1].close()
+        db_path = Path("output") / date_folder / SNAPSHOT_DB_NAME
+        _snapshot_store = (date_folder, SnapshotStore(db_path))
+    return _snapshot_store[1]
+
+
+def _open_day_snapshot_store(date_folder: str) -> Tuple[Optional[SnapshotStore], bool]:
+    """打开某天的快照库，返回 (快照库, 是否需要调用方关闭)
+
+    当天使用共用的快照库；往日以只读方式打开；库不存在时返回 None。
+    """
+    db_path = Path("output") / date_folder / SNAPSHOT_DB_NAME
+    if not db_path.exists():
+        return None, False
+    if date_folder == format_date_folder():
+        return get_snapshot_store(), False
+    return SnapshotStore(db_path, readonly=True), True
+
+
+def list_day_snapshots(date_folder: str) -> List[Tuple[str, int]]:
+    """按时间顺序列出某天的快照 [(time_info, 内容字节数)]
+
+    以快照库为准，库中没有的 txt 文件（旧版本或 MCP 手动爬取写入）一并列出。
+    """
+    snapshots = {}
+    store, should_close = _open_day_snapshot_store(date_folder)
+    if store is not None:
+        try:
+            for time_info, size, _ in store.list_snapshots():
+                snapshots[time_info] = size
+        finally:
+            if should_close:
+                store.close()
+
+    txt_dir = Path("output") / date_folder / "txt"
+    if txt_dir.exists():
+        for file_path in txt_dir.iterdir():
+            if file_path.suffix == ".txt" and file_path.stem not in snapshots:
+                snapshots[file_path.stem] = file_path.stat().st_size
+
+    return sorted(snapshots.items())
+
+
+def load_day_snapshots(
+    date_folder: str, time_infos: List[str]
+) -> List[Tuple[str, Dict, Dict]]:
+    """按时间顺序读取某天的多个快照，返回 [(time_info, titles_by_id, id_to_name)]"""
+    loaded = {}
+    store, should_close = _open_day_snapshot_store(date_folder)
+    if store is not None:
+        try:
+            for time_info, titles_by_id, file_id_to_name in store.iter_snapshots(
+                time_infos
+            ):
+                loaded[time_info] = (titles_by_id, file_id_to_name)
+        finally:
+            if should_close:
+                store.close()
+
+    txt_dir = Path("output") / date_folder / "txt"
+    for time_info in time_infos:
+        if time_info not in loaded:
+            loaded[time_info] = parse_file_titles(txt_dir / f"{time_info}.txt")
+
+    return [(time_info, *loaded[time_info]) for time_info in sorted(time_infos)]
+
+
+def list_today_snapshots() -> List[Tuple[str, int]]:
+    """按时间顺序列出当天的快照 [(time_info, 内容字节数)]"""
+    return list_day_snapshots(format_date_folder())
+
+
+def load_today_snapshots(time_infos: List[str]) -> List[Tuple[str, Dict, Dict]]:
+    """按时间顺序读取当天的多个快照，返回 [(time_info, titles_by_id, id_to_name)]"""
+    return load_day_snapshots(format_date_folder(), time_infos)
+
+
+# === 自适应抓取频率 ===
+def get_crawl_scheduler() -> Optional[AdaptiveCrawlScheduler]:
+    """按配置创建自适应抓取调度器，未启用时返回 None"""
+    adaptive = CONFIG["ADAPTIVE_INTERVAL"]
+    if not adaptive["ENABLED"]:
+        return None
+
+    # 平台可单独设置抓取间隔上下限
+    platform_bounds = {}
+    for platform in CONFIG["PLATFORMS"]:
+        if "min_interval" in platform or "max_interval" in platform:
+            platform_bounds[platform["id"]] = (
+                platform.get("min_interval", adaptive["MIN_INTERVAL"]),
+                platform.get("max_interval", adaptive["MAX_INTERVAL"]),
+            )
+
+    return AdaptiveCrawlScheduler(
+        Path("output") / CRAWL_SCHEDULE_FILE,
+        adaptive["MIN_INTERVAL"],
+        adaptive["MAX_INTERVAL"],
+        adaptive["TARGET_NEW_RATIO"],
+        platform_bounds,
+    )
+
+
+def _time_info_minutes(time_info: str) -> Optional[int]:
+    """快照时间（HH时MM分）转为当天的分钟数"""
+    match = re.match(r"(\d{2})时(\d{2})分", time_info)
+    if not match:
+        return None
+    return int(match.group(1)) * 60 + int(match.group(2))
+
+
+def estimate_churn_from_snapshots(
+    snapshots: List[Tuple[str, Dict, Dict]]
+) -> Dict[str, float]:
+    """根据当天的快照估计各平台的变化速度（每分钟新增标题占榜单的比例）"""
+    totals = {}
+    previous = {}
+    for time_info, titles_by_id, _ in snapshots:
+        minutes = _time_info_minutes(time_info)
+        if minutes is None:
+            continue
+        for source_id, titles in titles_by_id.items():
+            if source_id in previous and minutes > previous[source_id][0]:
+                total = totals.setdefault(source_id, [0.0, 0])
+                total[0] += new_title_ratio(previous[source_id][1], titles)
+                total[1] += minutes - previous[source_id][0]
+            previous[source_id] = (minutes, titles)
+
+    return {
+        source_id: new_ratio / minutes
+        for source_id, (new_ratio, minutes) in totals.items()
+        if minutes
+    }
+
+
+def plan_adaptive_crawl(
+    scheduler: AdaptiveCrawlScheduler,
+    ids_list: List[Union[str, Tuple[str, str]]],
+    now: float,
+) -> Tuple[List[Union[str, Tuple[str, str]]], Dict]:
+    """挑选本次需要抓取的平台
+
+    当天最新快照中没有内容的平台（每天首次运行、上次抓取失败、新增平台）总是抓取。
+    返回 (需要抓取的平台, 当天最新快照的 titles_by_id)。
+    """
+    snapshots = list_today_snapshots()
+    latest_titles = {}
+    if snapshots:
+        _, latest_titles, _ = load_today_snapshots([snapshots[-1][0]])[0]
+
+    platform_ids = [
+        id_info[0] if isinstance(id_info, tuple) else id_info for id_info in ids_list
+    ]
+
+    # 首次出现的平台先用当天的历史快照估计变化速度
+    unknown_ids = [
+        platform_id
+        for platform_id in platform_ids
+        if not scheduler.has_platform(platform_id)
+    ]
+    if unknown_ids and len(snapshots) >= 2:
+        rates = estimate_churn_from_snapshots(
+            load_today_snapshots([time_info for time_info, _ in snapshots])
+        )
+        for platform_id in unknown_ids:
+            if platform_id in rates:
+                scheduler.seed_rate(platform_id, rates[platform_id])
+
+    due_ids = [
+        id_info
+        for id_info, platform_id in zip(ids_list, platform_ids)
+        if platform_id not in latest_titles or scheduler.is_due(platform_id, now)
+    ]
+    return due_ids, latest_titles
+
+
+_frequency_words_cache: Dict[str, Tuple] = {}
+
+
 def load_frequency_words(
     frequency_file: Optional[str] = None,
 ) -> Tuple[List[Dict], List[str]]:
-    """加载频率词配置"""
+    """加载频率词配置
+
+    结果按文件修改时间缓存，并同时编译 WordGroupMatcher，
+    之后通过 get_word_matcher 直接取用。
+    """
     if frequency_file is None:
         frequency_file = os.environ.get(
             "FREQUENCY_WORDS_PATH", "config/frequency_words.txt"
@@ -648,6 +1089,12 @@ def load_frequency_words(
     if not frequency_path.exists():
         raise FileNotFoundError(f"频率词文件 {frequency_file} 不存在")
 
+    file_stat = frequency_path.stat()
+    signature = (file_stat.st_mtime_ns, file_stat.st_size)
+    cached = _frequency_words_cache.get(str(frequency_path))
+    if cached and cached[0] == signature:
+        return cached[1], cached[2]
+
     with open(frequency_path, "r", encoding="utf-8") as f:
         content = f.read()
 
@@ -696,75 +1143,99 @@ def load_frequency_words(
                 }
             )
 
+    _frequency_words_cache[str(frequency_path)] = (
+        signature,
+        processed_groups,
+        filter_words,
+        WordGroupMatcher(processed_groups, filter_words),
+    )
     return processed_groups, filter_words
 
 
+def get_word_matcher(
+    word_groups: List[Dict], filter_words: List[str]
+) -> WordGroupMatcher:
+    """获取词组对应的编译匹配器
+
+    load_frequency_words 返回的词组直接复用加载时编译好的匹配器，
+    其他词组（如"全部新闻"虚拟词组）现场编译。
+    """
+    for _, groups, words, matcher in _frequency_words_cache.values():
+        if groups is word_groups and words is filter_words:
+            return matcher
+    return WordGroupMatcher(word_groups, filter_words)
+
+
 def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
     """解析单个txt文件的标题数据，返回(titles_by_id, id_to_name)"""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return parse_titles_text(f.read())
+
+
+def parse_titles_text(content: str) -> Tuple[Dict, Dict]:
+    """解析标题快照的 txt 文本，返回(titles_by_id, id_to_name)"""
     titles_by_id = {}
     id_to_name = {}
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
-        sections = content.split("\n\n")
+    sections = content.split("\n\n")
 
-        for section in sections:
-            if not section.strip() or "==== 以下ID请求失败 ====" in section:
-                continue
+    for section in sections:
+        if not section.strip() or "==== 以下ID请求失败 ====" in section:
+            continue
 
-            lines = section.strip().split("\n")
-            if len(lines) < 2:
-                continue
+        lines = section.strip().split("\n")
+        if len(lines) < 2:
+            continue
 
-            # id | name 或 id
-            header_line = lines[0].strip()
-            if " | " in header_line:
-                parts = header_line.split(" | ", 1)
-                source_id = parts[0].strip()
-                name = parts[1].strip()
-                id_to_name[source_id] = name
-            else:
-                source_id = header_line
-                id_to_name[source_id] = source_id
+        # id | name 或 id
+        header_line = lines[0].strip()
+        if " | " in header_line:
+            parts = header_line.split(" | ", 1)
+            source_id = parts[0].strip()
+            name = parts[1].strip()
+            id_to_name[source_id] = name
+        else:
+            source_id = header_line
+            id_to_name[source_id] = source_id
 
-            titles_by_id[source_id] = {}
+        titles_by_id[source_id] = {}
 
-            for line in lines[1:]:
-                if line.strip():
-                    try:
-                        title_part = line.strip()
-                        rank = None
-
-                        # 提取排名
-                        if ". " in title_part and title_part.split(". ")[0].isdigit():
-                            rank_str, title_part = title_part.split(". ", 1)
-                            rank = int(rank_str)
-
-                        # 提取 MOBILE URL
-                        mobile_url = ""
-                        if " [MOBILE:" in title_part:
-                            title_part, mobile_part = title_part.rsplit(" [MOBILE:", 1)
-                            if mobile_part.endswith("]"):
-                                mobile_url = mobile_part[:-1]
-
-                        # 提取 URL
-                        url = ""
-                        if " [URL:" in title_part:
-                            title_part, url_part = title_part.rsplit(" [URL:", 1)
-                            if url_part.endswith("]"):
-                                url = url_part[:-1]
-
-                        title = clean_title(title_part.strip())
-                        ranks = [rank] if rank is not None else [1]
-
-                        titles_by_id[source_id][title] = {
-                            "ranks": ranks,
-                            "url": url,
-                            "mobileUrl": mobile_url,
-                        }
+        for line in lines[1:]:
+            if line.strip():
+                try:
+                    title_part = line.strip()
+                    rank = None
 
-                    except Exception as e:
-                        print(f"解析标题行出错: {line}, 错误: {e}")
+                    # 提取排名
+                    if ". " in title_part and title_part.split(". ")[0].isdigit():
+                        rank_str, title_part = title_part.split(". ", 1)
+                        rank = int(rank_str)
+
+                    # 提取 MOBILE URL
+                    mobile_url = ""
+                    if " [MOBILE:" in title_part:
+                        title_part, mobile_part = title_part.rsplit(" [MOBILE:", 1)
+                        if mobile_part.endswith("]"):
+                            mobile_url = mobile_part[:-1]
+
+                    # 提取 URL
+                    url = ""
+                    if " [URL:" in title_part:
+                        title_part, url_part = title_part.rsplit(" [URL:", 1)
+                        if url_part.endswith("]"):
+                            url = url_part[:-1]
+
+                    title = clean_title(title_part.strip())
+                    ranks = [rank] if rank is not None else [1]
+
+                    titles_by_id[source_id][title] = {
+                        "ranks": ranks,
+                        "url": url,
+                        "mobileUrl": mobile_url,
+                    }
+
+                except Exception as e:
+                    print(f"解析标题行出错: {line}, 错误: {e}")
 
     return titles_by_id, id_to_name
 
@@ -772,45 +1243,184 @@ def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
 def read_all_today_titles(
     current_platform_ids: Optional[List[str]] = None,
 ) -> Tuple[Dict, Dict, Dict]:
-    """读取当天所有标题文件，支持按当前监控平台过滤"""
-    date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
+    """读取当天所有标题数据，支持按当前监控平台过滤
 
-    if not txt_dir.exists():
+    数据来自持久化的当日聚合状态（见 sync_title_state），只有新增的
+    txt 快照才会被解析。
+    """
+    state = sync_title_state()
+    if state is None:
         return {}, {}, {}
 
+    title_info = state["title_info"]
+    id_to_name = state["id_to_name"]
+
+    if current_platform_ids is not None:
+        title_info = {
+            source_id: titles
+            for source_id, titles in title_info.items()
+            if source_id in current_platform_ids
+        }
+        id_to_name = {
+            source_id: name
+            for source_id, name in id_to_name.items()
+            if source_id in current_platform_ids
+        }
+
+    return _title_info_to_results(title_info), id_to_name, title_info
+
+
+def rebuild_title_state() -> Dict:
+    """从当天全部快照完整重建聚合状态（恢复路径）"""
+    state = _empty_title_state()
     all_results = {}
-    final_id_to_name = {}
-    title_info = {}
+    _apply_snapshots_to_title_state(state, all_results, list_today_snapshots())
+    return state
+
+
+def sync_title_state() -> Optional[Dict]:
+    """加载当日聚合状态，并增量合并尚未处理的快照
+
+    状态文件记录已处理快照的时间和大小。新快照按时间追加时只读取新快照；
+    已处理的快照缺失、大小变化，或出现早于已处理快照的新快照时，
+    完整重建。当天没有任何快照时返回 None。
+    """
+    snapshots = list_today_snapshots()
+    if not snapshots:
+        return None
+
+    state = _load_title_state()
+    needs_rebuild = state is None
+    pending = []
+    if not needs_rebuild:
+        needs_rebuild, pending = _check_snapshot_progress(snapshots, state["files"])
+
+    if needs_rebuild:
+        if state is not None:
+            print("当日聚合状态与快照不一致，重新构建")
+        state = rebuild_title_state()
+        _save_title_state(state)
+    elif pending:
+        all_results = _title_info_to_results(state["title_info"])
+        _apply_snapshots_to_title_state(state, all_results, pending)
+        _save_title_state(state)
+
+    return state
+
+
+def _check_snapshot_progress(
+    snapshots: List[Tuple[str, int]], processed: Dict[str, int]
+) -> Tuple[bool, List[Tuple[str, int]]]:
+    """对比已处理快照记录 {时间: 大小} 与当前快照列表
+
+    返回 (是否需要重建, 待处理的新快照)。已处理快照缺失或大小变化、
+    新快照早于已处理快照时需要重建。
+    """
+    current = dict(snapshots)
+    for time_info, size in processed.items():
+        if current.get(time_info) != size:
+            return True, []
+
+    pending = [snapshot for snapshot in snapshots if snapshot[0] not in processed]
+    if pending and processed and pending[0][0] < max(processed):
+        return True, []
+    return False, pending
+
+
+def _empty_title_state() -> Dict:
+    return {"version": 1, "files": {}, "id_to_name": {}, "title_info": {}}
+
+
+def _get_title_state_path() -> Path:
+    return Path("output") / format_date_folder() / "state" / "title_info.json"
+
+
+def _get_file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """文件的 (inode, 修改时间, 大小)，文件不存在时返回 None"""
+    try:
+        file_stat = path.stat()
+    except OSError:
+        return None
+    return file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
 
-    for file_path in files:
-        time_info = file_path.stem
+# 进程内保留的聚合状态 (文件路径, 文件签名, 状态)，常驻模式下文件未被外部改动时不再重新读取
+_title_state_cache: Optional[Tuple[str, Tuple[int, int, int], Dict]] = None
 
-        titles_by_id, file_id_to_name = parse_file_titles(file_path)
 
-        if current_platform_ids is not None:
-            filtered_titles_by_id = {}
-            filtered_id_to_name = {}
+def _load_title_state() -> Optional[Dict]:
+    """读取聚合状态文件，文件不存在或损坏时返回 None"""
+    global _title_state_cache
+    state_path = _get_title_state_path()
+    signature = _get_file_signature(state_path)
+    if signature is None:
+        return None
 
-            for source_id, title_data in titles_by_id.items():
-                if source_id in current_platform_ids:
-                    filtered_titles_by_id[source_id] = title_data
-                    if source_id in file_id_to_name:
-                        filtered_id_to_name[source_id] = file_id_to_name[source_id]
+    cached = _title_state_cache
+    if cached and cached[0] == str(state_path) and cached[1] == signature:
+        return cached[2]
 
-            titles_by_id = filtered_titles_by_id
-            file_id_to_name = filtered_id_to_name
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") != 1:
+            return None
+        _title_state_cache = (str(state_path), signature, state)
+        return state
+    except Exception as e:
+        print(f"读取当日聚合状态失败: {e}")
+        return None
 
-        final_id_to_name.update(file_id_to_name)
+
+def _save_title_state(state: Dict) -> None:
+    """原子写入聚合状态文件"""
+    global _title_state_cache
+    state_path = _get_title_state_path()
+    ensure_directory_exists(str(state_path.parent))
+    tmp_path = state_path.with_suffix(".tmp")
+    _title_state_cache = None
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, state_path)
+        signature = _get_file_signature(state_path)
+        if signature is not None:
+            _title_state_cache = (str(state_path), signature, state)
+    except Exception as e:
+        print(f"保存当日聚合状态失败: {e}")
+
+
+def _apply_snapshots_to_title_state(
+    state: Dict, all_results: Dict, snapshots: List[Tuple[str, int]]
+) -> None:
+    """按时间顺序将快照合并进聚合状态"""
+    sizes = dict(snapshots)
+    for time_info, titles_by_id, file_id_to_name in load_today_snapshots(
+        list(sizes)
+    ):
+        state["id_to_name"].update(file_id_to_name)
 
         for source_id, title_data in titles_by_id.items():
             process_source_data(
-                source_id, title_data, time_info, all_results, title_info
+                source_id, title_data, time_info, all_results, state["title_info"]
             )
 
-    return all_results, final_id_to_name, title_info
+        state["files"][time_info] = sizes[time_info]
+
+
+def _title_info_to_results(title_info: Dict) -> Dict:
+    """由 title_info 还原 all_results（合并后的排名和链接两者一致）"""
+    return {
+        source_id: {
+            title: {
+                "ranks": info["ranks"],
+                "url": info["url"],
+                "mobileUrl": info["mobileUrl"],
+            }
+            for title, info in titles.items()
+        }
+        for source_id, titles in title_info.items()
+    }
 
 
 def process_source_data(
@@ -887,69 +1497,270 @@ def process_source_data(
 
 
 def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -> Dict:
-    """检测当日最新批次的新增标题，支持按当前监控平台过滤"""
-    date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
+    """检测当日最新批次的新增标题，支持按当前监控平台过滤
 
-    if not txt_dir.exists():
+    借助当日已见标题索引（见 sync_seen_title_index），只需读取最新快照，
+    首次出现于最新批次的标题即为新增。
+    """
+    snapshots = list_today_snapshots()
+    if len(snapshots) < 2:
         return {}
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
-    if len(files) < 2:
+    # 与上一个快照内容相同的平台不会有新增标题，全部平台都未变化时无需读取快照
+    changed_ids = get_snapshot_changes(snapshots[-1][0])
+    if changed_ids is not None and not changed_ids:
         return {}
 
-    # 解析最新文件
-    latest_file = files[-1]
-    latest_titles, _ = parse_file_titles(latest_file)
+    first_seen = sync_seen_title_index(snapshots)
 
-    # 如果指定了当前平台列表，过滤最新文件数据
-    if current_platform_ids is not None:
-        filtered_latest_titles = {}
-        for source_id, title_data in latest_titles.items():
-            if source_id in current_platform_ids:
-                filtered_latest_titles[source_id] = title_data
-        latest_titles = filtered_latest_titles
-
-    # 汇总历史标题（按平台过滤）
-    historical_titles = {}
-    for file_path in files[:-1]:
-        historical_data, _ = parse_file_titles(file_path)
-
-        # 过滤历史数据
-        if current_platform_ids is not None:
-            filtered_historical_data = {}
-            for source_id, title_data in historical_data.items():
-                if source_id in current_platform_ids:
-                    filtered_historical_data[source_id] = title_data
-            historical_data = filtered_historical_data
-
-        for source_id, titles_data in historical_data.items():
-            if source_id not in historical_titles:
-                historical_titles[source_id] = set()
-            for title in titles_data.keys():
-                historical_titles[source_id].add(title)
+    # 读取最新快照
+    latest_time, latest_titles, _ = load_today_snapshots([snapshots[-1][0]])[0]
 
     # 找出新增标题
     new_titles = {}
     for source_id, latest_source_titles in latest_titles.items():
-        historical_set = historical_titles.get(source_id, set())
-        source_new_titles = {}
+        if current_platform_ids is not None and source_id not in current_platform_ids:
+            continue
+        if changed_ids is not None and source_id not in changed_ids:
+            continue
 
+        source_new_titles = {}
         for title, title_data in latest_source_titles.items():
-            if title not in historical_set:
+            key = (source_id, _hash_title(title))
+            if first_seen.get(key) == latest_time:
                 source_new_titles[title] = title_data
 
         if source_new_titles:
             new_titles[source_id] = source_new_titles
 
-    return new_titles
+    return new_titles
+
+
+# === 当日已见标题索引 ===
+# 追加写入的文本文件，每处理一个快照追加一个块：
+#   <source_id>\t<标题哈希>     （该快照中首次出现的标题，每行一条）
+#   @\t<快照文件名>\t<文件大小>  （块结束标记）
+# 块内标题的首次出现时间即结束标记中的快照文件名。
+
+
+def _hash_title(title: str) -> str:
+    return hashlib.md5(title.encode("utf-8")).hexdigest()[:16]
+
+
+def _get_seen_index_path() -> Path:
+    return Path("output") / format_date_folder() / "state" / "seen_titles.idx"
+
+
+# 进程内保留的已见标题索引 (文件路径, 文件签名, first_seen, processed)
+_seen_index_cache: Optional[Tuple[str, Tuple[int, int, int], Dict, Dict]] = None
+
+
+def _load_seen_title_index() -> Optional[Tuple[Dict, Dict[str, int]]]:
+    """读取已见标题索引，返回 ({(source_id, 哈希): 首次出现的快照}, 已处理快照)
+
+    文件不存在或末尾存在未写完的块时返回 None。文件自上次读写后未变化时
+    直接返回进程内保留的索引。
+    """
+    global _seen_index_cache
+    index_path = _get_seen_index_path()
+    signature = _get_file_signature(index_path)
+    if signature is None:
+        return None
+
+    cached = _seen_index_cache
+    if cached and cached[0] == str(index_path) and cached[1] == signature:
+        return cached[2], cached[3]
+
+    first_seen = {}
+    processed = {}
+    block = []
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t")
+                if parts[0] == "@" and len(parts) == 3:
+                    for key in block:
+                        first_seen.setdefault(key, parts[1])
+                    processed[parts[1]] = int(parts[2])
+                    block = []
+                elif len(parts) == 2:
+                    block.append((parts[0], parts[1]))
+                else:
+                    return None
+    except Exception as e:
+        print(f"读取已见标题索引失败: {e}")
+        return None
+
+    if block:
+        return None
+    _seen_index_cache = (str(index_path), signature, first_seen, processed)
+    return first_seen, processed
+
+
+def _append_seen_titles(
+    f,
+    first_seen: Dict,
+    processed: Dict[str, int],
+    time_info: str,
+    size: int,
+    titles_by_id: Dict,
+) -> None:
+    """把一个快照中首次出现的标题写成一个块"""
+    lines = []
+    for source_id, title_data in titles_by_id.items():
+        for title in title_data:
+            key = (source_id, _hash_title(title))
+            if key not in first_seen:
+                first_seen[key] = time_info
+                lines.append(f"{source_id}\t{key[1]}\n")
+
+    lines.append(f"@\t{time_info}\t{size}\n")
+    f.write("".join(lines))
+    processed[time_info] = size
+
+
+def sync_seen_title_index(snapshots: Optional[List[Tuple[str, int]]] = None) -> Dict:
+    """同步当日已见标题索引并返回 {(source_id, 标题哈希): 首次出现的快照}
+
+    新快照只追加新增标题；索引与快照不一致时整体重写。
+    """
+    global _seen_index_cache
+    if snapshots is None:
+        snapshots = list_today_snapshots()
+    if not snapshots:
+        return {}
+
+    index_path = _get_seen_index_path()
+    loaded = _load_seen_title_index()
+    needs_rebuild = loaded is None
+    pending = []
+    if not needs_rebuild:
+        first_seen, processed = loaded
+        needs_rebuild, pending = _check_snapshot_progress(snapshots, processed)
+
+    if needs_rebuild:
+        first_seen, processed = {}, {}
+        pending = snapshots
+
+    if not pending:
+        return first_seen
+
+    _seen_index_cache = None
+    sizes = dict(pending)
+    try:
+        ensure_directory_exists(str(index_path.parent))
+        with open(index_path, "w" if needs_rebuild else "a", encoding="utf-8") as f:
+            for time_info, titles_by_id, _ in load_today_snapshots(list(sizes)):
+                _append_seen_titles(
+                    f, first_seen, processed, time_info, sizes[time_info], titles_by_id
+                )
+        signature = _get_file_signature(index_path)
+        if signature is not None:
+            _seen_index_cache = (str(index_path), signature, first_seen, processed)
+    except Exception as e:
+        print(f"更新已见标题索引失败: {e}")
+
+    return first_seen
+
+
+
+# === 历史库 ===
+_history_store: Optional[HistoryStore] = None
+
+
+def get_history_store() -> HistoryStore:
+    """获取跨日期的历史库（output/history.db）"""
+    global _history_store
+    if _history_store is None:
+        _history_store = HistoryStore(Path("output") / HISTORY_DB_NAME)
+    return _history_store
+
+
+def sync_history_store(
+    snapshots: Optional[List[Tuple[str, int]]] = None,
+    date_folder: Optional[str] = None,
+) -> bool:
+    """将某天（默认当天）尚未写入历史库的快照合并进去，返回是否同步成功
+
+    与聚合状态相同的增量规则：新快照只追加，快照被替换或顺序不一致时重建当天数据。
+    新标题写入时同时建立全文索引和二元组倒排表。
+    历史库只服务于 MCP 查询，写入失败不影响本次运行。
+    """
+    if date_folder is None:
+        date_folder = format_date_folder()
+
+    date = datetime.strptime(date_folder, "%Y年%m月%d日").strftime("%Y-%m-%d")
+    try:
+        if snapshots is None:
+            snapshots = list_day_snapshots(date_folder)
+        if not snapshots:
+            return True
+
+        store = get_history_store()
+        needs_rebuild, pending = _check_snapshot_progress(
+            snapshots, store.list_day_snapshots(date)
+        )
+        if needs_rebuild:
+            store.reset_day(date)
+            pending = snapshots
+
+        sizes = dict(pending)
+        for time_info, titles_by_id, file_id_to_name in load_day_snapshots(
+            date_folder, list(sizes)
+        ):
+            store.add_snapshot(
+                date, time_info, sizes[time_info], titles_by_id, file_id_to_name
+            )
+        return True
+    except Exception as e:
+        print(f"更新历史库失败: {e}")
+        return False
+
+
+# 已核对过的往日目录签名 {日期文件夹: 签名}，常驻模式下签名不变的日期不再重复核对
+_backfilled_days: Dict[str, Tuple] = {}
+
+
+def _get_day_folder_signature(date_dir: Path) -> Tuple:
+    """往日目录的签名：txt 目录与快照库的修改时间和大小"""
+    return (
+        _get_file_signature(date_dir / "txt"),
+        _get_file_signature(date_dir / SNAPSHOT_DB_NAME),
+    )
+
+
+def backfill_history_store() -> None:
+    """补写历史库中缺失或不完整的往日数据
+
+    已完整写入的日期只比对快照列表，不读取内容，因此每次运行都可以调用。
+    """
+    output_dir = Path("output")
+    if not output_dir.exists():
+        return
+
+    today = format_date_folder()
+    for date_dir in sorted(output_dir.iterdir()):
+        if not date_dir.is_dir() or date_dir.name == today:
+            continue
+        try:
+            datetime.strptime(date_dir.name, "%Y年%m月%d日")
+        except ValueError:
+            continue
+
+        signature = _get_day_folder_signature(date_dir)
+        if _backfilled_days.get(date_dir.name) == signature:
+            continue
+        if sync_history_store(date_folder=date_dir.name):
+            _backfilled_days[date_dir.name] = signature
 
 
 # === 统计和分析 ===
 def calculate_news_weight(
-    title_data: Dict, rank_threshold: int = CONFIG["RANK_THRESHOLD"]
+    title_data: Dict, rank_threshold: Optional[int] = None
 ) -> float:
     """计算新闻权重，用于排序"""
+    if rank_threshold is None:
+        rank_threshold = CONFIG["RANK_THRESHOLD"]
     ranks = title_data.get("ranks", [])
     if not ranks:
         return 0.0
@@ -986,46 +1797,7 @@ def matches_word_groups(
     title: str, word_groups: List[Dict], filter_words: List[str]
 ) -> bool:
     """检查标题是否匹配词组规则"""
-    # 防御性类型检查：确保 title 是有效字符串
-    if not isinstance(title, str):
-        title = str(title) if title is not None else ""
-    if not title.strip():
-        return False
-
-    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
-    if not word_groups:
-        return True
-
-    title_lower = title.lower()
-
-    # 过滤词检查
-    if any(filter_word.lower() in title_lower for filter_word in filter_words):
-        return False
-
-    # 词组匹配检查
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
-
-        # 必须词检查
-        if required_words:
-            all_required_present = all(
-                req_word.lower() in title_lower for req_word in required_words
-            )
-            if not all_required_present:
-                continue
-
-        # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                normal_word.lower() in title_lower for normal_word in normal_words
-            )
-            if not any_normal_present:
-                continue
-
-        return True
-
-    return False
+    return get_word_matcher(word_groups, filter_words).matches(title)
 
 
 def format_time_display(first_time: str, last_time: str) -> str:
@@ -1087,11 +1859,13 @@ def count_word_frequency(
     filter_words: List[str],
     id_to_name: Dict,
     title_info: Optional[Dict] = None,
-    rank_threshold: int = CONFIG["RANK_THRESHOLD"],
+    rank_threshold: Optional[int] = None,
     new_titles: Optional[Dict] = None,
     mode: str = "daily",
 ) -> Tuple[List[Dict], int]:
     """统计词频，支持必须词、频率词、过滤词，并标记新增标题"""
+    if rank_threshold is None:
+        rank_threshold = CONFIG["RANK_THRESHOLD"]
 
     # 如果没有配置词组，创建一个包含所有新闻的虚拟词组
     if not word_groups:
@@ -1099,6 +1873,7 @@ def count_word_frequency(
         word_groups = [{"required": [], "normal": [], "group_key": "全部新闻"}]
         filter_words = []  # 清空过滤词，显示所有新闻
 
+    matcher = get_word_matcher(word_groups, filter_words)
     is_first_today = is_first_crawl_today()
 
     # 确定处理的数据源和新增标记逻辑
@@ -1180,12 +1955,9 @@ def count_word_frequency(
             if title in processed_titles.get(source_id, {}):
                 continue
 
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words
-            )
-
-            if not matches_frequency_words:
+            # 一次扫描同时完成过滤词判断和词组定位
+            group_index = matcher.match_group(title)
+            if group_index is None:
                 continue
 
             # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
@@ -1194,119 +1966,70 @@ def count_word_frequency(
             ):
                 matched_new_count += 1
 
-            source_ranks = title_data.get("ranks", [])
-            source_url = title_data.get("url", "")
-            source_mobile_url = title_data.get("mobileUrl", "")
-
-            # 找到匹配的词组（防御性转换确保类型安全）
-            title_lower = str(title).lower() if not isinstance(title, str) else title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑
-                    if required_words:
-                        all_required_present = all(
-                            req_word.lower() in title_lower
-                            for req_word in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            normal_word.lower() in title_lower
-                            for normal_word in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time)
-
-                source_name = id_to_name.get(source_id, source_id)
+            group_key = word_groups[group_index]["group_key"]
+            word_stats[group_key]["count"] += 1
+            if source_id not in word_stats[group_key]["titles"]:
+                word_stats[group_key]["titles"][source_id] = []
 
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
-                )
+            source_ranks = title_data.get("ranks", [])
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = source_ranks if source_ranks else []
+            url = title_data.get("url", "")
+            mobile_url = title_data.get("mobileUrl", "")
+
+            # 有历史统计信息时使用完整数据（current 模式依赖于此）
+            if source_id in title_info and title in title_info[source_id]:
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", url)
+                mobile_url = info.get("mobileUrl", mobile_url)
+
+            if not ranks:
+                ranks = [99]
+
+            time_display = format_time_display(first_time, last_time)
+
+            source_name = id_to_name.get(source_id, source_id)
+
+            # 判断是否为新增
+            is_new = False
+            if all_news_are_new:
+                # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
+                is_new = True
+            elif new_titles and source_id in new_titles:
+                # 检查是否在新增列表中
+                new_titles_for_source = new_titles[source_id]
+                is_new = title in new_titles_for_source
+
+            news_item = {
+                "title": title,
+                "source_name": source_name,
+                "first_time": first_time,
+                "last_time": last_time,
+                "time_display": time_display,
+                "count": count_info,
+                "ranks": ranks,
+                "rank_threshold": rank_threshold,
+                "url": url,
+                "mobileUrl": mobile_url,
+                "is_new": is_new,
+            }
 
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            # 排序键在这里一次算好：权重降序、最高排名升序、出现次数降序
+            sort_key = (
+                -calculate_news_weight(news_item, rank_threshold),
+                min(ranks),
+                -count_info,
+            )
+            word_stats[group_key]["titles"][source_id].append((sort_key, news_item))
 
-                break
+            processed_titles[source_id][title] = True
 
     # 最后统一打印汇总信息
     if mode == "incremental":
@@ -1368,19 +2091,9 @@ def count_word_frequency(
     }
 
     for group_key, data in word_stats.items():
-        all_titles = []
+        keyed_titles = []
         for source_id, title_list in data["titles"].items():
-            all_titles.extend(title_list)
-
-        # 按权重排序
-        sorted_titles = sorted(
-            all_titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
+            keyed_titles.extend(title_list)
 
         # 应用最大显示数量限制（优先级：单独配置 > 全局配置）
         group_max_count = group_key_to_max_count.get(group_key, 0)
@@ -1388,8 +2101,15 @@ def count_word_frequency(
             # 使用全局配置
             group_max_count = CONFIG.get("MAX_NEWS_PER_KEYWORD", 0)
 
-        if group_max_count > 0:
-            sorted_titles = sorted_titles[:group_max_count]
+        # 按预先计算的排序键排序（稳定排序，键相同时保持原有顺序）；
+        # 有数量限制时用有界堆只取前 N 条，结果与完整排序后截取一致
+        if 0 < group_max_count < len(keyed_titles):
+            keyed_titles = heapq.nsmallest(
+                group_max_count, keyed_titles, key=lambda entry: entry[0]
+            )
+        else:
+            keyed_titles.sort(key=lambda entry: entry[0])
+        sorted_titles = [news_item for _, news_item in keyed_titles]
 
         stats.append(
             {
@@ -1434,11 +2154,11 @@ def prepare_report_data(
     if not hide_new_section:
         filtered_new_titles = {}
         if new_titles and id_to_name:
-            word_groups, filter_words = load_frequency_words()
+            matcher = get_word_matcher(*load_frequency_words())
             for source_id, titles_data in new_titles.items():
                 filtered_titles = {}
                 for title, title_data in titles_data.items():
-                    if matches_word_groups(title, word_groups, filter_words):
+                    if matcher.matches(title):
                         filtered_titles[title] = title_data
                 if filtered_titles:
                     filtered_new_titles[source_id] = filtered_titles
@@ -1725,17 +2445,14 @@ def generate_html_report(
 
     report_data = prepare_report_data(stats, failed_ids, new_titles, id_to_name, mode)
 
-    html_content = render_html_content(
-        report_data, total_titles, is_daily_summary, mode, update_info
+    # 边渲染边写入，不在内存中拼接整页HTML
+    write_html_report(
+        file_path, report_data, total_titles, is_daily_summary, mode, update_info
     )
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
-
     if is_daily_summary:
-        root_file_path = Path("index.html")
-        with open(root_file_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        # 根目录 index.html 直接由已写好的报告硬链接或复制得到，不再重复写入整页内容
+        publish_html_copy(file_path, Path("index.html"))
 
     return file_path
 
@@ -2004,14 +2721,141 @@ def add_batch_headers(
     return result
 
 
+class ReportBatchCache:
+    """一份报告的推送渲染缓存，由 send_to_notifications 创建并传给各渠道
+
+    各渠道并发发送时共用：同一推送格式和批次大小的分批结果只生成一次，
+    相同平台格式的标题行只格式化一次。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._batches: Dict[Tuple, List[str]] = {}
+        self._titles: Dict[Tuple, str] = {}
+
+    def get_batches(self, key: Tuple, build: Callable[[], List[str]]) -> List[str]:
+        """按 key 读取分批结果，未命中时调用 build 生成"""
+        with self._lock:
+            batches = self._batches.get(key)
+        if batches is None:
+            batches = build()
+            with self._lock:
+                batches = self._batches.setdefault(key, batches)
+        return list(batches)
+
+    def format_title(
+        self, platform: str, position: Tuple, title_data: Dict, show_source: bool
+    ) -> str:
+        """按 (平台格式, 标题位置, 是否显示来源) 缓存 format_title_for_platform 的结果"""
+        key = (platform, position, show_source)
+        formatted = self._titles.get(key)
+        if formatted is None:
+            formatted = format_title_for_platform(
+                platform, title_data, show_source=show_source
+            )
+            self._titles[key] = formatted
+        return formatted
+
+
+def render_batches(
+    report_data: Dict,
+    format_type: str,
+    update_info: Optional[Dict],
+    batch_size: int,
+    mode: str = "daily",
+    header_format_type: Optional[str] = None,
+    batch_cache: Optional[ReportBatchCache] = None,
+) -> List[str]:
+    """生成某种推送格式的最终批次（预留并添加批次头部）
+
+    Args:
+        report_data: prepare_report_data 的结果
+        format_type: 内容格式（feishu, dingtalk, wework 等）
+        update_info: 版本更新信息
+        batch_size: 单批次的最大字节数（含批次头部）
+        mode: 报告模式
+        header_format_type: 批次头部格式，默认与 format_type 相同
+        batch_cache: 报告级渲染缓存，传入时相同参数只渲染一次
+
+    Returns:
+        添加头部后的批次列表
+    """
+    if header_format_type is None:
+        header_format_type = format_type
+
+    def build() -> List[str]:
+        # 预留批次头部空间，避免添加头部后超限
+        header_reserve = _get_max_batch_header_size(header_format_type)
+        batches = split_content_into_batches(
+            report_data,
+            format_type,
+            update_info,
+            max_bytes=batch_size - header_reserve,
+            mode=mode,
+            batch_cache=batch_cache,
+        )
+        # 统一添加批次头部（已预留空间，不会超限）
+        return add_batch_headers(batches, header_format_type, batch_size)
+
+    if batch_cache is None:
+        return build()
+    return batch_cache.get_batches(
+        (format_type, header_format_type, batch_size, mode), build
+    )
+
+
+def _utf8_len(text: str) -> int:
+    """文本的 UTF-8 字节数"""
+    return len(text.encode("utf-8"))
+
+
+class _BatchBuffer:
+    """分批时正在累积的批次：按片段保存内容并维护总字节数
+
+    追加片段只计算该片段的字节数，整体内容在批次完成时拼接一次，
+    分批的总耗时与消息总字节数成线性关系。
+    """
+
+    __slots__ = ("parts", "size")
+
+    def __init__(self, *fragments: str):
+        self.parts: List[str] = []
+        self.size = 0
+        for fragment in fragments:
+            self.add(fragment)
+
+    def add(self, fragment: str) -> None:
+        """无条件追加片段"""
+        self.parts.append(fragment)
+        self.size += _utf8_len(fragment)
+
+    def try_add(self, fragment: str, reserve: int, max_bytes: int) -> bool:
+        """追加后（加上预留的 reserve 字节）仍小于 max_bytes 时追加并返回 True"""
+        fragment_size = _utf8_len(fragment)
+        if self.size + fragment_size + reserve >= max_bytes:
+            return False
+        self.parts.append(fragment)
+        self.size += fragment_size
+        return True
+
+    def text(self) -> str:
+        """批次的完整内容"""
+        return "".join(self.parts)
+
+
 def split_content_into_batches(
     report_data: Dict,
     format_type: str,
     update_info: Optional[Dict] = None,
     max_bytes: int = None,
     mode: str = "daily",
+    batch_cache: Optional["ReportBatchCache"] = None,
 ) -> List[str]:
-    """分批处理消息内容，确保词组标题+至少第一条新闻的完整性"""
+    """分批处理消息内容，确保词组标题+至少第一条新闻的完整性
+
+    传入 batch_cache 时，同一报告中的标题行按 (平台格式, 位置) 只格式化一次，
+    供使用相同标题格式的渠道（如企业微信和 Bark）共用。
+    """
     if max_bytes is None:
         if format_type == "dingtalk":
             max_bytes = CONFIG.get("DINGTALK_BATCH_SIZE", 20000)
@@ -2022,6 +2866,13 @@ def split_content_into_batches(
         else:
             max_bytes = CONFIG.get("MESSAGE_BATCH_SIZE", 4000)
 
+    def render_title(
+        platform: str, position: Tuple, title_data: Dict, show_source: bool
+    ) -> str:
+        if batch_cache is None:
+            return format_title_for_platform(platform, title_data, show_source=show_source)
+        return batch_cache.format_title(platform, position, title_data, show_source)
+
     batches = []
 
     total_titles = sum(
@@ -2087,7 +2938,9 @@ def split_content_into_batches(
         elif format_type == "slack":
             stats_header = f"📊 *热点词汇统计*\n\n"
 
-    current_batch = base_header
+    # 批次内容按片段累积并记录字节数，判断是否超限时只需计算新片段的字节数
+    footer_size = _utf8_len(base_footer)
+    current_batch = _BatchBuffer(base_header)
     current_batch_has_content = False
 
     if (
@@ -2111,18 +2964,11 @@ def split_content_into_batches(
         total_count = len(report_data["stats"])
 
         # 添加统计标题
-        test_content = current_batch + stats_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
-            current_batch_has_content = True
-        else:
+        if not current_batch.try_add(stats_header, footer_size, max_bytes):
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + stats_header
-            current_batch_has_content = True
+                batches.append(current_batch.text() + base_footer)
+            current_batch = _BatchBuffer(base_header, stats_header)
+        current_batch_has_content = True
 
         # 逐个处理词组（确保词组标题+第一条新闻的原子性）
         for i, stat in enumerate(report_data["stats"]):
@@ -2196,28 +3042,28 @@ def split_content_into_batches(
             if stat["titles"]:
                 first_title_data = stat["titles"][0]
                 if format_type in ("wework", "bark"):
-                    formatted_title = format_title_for_platform(
-                        "wework", first_title_data, show_source=True
+                    formatted_title = render_title(
+                        "wework", ("stat", i, 0), first_title_data, True
                     )
                 elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", first_title_data, show_source=True
+                    formatted_title = render_title(
+                        "telegram", ("stat", i, 0), first_title_data, True
                     )
                 elif format_type == "ntfy":
-                    formatted_title = format_title_for_platform(
-                        "ntfy", first_title_data, show_source=True
+                    formatted_title = render_title(
+                        "ntfy", ("stat", i, 0), first_title_data, True
                     )
                 elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", first_title_data, show_source=True
+                    formatted_title = render_title(
+                        "feishu", ("stat", i, 0), first_title_data, True
                     )
                 elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", first_title_data, show_source=True
+                    formatted_title = render_title(
+                        "dingtalk", ("stat", i, 0), first_title_data, True
                     )
                 elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", first_title_data, show_source=True
+                    formatted_title = render_title(
+                        "slack", ("stat", i, 0), first_title_data, True
                     )
                 else:
                     formatted_title = f"{first_title_data['title']}"
@@ -2228,49 +3074,40 @@ def split_content_into_batches(
 
             # 原子性检查：词组标题+第一条新闻必须一起处理
             word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
+            if not current_batch.try_add(word_with_first_news, footer_size, max_bytes):
                 # 当前批次容纳不下，开启新批次
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + stats_header + word_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+                    batches.append(current_batch.text() + base_footer)
+                current_batch = _BatchBuffer(base_header, stats_header, word_with_first_news)
+            current_batch_has_content = True
+            start_index = 1
 
             # 处理剩余新闻条目
             for j in range(start_index, len(stat["titles"])):
                 title_data = stat["titles"][j]
                 if format_type in ("wework", "bark"):
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data, show_source=True
+                    formatted_title = render_title(
+                        "wework", ("stat", i, j), title_data, True
                     )
                 elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data, show_source=True
+                    formatted_title = render_title(
+                        "telegram", ("stat", i, j), title_data, True
                     )
                 elif format_type == "ntfy":
-                    formatted_title = format_title_for_platform(
-                        "ntfy", title_data, show_source=True
+                    formatted_title = render_title(
+                        "ntfy", ("stat", i, j), title_data, True
                     )
                 elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data, show_source=True
+                    formatted_title = render_title(
+                        "feishu", ("stat", i, j), title_data, True
                     )
                 elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data, show_source=True
+                    formatted_title = render_title(
+                        "dingtalk", ("stat", i, j), title_data, True
                     )
                 elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", title_data, show_source=True
+                    formatted_title = render_title(
+                        "slack", ("stat", i, j), title_data, True
                     )
                 else:
                     formatted_title = f"{title_data['title']}"
@@ -2279,18 +3116,11 @@ def split_content_into_batches(
                 if j < len(stat["titles"]) - 1:
                     news_line += "\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
+                if not current_batch.try_add(news_line, footer_size, max_bytes):
                     if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + stats_header + word_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+                        batches.append(current_batch.text() + base_footer)
+                    current_batch = _BatchBuffer(base_header, stats_header, word_header, news_line)
+                current_batch_has_content = True
 
             # 词组间分隔符
             if i < len(report_data["stats"]) - 1:
@@ -2308,12 +3138,7 @@ def split_content_into_batches(
                 elif format_type == "slack":
                     separator = f"\n\n"
 
-                test_content = current_batch + separator
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    < max_bytes
-                ):
-                    current_batch = test_content
+                current_batch.try_add(separator, footer_size, max_bytes)
 
     # 处理新增新闻（同样确保来源标题+第一条新闻的原子性）
     if report_data["new_titles"]:
@@ -2333,21 +3158,14 @@ def split_content_into_batches(
         elif format_type == "slack":
             new_header = f"\n\n🆕 *本次新增热点新闻* (共 {report_data['total_new_count']} 条)\n\n"
 
-        test_content = current_batch + new_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
+        if not current_batch.try_add(new_header, footer_size, max_bytes):
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+                batches.append(current_batch.text() + base_footer)
+            current_batch = _BatchBuffer(base_header, new_header)
+        current_batch_has_content = True
 
         # 逐个处理新增新闻来源
-        for source_data in report_data["new_titles"]:
+        for source_index, source_data in enumerate(report_data["new_titles"]):
             source_header = ""
             if format_type in ("wework", "bark"):
                 source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
@@ -2370,24 +3188,24 @@ def split_content_into_batches(
                 title_data_copy["is_new"] = False
 
                 if format_type in ("wework", "bark"):
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
+                    formatted_title = render_title(
+                        "wework", ("new", source_index, 0), title_data_copy, False
                     )
                 elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
+                    formatted_title = render_title(
+                        "telegram", ("new", source_index, 0), title_data_copy, False
                     )
                 elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
+                    formatted_title = render_title(
+                        "feishu", ("new", source_index, 0), title_data_copy, False
                     )
                 elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
+                    formatted_title = render_title(
+                        "dingtalk", ("new", source_index, 0), title_data_copy, False
                     )
                 elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", title_data_copy, show_source=False
+                    formatted_title = render_title(
+                        "slack", ("new", source_index, 0), title_data_copy, False
                     )
                 else:
                     formatted_title = f"{title_data_copy['title']}"
@@ -2396,21 +3214,12 @@ def split_content_into_batches(
 
             # 原子性检查：来源标题+第一条新闻
             source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
+            if not current_batch.try_add(source_with_first_news, footer_size, max_bytes):
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+                    batches.append(current_batch.text() + base_footer)
+                current_batch = _BatchBuffer(base_header, new_header, source_with_first_news)
+            current_batch_has_content = True
+            start_index = 1
 
             # 处理剩余新增新闻
             for j in range(start_index, len(source_data["titles"])):
@@ -2419,44 +3228,37 @@ def split_content_into_batches(
                 title_data_copy["is_new"] = False
 
                 if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
+                    formatted_title = render_title(
+                        "wework", ("new", source_index, j), title_data_copy, False
                     )
                 elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
+                    formatted_title = render_title(
+                        "telegram", ("new", source_index, j), title_data_copy, False
                     )
                 elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
+                    formatted_title = render_title(
+                        "feishu", ("new", source_index, j), title_data_copy, False
                     )
                 elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
+                    formatted_title = render_title(
+                        "dingtalk", ("new", source_index, j), title_data_copy, False
                     )
                 elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", title_data_copy, show_source=False
+                    formatted_title = render_title(
+                        "slack", ("new", source_index, j), title_data_copy, False
                     )
                 else:
                     formatted_title = f"{title_data_copy['title']}"
 
                 news_line = f"  {j + 1}. {formatted_title}\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
+                if not current_batch.try_add(news_line, footer_size, max_bytes):
                     if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + new_header + source_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+                        batches.append(current_batch.text() + base_footer)
+                    current_batch = _BatchBuffer(base_header, new_header, source_header, news_line)
+                current_batch_has_content = True
 
-            current_batch += "\n"
+            current_batch.add("\n")
 
     if report_data["failed_ids"]:
         failed_header = ""
@@ -2471,18 +3273,11 @@ def split_content_into_batches(
         elif format_type == "dingtalk":
             failed_header = f"\n---\n\n⚠️ **数据获取失败的平台：**\n\n"
 
-        test_content = current_batch + failed_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
+        if not current_batch.try_add(failed_header, footer_size, max_bytes):
             if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + failed_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+                batches.append(current_batch.text() + base_footer)
+            current_batch = _BatchBuffer(base_header, failed_header)
+        current_batch_has_content = True
 
         for i, id_value in enumerate(report_data["failed_ids"], 1):
             if format_type == "feishu":
@@ -2492,26 +3287,47 @@ def split_content_into_batches(
             else:
                 failed_line = f"  • {id_value}\n"
 
-            test_content = current_batch + failed_line
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
+            if not current_batch.try_add(failed_line, footer_size, max_bytes):
                 if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + failed_header + failed_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+                    batches.append(current_batch.text() + base_footer)
+                current_batch = _BatchBuffer(base_header, failed_header, failed_line)
+            current_batch_has_content = True
 
     # 完成最后批次
     if current_batch_has_content:
-        batches.append(current_batch + base_footer)
+        batches.append(current_batch.text() + base_footer)
 
     return batches
 
 
+def _run_notification_task(channel: str, send) -> bool:
+    """执行单个渠道的发送，异常只影响该渠道"""
+    try:
+        return send()
+    except Exception as e:
+        print(f"{channel} 通知发送出错：{e}")
+        return False
+
+
+def dispatch_notifications(tasks: List[Tuple[str, Callable[[], bool]]]) -> Dict[str, bool]:
+    """并发执行各渠道的发送任务，返回 {渠道: 是否成功}
+
+    每个渠道在独立线程中按顺序分批发送，批次间隔只约束本渠道，
+    总耗时取决于最慢的渠道而不是各渠道之和。结果按任务顺序排列。
+    """
+    if len(tasks) <= 1:
+        return {channel: _run_notification_task(channel, send) for channel, send in tasks}
+
+    with ThreadPoolExecutor(
+        max_workers=len(tasks), thread_name_prefix="notify"
+    ) as executor:
+        futures = [
+            (channel, executor.submit(_run_notification_task, channel, send))
+            for channel, send in tasks
+        ]
+        return {channel: future.result() for channel, future in futures}
+
+
 def send_to_notifications(
     stats: List[Dict],
     failed_ids: Optional[List] = None,
@@ -2523,7 +3339,7 @@ def send_to_notifications(
     mode: str = "daily",
     html_file_path: Optional[str] = None,
 ) -> Dict[str, bool]:
-    """发送数据到多个通知平台"""
+    """发送数据到多个通知平台（各渠道并发发送）"""
     results = {}
 
     if CONFIG["PUSH_WINDOW"]["ENABLED"]:
@@ -2546,6 +3362,8 @@ def send_to_notifications(
                 print(f"推送窗口控制：今天首次推送")
 
     report_data = prepare_report_data(stats, failed_ids, new_titles, id_to_name, mode)
+    # 各渠道共用的渲染缓存：相同格式的分批内容和标题行只生成一次
+    batch_cache = ReportBatchCache()
 
     feishu_url = CONFIG["FEISHU_WEBHOOK_URL"]
     dingtalk_url = CONFIG["DINGTALK_WEBHOOK_URL"]
@@ -2565,82 +3383,133 @@ def send_to_notifications(
 
     update_info_to_send = update_info if CONFIG["SHOW_VERSION_UPDATE"] else None
 
+    # 按渠道收集发送任务，各渠道在自己的线程内按顺序分批发送
+    tasks = []
+
     # 发送到飞书
     if feishu_url:
-        results["feishu"] = send_to_feishu(
-            feishu_url, report_data, report_type, update_info_to_send, proxy_url, mode
-        )
+        tasks.append((
+            "feishu",
+            lambda: send_to_feishu(
+                feishu_url,
+                report_data,
+                report_type,
+                update_info_to_send,
+                proxy_url,
+                mode,
+                batch_cache=batch_cache,
+            ),
+        ))
 
     # 发送到钉钉
     if dingtalk_url:
-        results["dingtalk"] = send_to_dingtalk(
-            dingtalk_url, report_data, report_type, update_info_to_send, proxy_url, mode
-        )
+        tasks.append((
+            "dingtalk",
+            lambda: send_to_dingtalk(
+                dingtalk_url,
+                report_data,
+                report_type,
+                update_info_to_send,
+                proxy_url,
+                mode,
+                batch_cache=batch_cache,
+            ),
+        ))
 
     # 发送到企业微信
     if wework_url:
-        results["wework"] = send_to_wework(
-            wework_url, report_data, report_type, update_info_to_send, proxy_url, mode
-        )
+        tasks.append((
+            "wework",
+            lambda: send_to_wework(
+                wework_url,
+                report_data,
+                report_type,
+                update_info_to_send,
+                proxy_url,
+                mode,
+                batch_cache=batch_cache,
+            ),
+        ))
 
     # 发送到 Telegram
     if telegram_token and telegram_chat_id:
-        results["telegram"] = send_to_telegram(
-            telegram_token,
-            telegram_chat_id,
-            report_data,
-            report_type,
-            update_info_to_send,
-            proxy_url,
-            mode,
-        )
+        tasks.append((
+            "telegram",
+            lambda: send_to_telegram(
+                telegram_token,
+                telegram_chat_id,
+                report_data,
+                report_type,
+                update_info_to_send,
+                proxy_url,
+                mode,
+                batch_cache=batch_cache,
+            ),
+        ))
 
     # 发送到 ntfy
     if ntfy_server_url and ntfy_topic:
-        results["ntfy"] = send_to_ntfy(
-            ntfy_server_url,
-            ntfy_topic,
-            ntfy_token,
-            report_data,
-            report_type,
-            update_info_to_send,
-            proxy_url,
-            mode,
-        )
+        tasks.append((
+            "ntfy",
+            lambda: send_to_ntfy(
+                ntfy_server_url,
+                ntfy_topic,
+                ntfy_token,
+                report_data,
+                report_type,
+                update_info_to_send,
+                proxy_url,
+                mode,
+                batch_cache=batch_cache,
+            ),
+        ))
 
     # 发送到 Bark
     if bark_url:
-        results["bark"] = send_to_bark(
-            bark_url,
-            report_data,
-            report_type,
-            update_info_to_send,
-            proxy_url,
-            mode,
-        )
+        tasks.append((
+            "bark",
+            lambda: send_to_bark(
+                bark_url,
+                report_data,
+                report_type,
+                update_info_to_send,
+                proxy_url,
+                mode,
+                batch_cache=batch_cache,
+            ),
+        ))
 
     # 发送到 Slack
     if slack_webhook_url:
-        results["slack"] = send_to_slack(
-            slack_webhook_url,
-            report_data,
-            report_type,
-            update_info_to_send,
-            proxy_url,
-            mode,
-        )
+        tasks.append((
+            "slack",
+            lambda: send_to_slack(
+                slack_webhook_url,
+                report_data,
+                report_type,
+                update_info_to_send,
+                proxy_url,
+                mode,
+                batch_cache=batch_cache,
+            ),
+        ))
 
     # 发送邮件
     if email_from and email_password and email_to:
-        results["email"] = send_to_email(
-            email_from,
-            email_password,
-            email_to,
-            report_type,
-            html_file_path,
-            email_smtp_server,
-            email_smtp_port,
-        )
+        tasks.append((
+            "email",
+            lambda: send_to_email(
+                email_from,
+                email_password,
+                email_to,
+                report_type,
+                html_file_path,
+                email_smtp_server,
+                email_smtp_port,
+            ),
+        ))
+
+    results = dispatch_notifications(tasks)
 
     if not results:
         print("未配置任何通知渠道，跳过通知发送")
@@ -2664,30 +3533,30 @@ def send_to_feishu(
     update_info: Optional[Dict] = None,
     proxy_url: Optional[str] = None,
     mode: str = "daily",
+    batch_cache: Optional[ReportBatchCache] = None,
 ) -> bool:
     """发送到飞书（支持分批发送）"""
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    session = get_http_session(proxy_url)
+    proxies = get_request_proxies(proxy_url)
 
-    # 获取分批内容，使用飞书专用的批次大小
+    # 获取分批内容，使用飞书专用的批次大小（已预留并添加批次头部）
     feishu_batch_size = CONFIG.get("FEISHU_BATCH_SIZE", 29000)
-    # 预留批次头部空间，避免添加头部后超限
-    header_reserve = _get_max_batch_header_size("feishu")
-    batches = split_content_into_batches(
+    batches = render_batches(
         report_data,
         "feishu",
         update_info,
-        max_bytes=feishu_batch_size - header_reserve,
-        mode=mode,
+        feishu_batch_size,
+        mode,
+        batch_cache=batch_cache,
     )
 
-    # 统一添加批次头部（已预留空间，不会超限）
-    batches = add_batch_headers(batches, "feishu", feishu_batch_size)
-
     print(f"飞书消息分为 {len(batches)} 批次发送 [{report_type}]")
 
+    total_titles = sum(
+        len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
+    )
+
     # 逐批发送
     for i, batch_content in enumerate(batches, 1):
         batch_size = len(batch_content.encode("utf-8"))
@@ -2695,9 +3564,6 @@ def send_to_feishu(
             f"发送飞书第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
         )
 
-        total_titles = sum(
-            len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
-        )
         now = get_beijing_time()
 
         payload = {
@@ -2711,7 +3577,7 @@ def send_to_feishu(
         }
 
         try:
-            response = requests.post(
+            response = session.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
@@ -2748,28 +3614,24 @@ def send_to_dingtalk(
     update_info: Optional[Dict] = None,
     proxy_url: Optional[str] = None,
     mode: str = "daily",
+    batch_cache: Optional[ReportBatchCache] = None,
 ) -> bool:
     """发送到钉钉（支持分批发送）"""
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    session = get_http_session(proxy_url)
+    proxies = get_request_proxies(proxy_url)
 
-    # 获取分批内容，使用钉钉专用的批次大小
+    # 获取分批内容，使用钉钉专用的批次大小（已预留并添加批次头部）
     dingtalk_batch_size = CONFIG.get("DINGTALK_BATCH_SIZE", 20000)
-    # 预留批次头部空间，避免添加头部后超限
-    header_reserve = _get_max_batch_header_size("dingtalk")
-    batches = split_content_into_batches(
+    batches = render_batches(
         report_data,
         "dingtalk",
         update_info,
-        max_bytes=dingtalk_batch_size - header_reserve,
-        mode=mode,
+        dingtalk_batch_size,
+        mode,
+        batch_cache=batch_cache,
     )
 
-    # 统一添加批次头部（已预留空间，不会超限）
-    batches = add_batch_headers(batches, "dingtalk", dingtalk_batch_size)
-
     print(f"钉钉消息分为 {len(batches)} 批次发送 [{report_type}]")
 
     # 逐批发送
@@ -2788,7 +3650,7 @@ def send_to_dingtalk(
         }
 
         try:
-            response = requests.post(
+            response = session.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
@@ -2867,12 +3729,12 @@ def send_to_wework(
     update_info: Optional[Dict] = None,
     proxy_url: Optional[str] = None,
     mode: str = "daily",
+    batch_cache: Optional[ReportBatchCache] = None,
 ) -> bool:
     """发送到企业微信（支持分批发送，支持 markdown 和 text 两种格式）"""
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    session = get_http_session(proxy_url)
+    proxies = get_request_proxies(proxy_url)
 
     # 获取消息类型配置（markdown 或 text）
     msg_type = CONFIG.get("WEWORK_MSG_TYPE", "markdown").lower()
@@ -2886,16 +3748,18 @@ def send_to_wework(
     # text 模式使用 wework_text，markdown 模式使用 wework
     header_format_type = "wework_text" if is_text_mode else "wework"
 
-    # 获取分批内容，预留批次头部空间
+    # 获取分批内容（已预留并添加批次头部）
     wework_batch_size = CONFIG.get("MESSAGE_BATCH_SIZE", 4000)
-    header_reserve = _get_max_batch_header_size(header_format_type)
-    batches = split_content_into_batches(
-        report_data, "wework", update_info, max_bytes=wework_batch_size - header_reserve, mode=mode
+    batches = render_batches(
+        report_data,
+        "wework",
+        update_info,
+        wework_batch_size,
+        mode,
+        header_format_type=header_format_type,
+        batch_cache=batch_cache,
     )
 
-    # 统一添加批次头部（已预留空间，不会超限）
-    batches = add_batch_headers(batches, header_format_type, wework_batch_size)
-
     print(f"企业微信消息分为 {len(batches)} 批次发送 [{report_type}]")
 
     # 逐批发送
@@ -2916,7 +3780,7 @@ def send_to_wework(
         )
 
         try:
-            response = requests.post(
+            response = session.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
@@ -2952,25 +3816,26 @@ def send_to_telegram(
     update_info: Optional[Dict] = None,
     proxy_url: Optional[str] = None,
     mode: str = "daily",
+    batch_cache: Optional[ReportBatchCache] = None,
 ) -> bool:
     """发送到Telegram（支持分批发送）"""
     headers = {"Content-Type": "application/json"}
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    session = get_http_session(proxy_url)
+    proxies = get_request_proxies(proxy_url)
 
-    # 获取分批内容，预留批次头部空间
+    # 获取分批内容（已预留并添加批次头部）
     telegram_batch_size = CONFIG.get("MESSAGE_BATCH_SIZE", 4000)
-    header_reserve = _get_max_batch_header_size("telegram")
-    batches = split_content_into_batches(
-        report_data, "telegram", update_info, max_bytes=telegram_batch_size - header_reserve, mode=mode
+    batches = render_batches(
+        report_data,
+        "telegram",
+        update_info,
+        telegram_batch_size,
+        mode,
+        batch_cache=batch_cache,
     )
 
-    # 统一添加批次头部（已预留空间，不会超限）
-    batches = add_batch_headers(batches, "telegram", telegram_batch_size)
-
     print(f"Telegram消息分为 {len(batches)} 批次发送 [{report_type}]")
 
     # 逐批发送
@@ -2988,7 +3853,7 @@ def send_to_telegram(
         }
 
         try:
-            response = requests.post(
+            response = session.post(
                 url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
@@ -3165,6 +4030,7 @@ def send_to_ntfy(
     update_info: Optional[Dict] = None,
     proxy_url: Optional[str] = None,
     mode: str = "daily",
+    batch_cache: Optional[ReportBatchCache] = None,
 ) -> bool:
     """发送到ntfy（支持分批发送，严格遵守4KB限制）"""
     # 避免 HTTP header 编码问题
@@ -3194,20 +4060,20 @@ def send_to_ntfy(
         base_url = f"https://{base_url}"
     url = f"{base_url}/{topic}"
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    session = get_http_session(proxy_url)
+    proxies = get_request_proxies(proxy_url)
 
-    # 获取分批内容，使用ntfy专用的4KB限制，预留批次头部空间
+    # 获取分批内容，使用ntfy专用的4KB限制（已预留并添加批次头部）
     ntfy_batch_size = 3800
-    header_reserve = _get_max_batch_header_size("ntfy")
-    batches = split_content_into_batches(
-        report_data, "ntfy", update_info, max_bytes=ntfy_batch_size - header_reserve, mode=mode
+    batches = render_batches(
+        report_data,
+        "ntfy",
+        update_info,
+        ntfy_batch_size,
+        mode,
+        batch_cache=batch_cache,
     )
 
-    # 统一添加批次头部（已预留空间，不会超限）
-    batches = add_batch_headers(batches, "ntfy", ntfy_batch_size)
-
     total_batches = len(batches)
     print(f"ntfy消息分为 {total_batches} 批次发送 [{report_type}]")
 
@@ -3240,7 +4106,7 @@ def send_to_ntfy(
             )
 
         try:
-            response = requests.post(
+            response = session.post(
                 url,
                 headers=current_headers,
                 data=batch_content.encode("utf-8"),
@@ -3261,7 +4127,7 @@ def send_to_ntfy(
                 )
                 time.sleep(10)  # 等待10秒后重试
                 # 重试一次
-                retry_response = requests.post(
+                retry_response = session.post(
                     url,
                     headers=current_headers,
                     data=batch_content.encode("utf-8"),
@@ -3316,11 +4182,11 @@ def send_to_bark(
     update_info: Optional[Dict] = None,
     proxy_url: Optional[str] = None,
     mode: str = "daily",
+    batch_cache: Optional[ReportBatchCache] = None,
 ) -> bool:
     """发送到Bark（支持分批发送，使用 markdown 格式）"""
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    session = get_http_session(proxy_url)
+    proxies = get_request_proxies(proxy_url)
 
     # 解析 Bark URL，提取 device_key 和 API 端点
     # Bark URL 格式: https://api.day.app/device_key 或 https://bark.day.app/device_key
@@ -3336,16 +4202,17 @@ def send_to_bark(
     # 构建正确的 API 端点
     api_endpoint = f"{parsed_url.scheme}://{parsed_url.netloc}/push"
 
-    # 获取分批内容（Bark 限制为 3600 字节以避免 413 错误），预留批次头部空间
+    # 获取分批内容（Bark 限制为 3600 字节以避免 413 错误，已预留并添加批次头部）
     bark_batch_size = CONFIG["BARK_BATCH_SIZE"]
-    header_reserve = _get_max_batch_header_size("bark")
-    batches = split_content_into_batches(
-        report_data, "bark", update_info, max_bytes=bark_batch_size - header_reserve, mode=mode
+    batches = render_batches(
+        report_data,
+        "bark",
+        update_info,
+        bark_batch_size,
+        mode,
+        batch_cache=batch_cache,
     )
 
-    # 统一添加批次头部（已预留空间，不会超限）
-    batches = add_batch_headers(batches, "bark", bark_batch_size)
-
     total_batches = len(batches)
     print(f"Bark消息分为 {total_batches} 批次发送 [{report_type}]")
 
@@ -3383,7 +4250,7 @@ def send_to_bark(
         }
 
         try:
-            response = requests.post(
+            response = session.post(
                 api_endpoint,
                 json=payload,
                 proxies=proxies,
@@ -3457,23 +4324,24 @@ def send_to_slack(
     update_info: Optional[Dict] = None,
     proxy_url: Optional[str] = None,
     mode: str = "daily",
+    batch_cache: Optional[ReportBatchCache] = None,
 ) -> bool:
     """发送到Slack（支持分批发送，使用 mrkdwn 格式）"""
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
+    session = get_http_session(proxy_url)
+    proxies = get_request_proxies(proxy_url)
 
-    # 获取分批内容（使用 Slack 批次大小），预留批次头部空间
+    # 获取分批内容（使用 Slack 批次大小，已预留并添加批次头部）
     slack_batch_size = CONFIG["SLACK_BATCH_SIZE"]
-    header_reserve = _get_max_batch_header_size("slack")
-    batches = split_content_into_batches(
-        report_data, "slack", update_info, max_bytes=slack_batch_size - header_reserve, mode=mode
+    batches = render_batches(
+        report_data,
+        "slack",
+        update_info,
+        slack_batch_size,
+        mode,
+        batch_cache=batch_cache,
     )
 
-    # 统一添加批次头部（已预留空间，不会超限）
-    batches = add_batch_headers(batches, "slack", slack_batch_size)
-
     print(f"Slack消息分为 {len(batches)} 批次发送 [{report_type}]")
 
     # 逐批发送
@@ -3492,7 +4360,7 @@ def send_to_slack(
         }
 
         try:
-            response = requests.post(
+            response = session.post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
 
@@ -3551,20 +4419,26 @@ class NewsAnalyzer:
         },
     }
 
-    def __init__(self):
-        self.request_interval = CONFIG["REQUEST_INTERVAL"]
-        self.report_mode = CONFIG["REPORT_MODE"]
-        self.rank_threshold = CONFIG["RANK_THRESHOLD"]
+    def __init__(self, daemon: bool = False):
         self.is_github_actions = os.environ.get("GITHUB_ACTIONS") == "true"
         self.is_docker_container = self._detect_docker_environment()
+        self.is_daemon = daemon
         self.update_info = None
-        self.proxy_url = None
-        self._setup_proxy()
-        self.data_fetcher = DataFetcher(self.proxy_url)
+        self.current_time_info = None
+        self.apply_config()
 
         if self.is_github_actions:
             self._check_version_update()
 
+    def apply_config(self) -> None:
+        """按当前 CONFIG 设置运行参数（常驻模式下配置重新加载后调用）"""
+        self.request_interval = CONFIG["REQUEST_INTERVAL"]
+        self.report_mode = CONFIG["REPORT_MODE"]
+        self.rank_threshold = CONFIG["RANK_THRESHOLD"]
+        self.proxy_url = None
+        self._setup_proxy()
+        self.data_fetcher = DataFetcher(self.proxy_url)
+
     def _detect_docker_environment(self) -> bool:
         """检测是否运行在 Docker 容器中"""
         try:
@@ -3580,7 +4454,11 @@ class NewsAnalyzer:
 
     def _should_open_browser(self) -> bool:
         """判断是否应该打开浏览器"""
-        return not self.is_github_actions and not self.is_docker_container
+        return (
+            not self.is_github_actions
+            and not self.is_docker_container
+            and not self.is_daemon
+        )
 
     def _setup_proxy(self) -> None:
         """设置代理配置"""
@@ -3905,15 +4783,81 @@ class NewsAnalyzer:
         print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒")
         ensure_directory_exists("output")
 
-        results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
-            ids, self.request_interval
-        )
+        scheduler = get_crawl_scheduler()
+        if scheduler:
+            results, id_to_name, failed_ids = self._crawl_adaptive(scheduler, ids)
+        else:
+            results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
+                ids, self.request_interval
+            )
 
-        title_file = save_titles_to_file(results, id_to_name, failed_ids)
+        self.current_time_info = format_time_filename()
+        title_file = save_titles_to_file(
+            results, id_to_name, failed_ids, self.current_time_info
+        )
         print(f"标题已保存到: {title_file}")
 
+        # 将本次快照合并进当日聚合状态、已见标题索引和历史库
+        snapshots = list_today_snapshots()
+        sync_title_state()
+        sync_seen_title_index(snapshots)
+        # GitHub Actions 每次都是全新检出，历史库不提交到仓库，写入只会白白重建全部往日数据
+        if CONFIG["HISTORY_DB"] and not self.is_github_actions:
+            sync_history_store(snapshots)
+            backfill_history_store()
+
         return results, id_to_name, failed_ids
 
+    def _crawl_adaptive(
+        self, scheduler: AdaptiveCrawlScheduler, ids: List
+    ) -> Tuple[Dict, Dict, List]:
+        """按各平台的抓取间隔爬取，未到时间的平台沿用当天最新快照的内容"""
+        now = time.time()
+        due_ids, latest_titles = plan_adaptive_crawl(scheduler, ids, now)
+
+        skipped = [id_info for id_info in ids if id_info not in due_ids]
+        if skipped:
+            print(
+                f"自适应抓取：本次抓取 {len(due_ids)} 个平台，"
+                f"{len(skipped)} 个平台未到抓取时间，沿用上次内容"
+            )
+
+        results, id_to_name, failed_ids = {}, {}, []
+        if due_ids:
+            results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
+                due_ids, self.request_interval
+            )
+
+        for platform_id, titles in results.items():
+            new_ratio = None
+            if platform_id in latest_titles:
+                new_ratio = new_title_ratio(
+                    latest_titles[platform_id], (clean_title(title) for title in titles)
+                )
+            scheduler.record_crawl(platform_id, now, new_ratio)
+        scheduler.save()
+
+        # 按配置顺序合并，保持快照中的平台顺序不变
+        merged_results = {}
+        for id_info in ids:
+            if isinstance(id_info, tuple):
+                platform_id, name = id_info
+            else:
+                platform_id = name = id_info
+            if platform_id in results:
+                merged_results[platform_id] = results[platform_id]
+            elif id_info in skipped:
+                merged_results[platform_id] = latest_titles[platform_id]
+                id_to_name[platform_id] = name
+
+        for id_info in skipped:
+            platform_id = id_info[0] if isinstance(id_info, tuple) else id_info
+            print(
+                f"  {platform_id}: 抓取间隔 {scheduler.get_interval(platform_id):.0f} 分钟"
+            )
+
+        return merged_results, id_to_name, failed_ids
+
     def _execute_mode_strategy(
         self, mode_strategy: Dict, results: Dict, id_to_name: Dict, failed_ids: List
     ) -> Optional[str]:
@@ -3922,7 +4866,7 @@ class NewsAnalyzer:
         current_platform_ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
 
         new_titles = detect_latest_new_titles(current_platform_ids)
-        time_info = Path(save_titles_to_file(results, id_to_name, failed_ids)).stem
+        time_info = self.current_time_info
         word_groups, filter_words = load_frequency_words()
 
         # current模式下，实时推送需要使用完整的历史数据来保证统计信息的完整性
@@ -3973,6 +4917,10 @@ class NewsAnalyzer:
             else:
                 print("❌ 严重错误：无法读取刚保存的数据文件")
                 raise RuntimeError("数据一致性检查失败：保存后立即读取失败")
+        elif self.report_mode == "incremental" and get_snapshot_changes(time_info) == []:
+            # 增量模式只分析新增新闻，各平台内容都与上次快照相同时不会有新增
+            print("各平台内容与上次快照相同，无新增新闻，跳过实时分析")
+            html_file = None
         else:
             title_info = self._prepare_current_title_info(results, time_info)
             stats, html_file = self._run_analysis_pipeline(
@@ -4046,8 +4994,92 @@ class NewsAnalyzer:
             raise
 
 
+def _wait_until(next_run: datetime, stop_event: threading.Event) -> bool:
+    """等待到指定时间，收到停止信号时提前返回 False
+
+    分段等待，系统时间调整后按新的时间重新计算剩余时长。
+    """
+    while not stop_event.is_set():
+        remaining = (next_run - datetime.now()).total_seconds()
+        if remaining <= 0:
+            return True
+        stop_event.wait(min(remaining, 60))
+    return False
+
+
+def run_daemon(schedule: str, run_immediately: bool = False) -> None:
+    """常驻运行，按 cron 表达式定时执行分析流程
+
+    与每次由 cron 冷启动相比，配置、已编译的频率词匹配器、HTTP 连接池、
+    快照库和历史库连接以及当日聚合状态都保留在进程内；每轮执行前检查
+    配置文件，变化时重新加载。单轮出错只记录日志，不影响后续执行。
+    收到 SIGTERM/SIGINT 时等当前一轮结束后退出。
+    """
+    cron = CronSchedule(schedule)
+    stop_event = threading.Event()
+
+    def handle_stop(signum, frame):
+        print(f"收到停止信号 {signum}，当前任务结束后退出")
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, handle_stop)
+    signal.signal(signal.SIGINT, handle_stop)
+
+    analyzer = NewsAnalyzer(daemon=True)
+    print(f"常驻模式已启动，执行计划: {schedule}")
+
+    def run_cycle():
+        if reload_config_if_changed():
+            analyzer.apply_config()
+        started = time.monotonic()
+        try:
+            analyzer.run()
+        except Exception as e:
+            print(f"❌ 本轮执行失败: {e}")
+        print(f"本轮执行耗时 {time.monotonic() - started:.1f} 秒")
+
+    if run_immediately:
+        run_cycle()
+
+    while not stop_event.is_set():
+        next_run = cron.next_after(datetime.now())
+        print(f"下次执行时间: {next_run.strftime('%Y-%m-%d %H:%M')}")
+        if not _wait_until(next_run, stop_event):
+            break
+        run_cycle()
+
+    print("常驻模式已退出")
+
+
+def parse_args() -> argparse.Namespace:
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description=f"TrendRadar v{VERSION}")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="常驻运行，按 --schedule 定时执行（默认只执行一次）",
+    )
+    parser.add_argument(
+        "--schedule",
+        default=os.environ.get("CRON_SCHEDULE", "").strip() or "*/30 * * * *",
+        help="常驻模式的 cron 表达式（默认读取 CRON_SCHEDULE 环境变量）",
+    )
+    parser.add_argument(
+        "--run-now",
+        action="store_true",
+        default=os.environ.get("IMMEDIATE_RUN", "").strip().lower() in ("true", "1"),
+        help="常驻模式启动后立即执行一次（默认读取 IMMEDIATE_RUN 环境变量）",
+    )
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
     try:
+        if args.daemon:
+            run_daemon(args.schedule, args.run_now)
+            return
+
         analyzer = NewsAnalyzer()
         analyzer.run()
     except FileNotFoundError as e:
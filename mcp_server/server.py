@@ -5,8 +5,11 @@ TrendRadar MCP Server - FastMCP 2.0 实现
 支持 stdio 和 HTTP 两种传输模式。
 """
 
+import asyncio
 import json
-from typing import List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, List, Optional, Dict
 
 from fastmcp import FastMCP
 
@@ -16,7 +19,7 @@ from .tools.search_tools import SearchTools
 from .tools.config_mgmt import ConfigManagementTools
 from .tools.system import SystemManagementTools
 from .utils.date_parser import DateParser
-from .utils.errors import MCPError
+from .utils.errors import MCPError, ToolTimeoutError
 
 
 # 创建 FastMCP 2.0 应用
@@ -37,6 +40,98 @@ def _get_tools(project_root: Optional[str] = None):
     return _tools_instances
 
 
+# ==================== 工具执行线程池 ====================
+
+# 工具函数是同步的文件解析和分析代码，放到线程池执行，避免阻塞事件循环
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_TOOL_TIMEOUT = 120
+
+# 单独设置超时的工具（秒），其余工具使用 DEFAULT_TOOL_TIMEOUT
+TOOL_TIMEOUTS = {
+    'analyze_topic_trend': 180,
+    'analyze_data_insights': 180,
+    'analyze_sentiment': 180,
+    'generate_summary_report': 180,
+    'search_related_news_history': 180,
+    'trigger_crawl': 300,
+}
+
+_executor_settings = {
+    'max_workers': DEFAULT_MAX_WORKERS,
+    'tool_timeout': None,
+}
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def configure_executor(
+    max_workers: Optional[int] = None,
+    tool_timeout: Optional[float] = None
+):
+    """
+    设置工具执行线程池（需在第一次调用工具前设置）
+
+    Args:
+        max_workers: 同时执行的工具数上限，超出的请求排队等待
+        tool_timeout: 统一的工具超时（秒），设置后覆盖 TOOL_TIMEOUTS，0 表示不限时
+    """
+    if max_workers is not None:
+        _executor_settings['max_workers'] = max(1, max_workers)
+    if tool_timeout is not None:
+        _executor_settings['tool_timeout'] = tool_timeout
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """获取或创建工具执行线程池"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=_executor_settings['max_workers'],
+            thread_name_prefix='mcp-tool'
+        )
+    return _executor
+
+
+def _get_tool_timeout(tool_name: str) -> Optional[float]:
+    """工具的超时时间（秒），None 表示不限时"""
+    timeout = _executor_settings['tool_timeout']
+    if timeout is None:
+        timeout = TOOL_TIMEOUTS.get(tool_name, DEFAULT_TOOL_TIMEOUT)
+    return timeout if timeout > 0 else None
+
+
+def _call_tool(func: Callable[..., Dict], kwargs: Dict[str, Any]) -> str:
+    """在工作线程中执行工具并序列化结果"""
+    result = func(**kwargs)
+    return json.dumps(result, ensure_ascii=False, indent=2)
+
+
+async def _run_tool(tool_name: str, func: Callable[..., Dict], **kwargs) -> str:
+    """
+    在线程池中执行工具，超时返回 TOOL_TIMEOUT 错误
+
+    客户端取消请求或超时时，尚在排队的任务直接丢弃；已开始执行的任务无法中断，
+    会在后台执行完毕，其结果被忽略。
+
+    Args:
+        tool_name: 工具名称（用于查找超时设置）
+        func: 同步的工具方法
+        **kwargs: 工具参数
+
+    Returns:
+        JSON格式的工具结果
+    """
+    loop = asyncio.get_running_loop()
+    timeout = _get_tool_timeout(tool_name)
+    future = loop.run_in_executor(_get_executor(), partial(_call_tool, func, kwargs))
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except asyncio.TimeoutError:
+        return json.dumps({
+            "success": False,
+            "error": ToolTimeoutError(tool_name, timeout).to_dict()
+        }, ensure_ascii=False, indent=2)
+
+
 # ==================== 日期解析工具（优先调用）====================
 
 @mcp.tool
@@ -144,8 +239,13 @@ async def get_latest_news(
     **注意**：如果用户询问"为什么只显示了部分"，说明他们需要完整数据
     """
     tools = _get_tools()
-    result = tools['data'].get_latest_news(platforms=platforms, limit=limit, include_url=include_url)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_tool(
+        'get_latest_news',
+        tools['data'].get_latest_news,
+        platforms=platforms,
+        limit=limit,
+        include_url=include_url
+    )
 
 
 @mcp.tool
@@ -169,8 +269,12 @@ async def get_trending_topics(
         JSON格式的关注词频率统计列表
     """
     tools = _get_tools()
-    result = tools['data'].get_trending_topics(top_n=top_n, mode=mode)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_tool(
+        'get_trending_topics',
+        tools['data'].get_trending_topics,
+        top_n=top_n,
+        mode=mode
+    )
 
 
 @mcp.tool
@@ -212,13 +316,14 @@ async def get_news_by_date(
     **注意**：如果用户询问"为什么只显示了部分"，说明他们需要完整数据
     """
     tools = _get_tools()
-    result = tools['data'].get_news_by_date(
+    return await _run_tool(
+        'get_news_by_date',
+        tools['data'].get_news_by_date,
         date_query=date_query,
         platforms=platforms,
         limit=limit,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 
@@ -275,7 +380,9 @@ async def analyze_topic_trend(
         2. analyze_topic_trend(topic="特斯拉", analysis_type="lifecycle", date_range=...)
     """
     tools = _get_tools()
-    result = tools['analytics'].analyze_topic_trend_unified(
+    return await _run_tool(
+        'analyze_topic_trend',
+        tools['analytics'].analyze_topic_trend_unified,
         topic=topic,
         analysis_type=analysis_type,
         date_range=date_range,
@@ -285,7 +392,6 @@ async def analyze_topic_trend(
         lookahead_hours=lookahead_hours,
         confidence_threshold=confidence_threshold
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 @mcp.tool
@@ -321,14 +427,15 @@ async def analyze_data_insights(
         - analyze_data_insights(insight_type="keyword_cooccur", min_frequency=5, top_n=15)
     """
     tools = _get_tools()
-    result = tools['analytics'].analyze_data_insights_unified(
+    return await _run_tool(
+        'analyze_data_insights',
+        tools['analytics'].analyze_data_insights_unified,
         insight_type=insight_type,
         topic=topic,
         date_range=date_range,
         min_frequency=min_frequency,
         top_n=top_n
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 @mcp.tool
@@ -384,7 +491,9 @@ async def analyze_sentiment(
     - 仅在用户明确要求"总结"或"挑重点"时才进行筛选
     """
     tools = _get_tools()
-    result = tools['analytics'].analyze_sentiment(
+    return await _run_tool(
+        'analyze_sentiment',
+        tools['analytics'].analyze_sentiment,
         topic=topic,
         platforms=platforms,
         date_range=date_range,
@@ -392,7 +501,6 @@ async def analyze_sentiment(
         sort_by_weight=sort_by_weight,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 @mcp.tool
@@ -422,13 +530,14 @@ async def find_similar_news(
     - 仅在用户明确要求"总结"或"挑重点"时才进行筛选
     """
     tools = _get_tools()
-    result = tools['analytics'].find_similar_news(
+    return await _run_tool(
+        'find_similar_news',
+        tools['analytics'].find_similar_news,
         reference_title=reference_title,
         threshold=threshold,
         limit=limit,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 @mcp.tool
@@ -450,11 +559,12 @@ async def generate_summary_report(
         JSON格式的摘要报告，包含Markdown格式内容
     """
     tools = _get_tools()
-    result = tools['analytics'].generate_summary_report(
+    return await _run_tool(
+        'generate_summary_report',
+        tools['analytics'].generate_summary_report,
         report_type=report_type,
         date_range=date_range
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 # ==================== 智能检索工具 ====================
@@ -525,7 +635,9 @@ async def search_news(
     - 仅在用户明确要求"总结"或"挑重点"时才进行筛选
     """
     tools = _get_tools()
-    result = tools['search'].search_news_unified(
+    return await _run_tool(
+        'search_news',
+        tools['search'].search_news_unified,
         query=query,
         search_mode=search_mode,
         date_range=date_range,
@@ -535,7 +647,6 @@ async def search_news(
         threshold=threshold,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 @mcp.tool
@@ -572,14 +683,15 @@ async def search_related_news_history(
     - 仅在用户明确要求"总结"或"挑重点"时才进行筛选
     """
     tools = _get_tools()
-    result = tools['search'].search_related_news_history(
+    return await _run_tool(
+        'search_related_news_history',
+        tools['search'].search_related_news_history,
         reference_text=reference_text,
         time_preset=time_preset,
         threshold=threshold,
         limit=limit,
         include_url=include_url
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
 
 # ==================== 配置与系统管理工具 ====================
@@ -603,8 +715,11 @@ async def get_current_config(
         JSON格式的配置信息
     """
     tools = _get_tools()
-    result = tools['config'].get_current_config(section=section)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_tool(
+        'get_current_config',
+        tools['config'].get_current_config,
+        section=section
+    )
 
 
 @mcp.tool
@@ -618,8 +733,10 @@ async def get_system_status() -> str:
         JSON格式的系统状态信息
     """
     tools = _get_tools()
-    result = tools['system'].get_system_status()
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_tool(
+        'get_system_status',
+        tools['system'].get_system_status
+    )
 
 
 @mcp.tool
@@ -653,8 +770,13 @@ async def trigger_crawl(
         - 使用默认平台: trigger_crawl()  # 爬取config.yaml中配置的所有平台
     """
     tools = _get_tools()
-    result = tools['system'].trigger_crawl(platforms=platforms, save_to_local=save_to_local, include_url=include_url)
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return await _run_tool(
+        'trigger_crawl',
+        tools['system'].trigger_crawl,
+        platforms=platforms,
+        save_to_local=save_to_local,
+        include_url=include_url
+    )
 
 
 # ==================== 启动入口 ====================
@@ -663,7 +785,9 @@ def run_server(
     project_root: Optional[str] = None,
     transport: str = 'stdio',
     host: str = '0.0.0.0',
-    port: int = 3333
+    port: int = 3333,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    tool_timeout: Optional[float] = None
 ):
     """
     启动 MCP 服务器
@@ -673,9 +797,12 @@ def run_server(
         transport: 传输模式，'stdio' 或 'http'
         host: HTTP模式的监听地址，默认 0.0.0.0
         port: HTTP模式的监听端口，默认 3333
+        max_workers: 同时执行的工具数上限，默认 4
+        tool_timeout: 统一的工具超时（秒），默认按 TOOL_TIMEOUTS，0 表示不限时
     """
-    # 初始化工具实例
+    # 初始化工具实例和执行线程池
     _get_tools(project_root)
+    configure_executor(max_workers=max_workers, tool_timeout=tool_timeout)
 
     # 打印启动信息
     print()
@@ -696,6 +823,14 @@ def run_server(
     else:
         print("  项目目录: 当前目录")
 
+    if tool_timeout is None:
+        timeout_desc = f"默认 {DEFAULT_TOOL_TIMEOUT} 秒（部分工具单独设置）"
+    elif tool_timeout > 0:
+        timeout_desc = f"{tool_timeout} 秒"
+    else:
+        timeout_desc = "不限时"
+    print(f"  工具并发上限: {_executor_settings['max_workers']}，超时: {timeout_desc}")
+
     print()
     print("  已注册的工具:")
     print("    === 日期解析工具（推荐优先调用）===")
@@ -770,6 +905,18 @@ if __name__ == '__main__':
         '--project-root',
         help='项目根目录路径'
     )
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f'同时执行的工具数上限，默认 {DEFAULT_MAX_WORKERS}'
+    )
+    parser.add_argument(
+        '--tool-timeout',
+        type=float,
+        default=None,
+        help='统一的工具超时（秒），默认按工具分别设置，0 表示不限时'
+    )
 
     args = parser.parse_args()
 
@@ -777,5 +924,7 @@ if __name__ == '__main__':
         project_root=args.project_root,
         transport=args.transport,
         host=args.host,
-        port=args.port
+        port=args.port,
+        max_workers=args.max_workers,
+        tool_timeout=args.tool_timeout
     )
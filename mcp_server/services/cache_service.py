@@ -2,22 +2,77 @@
 缓存服务
 
 实现TTL缓存机制，提升数据访问性能。
+容量按条目数和估算字节数双重限制，超出时淘汰最久未使用的条目，
+并由后台线程定期清理过期条目。
 """
 
+import sys
 import time
+from collections import OrderedDict
 from typing import Any, Optional
-from threading import Lock
+from threading import Event, Lock, Thread
+
+
+def estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """
+    估算对象占用的字节数（递归计算容器内容，同一对象只计一次）
+
+    Args:
+        value: 任意对象
+
+    Returns:
+        估算的字节数
+    """
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key, _seen) + estimate_size(item, _seen)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item, _seen)
+    return size
 
 
 class CacheService:
     """缓存服务类"""
 
-    def __init__(self):
-        """初始化缓存服务"""
-        self._cache = {}
-        self._timestamps = {}
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: int = 3600
+    ):
+        """
+        初始化缓存服务
+
+        Args:
+            max_entries: 最大条目数
+            max_bytes: 最大估算字节数
+            default_ttl: 未指定 TTL 的条目在后台清理时使用的存活时间（秒）
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+
+        # {key: (value, 写入时间, 存活时间, 估算字节数)}，按使用顺序排列
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._total_bytes = 0
         self._lock = Lock()
 
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+        self._sweeper: Optional[Thread] = None
+        self._stop_event = Event()
+
     def get(self, key: str, ttl: int = 900) -> Optional[Any]:
         """
         获取缓存数据
@@ -30,27 +85,53 @@ class CacheService:
             缓存的值，如果不存在或已过期则返回None
         """
         with self._lock:
-            if key in self._cache:
+            entry = self._cache.get(key)
+            if entry is not None:
                 # 检查是否过期
-                if time.time() - self._timestamps[key] < ttl:
-                    return self._cache[key]
+                if time.time() - entry[1] < ttl:
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    return entry[0]
                 else:
                     # 已过期，删除缓存
-                    del self._cache[key]
-                    del self._timestamps[key]
+                    self._remove(key)
+                    self._expirations += 1
+            self._misses += 1
         return None
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
         设置缓存数据
 
         Args:
             key: 缓存键
             value: 缓存值
+            ttl: 后台清理时使用的存活时间（秒），默认 default_ttl
         """
+        size = estimate_size(value)
         with self._lock:
-            self._cache[key] = value
-            self._timestamps[key] = time.time()
+            if key in self._cache:
+                self._remove(key)
+
+            # 单个值超过容量上限时不缓存
+            if size > self.max_bytes:
+                return
+
+            self._cache[key] = (value, time.time(), ttl or self.default_ttl, size)
+            self._total_bytes += size
+
+            while (
+                len(self._cache) > self.max_entries
+                or self._total_bytes > self.max_bytes
+            ):
+                oldest_key = next(iter(self._cache))
+                self._remove(oldest_key)
+                self._evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """删除条目并更新字节统计（调用方持有锁）"""
+        entry = self._cache.pop(key)
+        self._total_bytes -= entry[3]
 
     def delete(self, key: str) -> bool:
         """
@@ -64,8 +145,7 @@ class CacheService:
         """
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._remove(key)
                 return True
         return False
 
@@ -73,14 +153,14 @@ class CacheService:
         """清空所有缓存"""
         with self._lock:
             self._cache.clear()
-            self._timestamps.clear()
+            self._total_bytes = 0
 
-    def cleanup_expired(self, ttl: int = 900) -> int:
+    def cleanup_expired(self, ttl: Optional[int] = None) -> int:
         """
         清理过期缓存
 
         Args:
-            ttl: 存活时间（秒）
+            ttl: 存活时间（秒），默认使用各条目写入时的存活时间
 
         Returns:
             清理的条目数量
@@ -88,16 +168,42 @@ class CacheService:
         with self._lock:
             current_time = time.time()
             expired_keys = [
-                key for key, timestamp in self._timestamps.items()
-                if current_time - timestamp >= ttl
+                key for key, (_, timestamp, entry_ttl, _) in self._cache.items()
+                if current_time - timestamp >= (ttl if ttl is not None else entry_ttl)
             ]
 
             for key in expired_keys:
-                del self._cache[key]
-                del self._timestamps[key]
+                self._remove(key)
+            self._expirations += len(expired_keys)
 
             return len(expired_keys)
 
+    def start_sweeper(self, interval: int = 300) -> None:
+        """
+        启动后台过期清理线程（守护线程，重复调用无副作用）
+
+        Args:
+            interval: 清理间隔（秒）
+        """
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+
+        self._stop_event.clear()
+
+        def sweep():
+            while not self._stop_event.wait(interval):
+                self.cleanup_expired()
+
+        self._sweeper = Thread(target=sweep, name="cache-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        """停止后台过期清理线程"""
+        self._stop_event.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+            self._sweeper = None
+
     def get_stats(self) -> dict:
         """
         获取缓存统计信息
@@ -106,15 +212,25 @@ class CacheService:
             统计信息字典
         """
         with self._lock:
+            timestamps = [entry[1] for entry in self._cache.values()]
+            lookups = self._hits + self._misses
             return {
                 "total_entries": len(self._cache),
+                "max_entries": self.max_entries,
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
                 "oldest_entry_age": (
-                    time.time() - min(self._timestamps.values())
-                    if self._timestamps else 0
+                    time.time() - min(timestamps)
+                    if timestamps else 0
                 ),
                 "newest_entry_age": (
-                    time.time() - max(self._timestamps.values())
-                    if self._timestamps else 0
+                    time.time() - max(timestamps)
+                    if timestamps else 0
                 )
             }
 
@@ -133,4 +249,5 @@ def get_cache() -> CacheService:
     global _global_cache
     if _global_cache is None:
         _global_cache = CacheService()
+        _global_cache.start_sweeper()
     return _global_cache
@@ -4,14 +4,63 @@
 提供统一的数据查询接口,封装数据访问逻辑。
 """
 
-import re
-from collections import Counter
+import sqlite3
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from .cache_service import get_cache
+from .history_store import HISTORY_DB_NAME, HistoryReader
+from .output_catalog import get_output_catalog
 from .parser_service import ParserService
 from ..utils.errors import DataNotFoundError
+from ..utils.keyword_rollup import KeywordRollup
+from ..utils.similarity_index import TitleSimilarityIndex
+from ..utils.word_matcher import AhoCorasick
+
+
+# 进程内共享的按天派生数据（相似度索引、关键词汇总），按最近使用淘汰
+# {(类型, 日期文件夹, 平台过滤): (all_titles, 派生数据)}
+_day_derived_cache: "OrderedDict[Tuple, Tuple]" = OrderedDict()
+DAY_DERIVED_CACHE_SIZE = 64
+_day_derived_lock = Lock()
+
+
+def _get_day_derived(
+    cache_key: Tuple,
+    all_titles: Dict,
+    build: Callable[[Dict], Any]
+) -> Any:
+    """
+    读取与当天合并结果绑定的派生数据，合并结果变化（平台字典被替换）时重新生成
+
+    Args:
+        cache_key: (类型, 日期文件夹, 平台过滤)
+        all_titles: ParserService 返回的当天合并结果
+        build: 由 all_titles 生成派生数据的函数
+
+    Returns:
+        派生数据
+    """
+    with _day_derived_lock:
+        cached = _day_derived_cache.get(cache_key)
+        if cached is not None:
+            cached_titles, value = cached
+            if cached_titles.keys() == all_titles.keys() and all(
+                cached_titles[platform_id] is titles
+                for platform_id, titles in all_titles.items()
+            ):
+                _day_derived_cache.move_to_end(cache_key)
+                return value
+
+    value = build(all_titles)
+    with _day_derived_lock:
+        _day_derived_cache[cache_key] = (all_titles, value)
+        _day_derived_cache.move_to_end(cache_key)
+        while len(_day_derived_cache) > DAY_DERIVED_CACHE_SIZE:
+            _day_derived_cache.popitem(last=False)
+    return value
 
 
 class DataService:
@@ -26,6 +75,7 @@ class DataService:
         """
         self.parser = ParserService(project_root)
         self.cache = get_cache()
+        self.catalog = get_output_catalog(self.parser.project_root / "output")
 
     def get_latest_news(
         self,
@@ -97,7 +147,7 @@ class DataService:
         result = news_list[:limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=900)
 
         return result
 
@@ -177,10 +227,208 @@ class DataService:
         result = news_list[:limit]
 
         # 缓存结果(历史数据缓存更久)
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=1800)
 
         return result
 
+    def iter_titles_by_date(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        platforms: Optional[List[str]] = None,
+        keyword: Optional[str] = None
+    ) -> Iterator[Tuple[datetime, Dict, Dict]]:
+        """
+        按天遍历日期范围内的标题数据
+
+        历史库（output/history.db）已完整收录的日期用一次索引查询取回，
+        其余日期（历史库缺失、或有未写入历史库的快照）逐天读取快照兜底。
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期
+            platforms: 平台ID列表,None表示所有平台
+            keyword: 关键词(可选),只返回包含该关键词的标题(不区分大小写)
+
+        Returns:
+            按日期顺序的 (日期, all_titles, id_to_name) 迭代器,没有数据的日期跳过
+        """
+        dates = []
+        current_date = start_date
+        while current_date <= end_date:
+            dates.append(current_date)
+            current_date += timedelta(days=1)
+
+        history_days = self._query_history(dates, platforms, keyword)
+
+        # 历史库没有收录的日期一次性（并行）读取快照
+        snapshot_days = {
+            current_date: (all_titles, id_to_name)
+            for current_date, all_titles, id_to_name, _ in self.parser.read_titles_for_dates(
+                [
+                    current_date for current_date in dates
+                    if current_date.strftime("%Y-%m-%d") not in history_days
+                ],
+                platform_ids=platforms
+            )
+        }
+
+        keyword_lower = keyword.lower() if keyword else None
+        for current_date in dates:
+            date_str = current_date.strftime("%Y-%m-%d")
+            if date_str in history_days:
+                all_titles, id_to_name = history_days[date_str]
+                yield current_date, all_titles, id_to_name
+                continue
+
+            if current_date not in snapshot_days:
+                continue
+            all_titles, id_to_name = snapshot_days[current_date]
+
+            if keyword_lower:
+                all_titles = {
+                    platform_id: {
+                        title: info
+                        for title, info in titles.items()
+                        if keyword_lower in title.lower()
+                    }
+                    for platform_id, titles in all_titles.items()
+                }
+                all_titles = {
+                    platform_id: titles
+                    for platform_id, titles in all_titles.items()
+                    if titles
+                }
+
+            yield current_date, all_titles, id_to_name
+
+    def get_title_index(
+        self,
+        date: Optional[datetime] = None,
+        platforms: Optional[List[str]] = None
+    ) -> Tuple[TitleSimilarityIndex, Dict]:
+        """
+        获取某天标题的相似度候选索引（带缓存）
+
+        索引与 ParserService 的当天合并结果绑定：合并结果不变时直接复用，
+        有新快照合并进来时重新建立。
+
+        Args:
+            date: 日期，默认为今天
+            platforms: 平台ID列表,None表示所有平台
+
+        Returns:
+            (TitleSimilarityIndex, id_to_name)
+
+        Raises:
+            DataNotFoundError: 当天没有数据
+        """
+        all_titles, id_to_name, _ = self.parser.read_all_titles_for_date(
+            date=date,
+            platform_ids=platforms
+        )
+        return self._build_title_index(date, platforms, all_titles), id_to_name
+
+    def _build_title_index(
+        self,
+        date: Optional[datetime],
+        platforms: Optional[List[str]],
+        all_titles: Dict
+    ) -> TitleSimilarityIndex:
+        """取出（或建立）与当天合并结果绑定的相似度候选索引"""
+        return _get_day_derived(
+            (
+                "title_index",
+                self.parser.get_date_folder_name(date),
+                tuple(platforms) if platforms else None
+            ),
+            all_titles,
+            TitleSimilarityIndex
+        )
+
+    def get_keyword_rollup(self, date: Optional[datetime] = None) -> KeywordRollup:
+        """
+        获取某天全部平台标题的关键词汇总（带缓存）
+
+        已结束的日期在进程内只汇总一次；当天有新快照合并进来时重新汇总
+        （分词结果已按标题缓存，只需重新累加计数）。
+
+        Args:
+            date: 日期，默认为今天
+
+        Returns:
+            KeywordRollup
+
+        Raises:
+            DataNotFoundError: 当天没有数据
+        """
+        all_titles, _, _ = self.parser.read_all_titles_for_date(date=date)
+        return _get_day_derived(
+            ("keyword_rollup", self.parser.get_date_folder_name(date), None),
+            all_titles,
+            KeywordRollup
+        )
+
+    def iter_title_indexes(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        platforms: Optional[List[str]] = None
+    ) -> Iterator[Tuple[datetime, TitleSimilarityIndex, Dict]]:
+        """
+        按天遍历日期范围内标题的相似度候选索引
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期
+            platforms: 平台ID列表,None表示所有平台
+
+        Returns:
+            按日期顺序的 (日期, TitleSimilarityIndex, id_to_name) 迭代器,没有数据的日期跳过
+        """
+        for current_date, all_titles, id_to_name, _ in self.parser.read_titles_for_range(
+            start_date, end_date, platform_ids=platforms
+        ):
+            yield current_date, self._build_title_index(current_date, platforms, all_titles), id_to_name
+
+    def _query_history(
+        self,
+        dates: List[datetime],
+        platforms: Optional[List[str]],
+        keyword: Optional[str]
+    ) -> Dict[str, Tuple[Dict, Dict]]:
+        """
+        从历史库读取快照已全部收录的日期
+
+        Returns:
+            {YYYY-MM-DD: (all_titles, id_to_name)},历史库不可用时返回空字典
+        """
+        db_path = self.parser.project_root / "output" / HISTORY_DB_NAME
+        if not dates or not db_path.exists():
+            return {}
+
+        try:
+            reader = HistoryReader(db_path)
+            try:
+                date_strs = [date.strftime("%Y-%m-%d") for date in dates]
+                recorded = reader.list_day_snapshots(date_strs)
+
+                # 只有当天全部快照都已写入历史库时才使用历史库
+                covered = []
+                for date, date_str in zip(dates, date_strs):
+                    if date_str not in recorded:
+                        continue
+                    date_folder = self.parser.get_date_folder_name(date)
+                    if self.parser.list_day_snapshot_times(date_folder) == recorded[date_str]:
+                        covered.append(date_str)
+
+                return reader.query_titles(covered, platforms, keyword)
+            finally:
+                reader.close()
+        except sqlite3.Error as e:
+            print(f"Warning: 查询历史库失败，改为逐天读取快照: {e}")
+            return {}
+
     def search_news_by_keyword(
         self,
         keyword: str,
@@ -214,44 +462,30 @@ class DataService:
         results = []
         platform_distribution = Counter()
 
-        # 遍历日期范围
-        current_date = start_date
-        while current_date <= end_date:
-            try:
-                all_titles, id_to_name, _ = self.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=platforms
-                )
-
-                # 搜索包含关键词的标题
-                for platform_id, titles in all_titles.items():
-                    platform_name = id_to_name.get(platform_id, platform_id)
-
-                    for title, info in titles.items():
-                        if keyword.lower() in title.lower():
-                            # 计算平均排名
-                            avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
-
-                            results.append({
-                                "title": title,
-                                "platform": platform_id,
-                                "platform_name": platform_name,
-                                "ranks": info["ranks"],
-                                "count": len(info["ranks"]),
-                                "avg_rank": round(avg_rank, 2),
-                                "url": info.get("url", ""),
-                                "mobileUrl": info.get("mobileUrl", ""),
-                                "date": current_date.strftime("%Y-%m-%d")
-                            })
-
-                            platform_distribution[platform_id] += 1
-
-            except DataNotFoundError:
-                # 该日期没有数据,继续下一天
-                pass
-
-            # 下一天
-            current_date += timedelta(days=1)
+        # 遍历日期范围(只取回包含关键词的标题)
+        for current_date, all_titles, id_to_name in self.iter_titles_by_date(
+            start_date, end_date, platforms=platforms, keyword=keyword
+        ):
+            for platform_id, titles in all_titles.items():
+                platform_name = id_to_name.get(platform_id, platform_id)
+
+                for title, info in titles.items():
+                    # 计算平均排名
+                    avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
+
+                    results.append({
+                        "title": title,
+                        "platform": platform_id,
+                        "platform_name": platform_name,
+                        "ranks": info["ranks"],
+                        "count": len(info["ranks"]),
+                        "avg_rank": round(avg_rank, 2),
+                        "url": info.get("url", ""),
+                        "mobileUrl": info.get("mobileUrl", ""),
+                        "date": current_date.strftime("%Y-%m-%d")
+                    })
+
+                    platform_distribution[platform_id] += 1
 
         if not results:
             raise DataNotFoundError(
@@ -355,20 +589,26 @@ class DataService:
         word_frequency = Counter()
         keyword_to_news = {}
 
+        # 所有词组的关键词编译成一个自动机，每个标题只扫描一次；
+        # 同一个词在多个词组中出现时按出现次数累计
+        word_occurrences = Counter()
+        for group in word_groups:
+            for word in group.get("required", []) + group.get("normal", []):
+                if word:
+                    word_occurrences[word] += 1
+        keywords = list(word_occurrences)
+        automaton = AhoCorasick(keywords)
+
         # 遍历要处理的标题
         for platform_id, titles in titles_to_process.items():
             for title in titles.keys():
-                # 对每个关键词组进行匹配
-                for group in word_groups:
-                    all_words = group.get("required", []) + group.get("normal", [])
-
-                    for word in all_words:
-                        if word and word in title:
-                            word_frequency[word] += 1
+                for word_id in sorted(automaton.find_all(title)):
+                    word = keywords[word_id]
+                    word_frequency[word] += word_occurrences[word]
 
-                            if word not in keyword_to_news:
-                                keyword_to_news[word] = []
-                            keyword_to_news[word].append(title)
+                    if word not in keyword_to_news:
+                        keyword_to_news[word] = []
+                    keyword_to_news[word].append(title)
 
         # 获取TOP N关键词
         top_keywords = word_frequency.most_common(top_n)
@@ -396,7 +636,7 @@ class DataService:
         }
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=1800)
 
         return result
 
@@ -491,13 +731,13 @@ class DataService:
             result = {}
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, ttl=3600)
 
         return result
 
     def get_available_date_range(self) -> Tuple[Optional[datetime], Optional[datetime]]:
         """
-        扫描 output 目录，返回实际可用的日期范围
+        返回 output 目录中实际可用的日期范围（读取增量维护的目录册）
 
         Returns:
             (最早日期, 最新日期) 元组，如果没有数据则返回 (None, None)
@@ -507,33 +747,7 @@ class DataService:
             >>> earliest, latest = service.get_available_date_range()
             >>> print(f"可用日期范围：{earliest} 至 {latest}")
         """
-        output_dir = self.parser.project_root / "output"
-
-        if not output_dir.exists():
-            return (None, None)
-
-        available_dates = []
-
-        # 遍历日期文件夹
-        for date_folder in output_dir.iterdir():
-            if date_folder.is_dir() and not date_folder.name.startswith('.'):
-                # 解析日期（格式: YYYY年MM月DD日）
-                try:
-                    date_match = re.match(r'(\d{4})年(\d{2})月(\d{2})日', date_folder.name)
-                    if date_match:
-                        folder_date = datetime(
-                            int(date_match.group(1)),
-                            int(date_match.group(2)),
-                            int(date_match.group(3))
-                        )
-                        available_dates.append(folder_date)
-                except Exception:
-                    pass
-
-        if not available_dates:
-            return (None, None)
-
-        return (min(available_dates), max(available_dates))
+        return self.catalog.get_date_range()
 
     def get_system_status(self) -> Dict:
         """
@@ -542,42 +756,11 @@ class DataService:
         Returns:
             系统状态字典
         """
-        # 获取数据统计
-        output_dir = self.parser.project_root / "output"
-
-        total_storage = 0
-        oldest_record = None
-        latest_record = None
-        total_news = 0
-
-        if output_dir.exists():
-            # 遍历日期文件夹
-            for date_folder in output_dir.iterdir():
-                if date_folder.is_dir():
-                    # 解析日期
-                    try:
-                        date_str = date_folder.name
-                        # 格式: YYYY年MM月DD日
-                        date_match = re.match(r'(\d{4})年(\d{2})月(\d{2})日', date_str)
-                        if date_match:
-                            folder_date = datetime(
-                                int(date_match.group(1)),
-                                int(date_match.group(2)),
-                                int(date_match.group(3))
-                            )
-
-                            if oldest_record is None or folder_date < oldest_record:
-                                oldest_record = folder_date
-                            if latest_record is None or folder_date > latest_record:
-                                latest_record = folder_date
-
-                    except:
-                        pass
-
-                    # 计算存储大小
-                    for item in date_folder.rglob("*"):
-                        if item.is_file():
-                            total_storage += item.stat().st_size
+        # 获取数据统计（来自增量维护的输出目录册）
+        summary = self.catalog.get_summary()
+        total_storage = summary["total_bytes"]
+        oldest_record = summary["oldest_date"]
+        latest_record = summary["latest_date"]
 
         # 读取版本信息
         version_file = self.parser.project_root / "version"
@@ -598,6 +781,9 @@ class DataService:
                 "total_storage": f"{total_storage / 1024 / 1024:.2f} MB",
                 "oldest_record": oldest_record.strftime("%Y-%m-%d") if oldest_record else None,
                 "latest_record": latest_record.strftime("%Y-%m-%d") if latest_record else None,
+                "total_days": summary["total_days"],
+                "total_files": summary["total_files"],
+                "latest_snapshot": summary["latest_snapshot"],
             },
             "cache": self.cache.get_stats(),
             "health": "healthy"
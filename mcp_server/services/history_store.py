@@ -0,0 +1,153 @@
+"""
+历史库读取服务
+
+读取爬虫写入的跨日期历史库（output/history.db），按日期范围和关键词做索引查询。
+库结构与项目根目录 utils/history_store.py 的写入端保持一致。
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from .snapshot_store import connect_readonly
+
+
+HISTORY_DB_NAME = "history.db"
+
+# trigram 全文索引至少需要 3 个字符才能命中，更短的关键词使用二元组倒排表
+FTS_MIN_KEYWORD_LENGTH = 3
+
+
+def title_bigrams(text: str) -> set:
+    """文本（转小写后）中出现的全部相邻两字符组合，与写入端的倒排表一致"""
+    text = text.lower()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class HistoryReader:
+    """历史库的只读访问"""
+
+    def __init__(self, db_path: Path):
+        """
+        打开历史库（只读）
+
+        Args:
+            db_path: 历史库文件路径
+        """
+        self.db_path = Path(db_path)
+        self.conn = connect_readonly(self.db_path)
+        tables = {
+            row[0] for row in self.conn.execute("SELECT name FROM sqlite_master")
+        }
+        self.has_fts = "titles_fts" in tables
+        self.has_grams = "title_grams" in tables
+
+    def close(self) -> None:
+        """关闭连接"""
+        self.conn.close()
+
+    def list_day_snapshots(self, dates: List[str]) -> Dict[str, Set[str]]:
+        """
+        查询各日期已写入历史库的快照
+
+        Args:
+            dates: 日期列表（YYYY-MM-DD）
+
+        Returns:
+            {日期: {time_info, ...}}，没有写入过的日期不出现在结果中
+        """
+        if not dates:
+            return {}
+
+        result: Dict[str, Set[str]] = {}
+        for date, time_info in self.conn.execute(
+            "SELECT d.date, s.time_info FROM day_snapshots s "
+            "JOIN days d ON d.id = s.day_id "
+            f"WHERE d.date IN ({','.join('?' * len(dates))})",
+            dates,
+        ):
+            result.setdefault(date, set()).add(time_info)
+        return result
+
+    def query_titles(
+        self,
+        dates: List[str],
+        platform_ids: Optional[List[str]] = None,
+        keyword: Optional[str] = None,
+    ) -> Dict[str, Tuple[Dict, Dict]]:
+        """
+        一次查询读取多天的标题数据
+
+        关键词长度不少于 3 个字符时先用 FTS5 trigram 索引筛出候选标题，
+        2 个字符（或没有全文索引）时用二元组倒排表求交集筛出候选标题，
+        再统一按 `keyword.lower() in title.lower()` 复核，语义与逐条子串匹配一致。
+
+        Args:
+            dates: 日期列表（YYYY-MM-DD）
+            platform_ids: 平台ID列表，None表示所有平台
+            keyword: 关键词（可选），只返回包含该关键词的标题（不区分大小写）
+
+        Returns:
+            {日期: (all_titles, id_to_name)}，结构与
+            ParserService.read_all_titles_for_date 的前两项一致，
+            平台和标题按当天首次出现的顺序排列
+        """
+        result: Dict[str, Tuple[Dict, Dict]] = {}
+        if not dates:
+            return result
+
+        date_marks = ",".join("?" * len(dates))
+        for date, platform_id, name in self.conn.execute(
+            "SELECT d.date, p.platform_id, dp.name FROM day_platforms dp "
+            "JOIN days d ON d.id = dp.day_id "
+            "JOIN platforms p ON p.id = dp.platform_ref "
+            f"WHERE d.date IN ({date_marks}) ORDER BY d.date, dp.position",
+            dates,
+        ):
+            result.setdefault(date, ({}, {}))[1][platform_id] = name
+
+        conditions = [f"d.date IN ({date_marks})"]
+        params: List = list(dates)
+        if platform_ids:
+            conditions.append(f"p.platform_id IN ({','.join('?' * len(platform_ids))})")
+            params.extend(platform_ids)
+
+        keyword_lower = keyword.lower() if keyword else None
+        if keyword_lower and self.has_fts and len(keyword_lower) >= FTS_MIN_KEYWORD_LENGTH:
+            conditions.append(
+                "a.title_ref IN (SELECT rowid FROM titles_fts WHERE titles_fts MATCH ?)"
+            )
+            params.append('"' + keyword_lower.replace('"', '""') + '"')
+        elif keyword_lower and self.has_grams and len(keyword_lower) >= 2:
+            grams = sorted(title_bigrams(keyword_lower))
+            conditions.append(
+                "a.title_ref IN (SELECT title_ref FROM title_grams "
+                f"WHERE gram IN ({','.join('?' * len(grams))}) "
+                "GROUP BY title_ref HAVING COUNT(*) = ?)"
+            )
+            params.extend(grams)
+            params.append(len(grams))
+
+        rows = self.conn.execute(
+            "SELECT d.date, p.platform_id, t.title, a.ranks, a.url, a.mobile_url "
+            "FROM appearances a "
+            "JOIN days d ON d.id = a.day_id "
+            "JOIN platforms p ON p.id = a.platform_ref "
+            "JOIN titles t ON t.id = a.title_ref "
+            "JOIN day_platforms dp ON dp.day_id = a.day_id AND dp.platform_ref = a.platform_ref "
+            f"WHERE {' AND '.join(conditions)} "
+            "ORDER BY d.date, dp.position, a.id",
+            params,
+        )
+
+        for date, platform_id, title, ranks, url, mobile_url in rows:
+            if keyword_lower and keyword_lower not in title.lower():
+                continue
+            all_titles = result.setdefault(date, ({}, {}))[0]
+            all_titles.setdefault(platform_id, {})[title] = {
+                "ranks": json.loads(ranks),
+                "url": url,
+                "mobileUrl": mobile_url,
+            }
+
+        return result
@@ -0,0 +1,293 @@
+"""
+输出目录目录册
+
+维护 output/ 下各日期文件夹的概况（文件数、占用字节、首末快照时间），
+按目录修改时间增量刷新：只有目录项发生变化的日期文件夹（以及仍在写入的最新一天）
+才会重新统计，系统状态和默认日期解析不再每次遍历整个输出目录。
+"""
+
+import os
+import re
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from .snapshot_store import SNAPSHOT_DB_NAME, SnapshotReader
+
+
+# 两次检查目录修改时间的最短间隔（秒），间隔内直接返回已有统计
+CATALOG_CHECK_INTERVAL = 2.0
+
+_DATE_FOLDER_PATTERN = re.compile(r'(\d{4})年(\d{2})月(\d{2})日')
+
+
+def _parse_folder_date(folder_name: str) -> Optional[datetime]:
+    """解析日期文件夹名（YYYY年MM月DD日），不是日期文件夹时返回 None"""
+    if folder_name.startswith('.'):
+        return None
+    date_match = _DATE_FOLDER_PATTERN.match(folder_name)
+    if not date_match:
+        return None
+    try:
+        return datetime(
+            int(date_match.group(1)),
+            int(date_match.group(2)),
+            int(date_match.group(3))
+        )
+    except ValueError:
+        return None
+
+
+class DayEntry:
+    """单个输出子目录的统计"""
+
+    __slots__ = (
+        "folder", "date", "dir_mtimes", "file_count", "total_bytes",
+        "snapshot_times", "db_signature"
+    )
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        self.date: Optional[datetime] = _parse_folder_date(folder)
+        # {目录路径: 修改时间(ns)}，覆盖该文件夹下的全部子目录
+        self.dir_mtimes: Dict[str, int] = {}
+        self.file_count = 0
+        self.total_bytes = 0
+        # 按时间排序的快照时间（time_info，如 "09时28分"）
+        self.snapshot_times: List[str] = []
+        # 快照库的 (修改时间, 大小) 及其时间槽，库未变化时不重新打开
+        self.db_signature: Optional[Tuple[Tuple[int, int], List[str]]] = None
+
+    def is_stale(self) -> bool:
+        """目录树中任一目录的修改时间变化（或目录已不存在）时返回 True"""
+        for dir_path, mtime in self.dir_mtimes.items():
+            try:
+                if os.stat(dir_path).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def scan(self, folder_path: Path) -> None:
+        """重新统计文件夹下的文件数、字节数和快照时间"""
+        dir_mtimes = {}
+        file_count = 0
+        total_bytes = 0
+        for dir_path, _, file_names in os.walk(folder_path):
+            try:
+                dir_mtimes[dir_path] = os.stat(dir_path).st_mtime_ns
+            except OSError:
+                continue
+            for file_name in file_names:
+                try:
+                    stat = os.stat(os.path.join(dir_path, file_name))
+                except OSError:
+                    continue
+                file_count += 1
+                total_bytes += stat.st_size
+
+        snapshot_times = set()
+        txt_dir = folder_path / "txt"
+        if txt_dir.is_dir():
+            snapshot_times.update(txt_file.stem for txt_file in txt_dir.glob("*.txt"))
+        snapshot_times.update(self._read_db_slots(folder_path / SNAPSHOT_DB_NAME))
+
+        self.dir_mtimes = dir_mtimes
+        self.file_count = file_count
+        self.total_bytes = total_bytes
+        self.snapshot_times = sorted(snapshot_times)
+
+    def _read_db_slots(self, db_path: Path) -> List[str]:
+        """读取快照库中的时间槽（库未变化时复用上次结果）"""
+        try:
+            stat = db_path.stat()
+        except OSError:
+            self.db_signature = None
+            return []
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self.db_signature is not None and self.db_signature[0] == signature:
+            return self.db_signature[1]
+
+        try:
+            reader = SnapshotReader(db_path)
+            try:
+                time_infos = [time_info for time_info, _ in reader.list_slots()]
+            finally:
+                reader.close()
+        except sqlite3.Error as e:
+            print(f"Warning: 读取快照库 {db_path} 失败: {e}")
+            time_infos = []
+
+        self.db_signature = (signature, time_infos)
+        return time_infos
+
+    def to_dict(self) -> Dict:
+        """转换为字典格式"""
+        return {
+            "folder": self.folder,
+            "date": self.date.strftime("%Y-%m-%d") if self.date else None,
+            "file_count": self.file_count,
+            "total_bytes": self.total_bytes,
+            "snapshot_count": len(self.snapshot_times),
+            "first_snapshot": self.snapshot_times[0] if self.snapshot_times else None,
+            "last_snapshot": self.snapshot_times[-1] if self.snapshot_times else None,
+        }
+
+
+class OutputCatalog:
+    """output/ 目录的增量目录册"""
+
+    def __init__(self, output_dir: Path, check_interval: float = CATALOG_CHECK_INTERVAL):
+        """
+        初始化目录册（首次查询时扫描）
+
+        Args:
+            output_dir: 输出目录
+            check_interval: 两次检查目录修改时间的最短间隔（秒）
+        """
+        self.output_dir = Path(output_dir)
+        self.check_interval = check_interval
+        self._entries: Dict[str, DayEntry] = {}
+        self._output_mtime: Optional[int] = None
+        self._checked_at: Optional[float] = None
+        self._lock = Lock()
+
+    def invalidate(self) -> None:
+        """让下一次查询立即检查目录变化（写入输出文件后调用）"""
+        with self._lock:
+            self._checked_at = None
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        按目录修改时间增量刷新
+
+        Args:
+            force: 忽略检查间隔，立即检查
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._checked_at is not None
+                and now - self._checked_at < self.check_interval
+            ):
+                return
+            self._refresh_locked()
+            self._checked_at = now
+
+    def _refresh_locked(self) -> None:
+        """检查输出目录和各文件夹的修改时间，重新统计发生变化的文件夹"""
+        try:
+            output_mtime = os.stat(self.output_dir).st_mtime_ns
+        except OSError:
+            self._entries = {}
+            self._output_mtime = None
+            return
+
+        # 输出目录本身的修改时间变化说明有文件夹新增或删除
+        if output_mtime != self._output_mtime:
+            folders = set()
+            with os.scandir(self.output_dir) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        folders.add(entry.name)
+            for folder in list(self._entries):
+                if folder not in folders:
+                    del self._entries[folder]
+            for folder in folders:
+                if folder not in self._entries:
+                    self._entries[folder] = DayEntry(folder)
+            self._output_mtime = output_mtime
+
+        # 最新一天仍可能在原有文件上追加写入（目录修改时间不变），每次都重新统计
+        latest = self._latest_entry()
+        for entry in self._entries.values():
+            if not entry.dir_mtimes or entry is latest or entry.is_stale():
+                entry.scan(self.output_dir / entry.folder)
+
+    def _latest_entry(self) -> Optional[DayEntry]:
+        """日期最新的日期文件夹"""
+        dated = [entry for entry in self._entries.values() if entry.date is not None]
+        return max(dated, key=lambda entry: entry.date) if dated else None
+
+    def get_date_range(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        可用的日期范围
+
+        Returns:
+            (最早日期, 最新日期) 元组，如果没有数据则返回 (None, None)
+        """
+        self.refresh()
+        with self._lock:
+            dates = [entry.date for entry in self._entries.values() if entry.date is not None]
+        if not dates:
+            return (None, None)
+        return (min(dates), max(dates))
+
+    def list_days(self) -> List[Dict]:
+        """
+        按日期升序返回各日期文件夹的统计
+
+        Returns:
+            [{folder, date, file_count, total_bytes, snapshot_count,
+              first_snapshot, last_snapshot}, ...]
+        """
+        self.refresh()
+        with self._lock:
+            entries = sorted(
+                (entry for entry in self._entries.values() if entry.date is not None),
+                key=lambda entry: (entry.date, entry.folder)
+            )
+            return [entry.to_dict() for entry in entries]
+
+    def get_summary(self) -> Dict:
+        """
+        输出目录的汇总统计
+
+        Returns:
+            {total_bytes, total_files, total_days, oldest_date, latest_date, latest_snapshot}，
+            字节数和文件数包含 output/ 下的全部子目录
+        """
+        self.refresh()
+        with self._lock:
+            entries = list(self._entries.values())
+            latest = self._latest_entry()
+            dates = [entry.date for entry in entries if entry.date is not None]
+            return {
+                "total_bytes": sum(entry.total_bytes for entry in entries),
+                "total_files": sum(entry.file_count for entry in entries),
+                "total_days": len(set(dates)),
+                "oldest_date": min(dates) if dates else None,
+                "latest_date": max(dates) if dates else None,
+                "latest_snapshot": (
+                    latest.snapshot_times[-1]
+                    if latest is not None and latest.snapshot_times else None
+                ),
+            }
+
+
+# 按输出目录共享的目录册实例
+_catalogs: Dict[str, OutputCatalog] = {}
+_catalogs_lock = Lock()
+
+
+def get_output_catalog(output_dir: Path) -> OutputCatalog:
+    """
+    获取输出目录对应的共享目录册
+
+    Args:
+        output_dir: 输出目录
+
+    Returns:
+        目录册实例
+    """
+    key = str(Path(output_dir).resolve())
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = OutputCatalog(Path(key))
+        return catalog
@@ -1,18 +1,275 @@
 """
 文件解析服务
 
-提供txt格式新闻数据和YAML配置文件的解析功能。
+提供快照库、txt格式新闻数据和YAML配置文件的解析功能。
 """
 
+import multiprocessing
+import os
 import re
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+from typing import Dict, List, Set, Tuple, Optional
+from datetime import datetime, timedelta
+from threading import Lock
 
 import yaml
 
 from ..utils.errors import FileParseError, DataNotFoundError
 from .cache_service import get_cache
+from .snapshot_store import SNAPSHOT_DB_NAME, SnapshotReader
+
+
+# 进程内共享的快照缓存（各工具各自创建 ParserService，缓存需要共用），按最近使用淘汰
+# {快照路径: (签名, (时间戳, titles_by_id, id_to_name))}
+_snapshot_cache: "OrderedDict[str, Tuple]" = OrderedDict()
+SNAPSHOT_CACHE_SIZE = 512
+# {日期文件夹: (已合并的 [(文件名, 签名)], all_titles, id_to_name, all_timestamps)}
+_day_cache: "OrderedDict[str, Tuple]" = OrderedDict()
+DAY_CACHE_SIZE = 32
+_cache_lock = Lock()
+
+# 多日读取时并行解析快照的进程数（按天分发），1 表示不使用进程池
+RANGE_LOAD_MAX_WORKERS = min(8, os.cpu_count() or 1)
+_range_load_pool: Optional[ProcessPoolExecutor] = None
+_range_load_pool_lock = Lock()
+
+
+def _cache_put(cache: OrderedDict, key: str, value: Tuple, max_size: int) -> None:
+    """写入缓存并淘汰最久未使用的条目（调用方持有 _cache_lock）"""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > max_size:
+        cache.popitem(last=False)
+
+
+def _get_range_load_pool() -> ProcessPoolExecutor:
+    """获取或创建多日读取进程池（spawn 方式启动，避免在多线程进程中 fork）"""
+    global _range_load_pool
+    with _range_load_pool_lock:
+        if _range_load_pool is None:
+            _range_load_pool = ProcessPoolExecutor(
+                max_workers=RANGE_LOAD_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _range_load_pool
+
+
+def _reset_range_load_pool() -> None:
+    """丢弃失效的进程池，下次使用时重新创建"""
+    global _range_load_pool
+    with _range_load_pool_lock:
+        if _range_load_pool is not None:
+            _range_load_pool.shutdown(wait=False, cancel_futures=True)
+            _range_load_pool = None
+
+
+def _parse_txt_file(file_path: Path) -> Tuple[Dict, Dict]:
+    """解析单个txt文件（模块级函数，可在子进程中执行），见 ParserService.parse_txt_file"""
+    if not file_path.exists():
+        raise FileParseError(str(file_path), "文件不存在")
+
+    titles_by_id = {}
+    id_to_name = {}
+
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+            sections = content.split("\n\n")
+
+            for section in sections:
+                if not section.strip() or "==== 以下ID请求失败 ====" in section:
+                    continue
+
+                lines = section.strip().split("\n")
+                if len(lines) < 2:
+                    continue
+
+                # 解析header: id | name 或 id
+                header_line = lines[0].strip()
+                if " | " in header_line:
+                    parts = header_line.split(" | ", 1)
+                    source_id = parts[0].strip()
+                    name = parts[1].strip()
+                    id_to_name[source_id] = name
+                else:
+                    source_id = header_line
+                    id_to_name[source_id] = source_id
+
+                titles_by_id[source_id] = {}
+
+                # 解析标题行
+                for line in lines[1:]:
+                    if line.strip():
+                        try:
+                            title_part = line.strip()
+                            rank = None
+
+                            # 提取排名
+                            if ". " in title_part and title_part.split(". ")[0].isdigit():
+                                rank_str, title_part = title_part.split(". ", 1)
+                                rank = int(rank_str)
+
+                            # 提取 MOBILE URL
+                            mobile_url = ""
+                            if " [MOBILE:" in title_part:
+                                title_part, mobile_part = title_part.rsplit(" [MOBILE:", 1)
+                                if mobile_part.endswith("]"):
+                                    mobile_url = mobile_part[:-1]
+
+                            # 提取 URL
+                            url = ""
+                            if " [URL:" in title_part:
+                                title_part, url_part = title_part.rsplit(" [URL:", 1)
+                                if url_part.endswith("]"):
+                                    url = url_part[:-1]
+
+                            title = ParserService.clean_title(title_part.strip())
+                            ranks = [rank] if rank is not None else [1]
+
+                            titles_by_id[source_id][title] = {
+                                "ranks": ranks,
+                                "url": url,
+                                "mobileUrl": mobile_url,
+                            }
+
+                        except Exception as e:
+                            # 忽略单行解析错误
+                            continue
+
+    except Exception as e:
+        raise FileParseError(str(file_path), str(e))
+
+    return titles_by_id, id_to_name
+
+
+def _read_snapshot_files(
+    date_dir: str,
+    slots: List[str],
+    txt_files: Dict[str, float]
+) -> Dict[str, Tuple[float, Dict, Dict]]:
+    """
+    读取一天中未缓存的快照（模块级函数，可在子进程中执行）
+
+    Args:
+        date_dir: 日期目录路径
+        slots: 需要从快照库读取的时间槽
+        txt_files: 需要解析的 {txt 文件名: 修改时间}
+
+    Returns:
+        {文件名: (时间戳, titles_by_id, id_to_name)}，读取失败的快照不出现在结果中
+    """
+    date_dir = Path(date_dir)
+    loaded = {}
+
+    if slots:
+        db_path = date_dir / SNAPSHOT_DB_NAME
+        try:
+            reader = SnapshotReader(db_path)
+            try:
+                for time_info, created_at, titles_by_id, id_to_name in reader.iter_snapshots(
+                    slots
+                ):
+                    loaded[f"{time_info}.txt"] = (created_at, titles_by_id, id_to_name)
+            finally:
+                reader.close()
+        except sqlite3.Error as e:
+            print(f"Warning: 读取快照库 {db_path} 失败: {e}")
+
+    for filename, mtime in txt_files.items():
+        txt_file = date_dir / "txt" / filename
+        try:
+            titles_by_id, file_id_to_name = _parse_txt_file(txt_file)
+            loaded[filename] = (mtime, titles_by_id, file_id_to_name)
+        except Exception as e:
+            # 忽略单个文件的解析错误，继续处理其他文件
+            print(f"Warning: 解析文件 {txt_file} 失败: {e}")
+            continue
+
+    return loaded
+
+
+def _merge_snapshots(
+    snapshots: List[Tuple],
+    all_titles: Dict,
+    id_to_name: Dict,
+    all_timestamps: Dict
+) -> None:
+    """
+    把快照按顺序合并进当天的结果（原地修改传入的字典）
+
+    Args:
+        snapshots: [(文件名, 签名, 时间戳, titles_by_id, id_to_name)]
+        all_titles: 已合并的标题，合并时替换为新的 info 字典，不修改原有 info
+        id_to_name: 已合并的平台名称
+        all_timestamps: 已合并的快照时间戳
+    """
+    for filename, _, timestamp, titles_by_id, file_id_to_name in snapshots:
+        # 更新id_to_name
+        id_to_name.update(file_id_to_name)
+
+        # 合并标题数据
+        for platform_id, titles in titles_by_id.items():
+            if platform_id not in all_titles:
+                all_titles[platform_id] = {}
+
+            platform_titles = all_titles[platform_id]
+            for title, info in titles.items():
+                if title in platform_titles:
+                    # 合并排名
+                    merged = platform_titles[title].copy()
+                    merged["ranks"] = merged["ranks"] + info["ranks"]
+                    platform_titles[title] = merged
+                else:
+                    merged = info.copy()
+                    merged["ranks"] = list(info["ranks"])
+                    platform_titles[title] = merged
+
+        # 记录快照时间戳
+        all_timestamps[filename] = timestamp
+
+
+def _load_merged_day(
+    date_dir: str,
+    signatures: Dict[str, Tuple],
+    mtimes: Dict[str, float]
+) -> Tuple[List, Dict, Dict, Dict]:
+    """
+    读取并合并一天的全部快照（模块级函数，在进程池中执行）
+
+    只返回合并结果，传回主进程的数据量远小于逐个快照。
+
+    Returns:
+        (已合并的 [(文件名, 签名)], all_titles, id_to_name, all_timestamps)，
+        与 _day_cache 的条目结构一致
+    """
+    loaded = _read_snapshot_files(
+        date_dir,
+        [
+            filename[:-len(".txt")]
+            for filename, signature in signatures.items()
+            if signature[0] == "db"
+        ],
+        {
+            filename: mtimes[filename]
+            for filename, signature in signatures.items()
+            if signature[0] == "txt"
+        }
+    )
+
+    snapshots = [
+        (filename, signatures[filename], *loaded[filename])
+        for filename in sorted(loaded)
+    ]
+    all_titles, id_to_name, all_timestamps = {}, {}, {}
+    _merge_snapshots(snapshots, all_titles, id_to_name, all_timestamps)
+    return (
+        [(filename, signature) for filename, signature, *_ in snapshots],
+        all_titles, id_to_name, all_timestamps
+    )
 
 
 class ParserService:
@@ -67,81 +324,7 @@ class ParserService:
         Raises:
             FileParseError: 文件解析错误
         """
-        if not file_path.exists():
-            raise FileParseError(str(file_path), "文件不存在")
-
-        titles_by_id = {}
-        id_to_name = {}
-
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                sections = content.split("\n\n")
-
-                for section in sections:
-                    if not section.strip() or "==== 以下ID请求失败 ====" in section:
-                        continue
-
-                    lines = section.strip().split("\n")
-                    if len(lines) < 2:
-                        continue
-
-                    # 解析header: id | name 或 id
-                    header_line = lines[0].strip()
-                    if " | " in header_line:
-                        parts = header_line.split(" | ", 1)
-                        source_id = parts[0].strip()
-                        name = parts[1].strip()
-                        id_to_name[source_id] = name
-                    else:
-                        source_id = header_line
-                        id_to_name[source_id] = source_id
-
-                    titles_by_id[source_id] = {}
-
-                    # 解析标题行
-                    for line in lines[1:]:
-                        if line.strip():
-                            try:
-                                title_part = line.strip()
-                                rank = None
-
-                                # 提取排名
-                                if ". " in title_part and title_part.split(". ")[0].isdigit():
-                                    rank_str, title_part = title_part.split(". ", 1)
-                                    rank = int(rank_str)
-
-                                # 提取 MOBILE URL
-                                mobile_url = ""
-                                if " [MOBILE:" in title_part:
-                                    title_part, mobile_part = title_part.rsplit(" [MOBILE:", 1)
-                                    if mobile_part.endswith("]"):
-                                        mobile_url = mobile_part[:-1]
-
-                                # 提取 URL
-                                url = ""
-                                if " [URL:" in title_part:
-                                    title_part, url_part = title_part.rsplit(" [URL:", 1)
-                                    if url_part.endswith("]"):
-                                        url = url_part[:-1]
-
-                                title = self.clean_title(title_part.strip())
-                                ranks = [rank] if rank is not None else [1]
-
-                                titles_by_id[source_id][title] = {
-                                    "ranks": ranks,
-                                    "url": url,
-                                    "mobileUrl": mobile_url,
-                                }
-
-                            except Exception as e:
-                                # 忽略单行解析错误
-                                continue
-
-        except Exception as e:
-            raise FileParseError(str(file_path), str(e))
-
-        return titles_by_id, id_to_name
+        return _parse_txt_file(file_path)
 
     def get_date_folder_name(self, date: datetime = None) -> str:
         """
@@ -165,6 +348,9 @@ class ParserService:
         """
         读取指定日期的所有标题文件（带缓存）
 
+        每个快照的解析结果按 (路径, 修改时间, 大小) 缓存，当天的合并结果在
+        新快照到达时增量合并，因此新的一次爬取只需解析一个快照，且结果立即生效。
+
         Args:
             date: 日期对象，默认为今天
             platform_ids: 平台ID列表，None表示所有平台
@@ -178,86 +364,385 @@ class ParserService:
         Raises:
             DataNotFoundError: 数据不存在
         """
-        # 生成缓存键
-        date_str = self.get_date_folder_name(date)
-        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
-        cache_key = f"read_all_titles:{date_str}:{platform_key}"
+        return self._read_day(self.get_date_folder_name(date), platform_ids)
+
+    def _read_day(
+        self,
+        date_folder: str,
+        platform_ids: Optional[List[str]] = None,
+        preloaded: Optional[Tuple] = None
+    ) -> Tuple[Dict, Dict, Dict]:
+        """
+        读取并合并一天的快照，见 read_all_titles_for_date
+
+        Args:
+            date_folder: 日期文件夹名
+            platform_ids: 平台ID列表，None表示所有平台
+            preloaded: 进程池中合并好的 _day_cache 条目，快照未变化时直接使用
+        """
+        merged = self._get_merged_day(date_folder, preloaded)
+        if merged is None:
+            snapshots = self._load_day_snapshots(date_folder)
+            merged = self._merge_day_snapshots(date_folder, snapshots)
+        all_titles, id_to_name, all_timestamps = merged
+
+        # 如果指定了平台过滤
+        if platform_ids:
+            all_titles = {
+                platform_id: titles
+                for platform_id, titles in all_titles.items()
+                if platform_id in platform_ids
+            }
+
+        if not all_titles:
+            raise DataNotFoundError(
+                f"{date_folder} 没有有效的数据",
+                suggestion="请检查数据文件格式或重新运行爬虫"
+            )
+
+        return all_titles, id_to_name, all_timestamps
+
+    def _get_merged_day(
+        self, date_folder: str, preloaded: Optional[Tuple] = None
+    ) -> Optional[Tuple[Dict, Dict, Dict]]:
+        """
+        快照签名与已合并结果完全一致时直接返回合并结果，不再读取单个快照
+
+        Returns:
+            (all_titles, id_to_name, all_timestamps)，需要重新读取快照时返回 None
+        """
+        date_dir, signatures, _ = self._list_day_signatures(date_folder)
+        keys = sorted(signatures.items())
+        if not keys:
+            return None
+
+        with _cache_lock:
+            cached = _day_cache.get(date_folder)
+            if cached and cached[0] == keys:
+                _day_cache.move_to_end(date_folder)
+                return cached[1:]
+            if preloaded and preloaded[0] == keys:
+                _cache_put(_day_cache, date_folder, preloaded, DAY_CACHE_SIZE)
+                return preloaded[1:]
+        return None
+
+    def _merge_day_snapshots(
+        self, date_folder: str, snapshots: List[Tuple]
+    ) -> Tuple[Dict, Dict, Dict]:
+        """
+        合并一天的快照（增量）
+
+        已合并的快照序列是当前快照序列的前缀时只合并新增快照，否则从缓存的
+        单快照结果重新合并。合并采用写时复制，已返回给调用方的结果不会被修改。
+
+        Args:
+            date_folder: 日期文件夹名
+            snapshots: _load_day_snapshots 的返回值
+
+        Returns:
+            (all_titles, id_to_name, all_timestamps) 元组
+        """
+        keys = [(filename, signature) for filename, signature, *_ in snapshots]
+
+        with _cache_lock:
+            cached = _day_cache.get(date_folder)
+            if cached:
+                _day_cache.move_to_end(date_folder)
+
+        if cached and cached[0] == keys[:len(cached[0])]:
+            merged_keys, all_titles, id_to_name, all_timestamps = cached
+            if len(merged_keys) == len(keys):
+                return all_titles, id_to_name, all_timestamps
+            pending = snapshots[len(merged_keys):]
+            all_titles = {
+                platform_id: dict(titles)
+                for platform_id, titles in all_titles.items()
+            }
+            id_to_name = dict(id_to_name)
+            all_timestamps = dict(all_timestamps)
+        else:
+            pending = snapshots
+            all_titles = {}
+            id_to_name = {}
+            all_timestamps = {}
+
+        _merge_snapshots(pending, all_titles, id_to_name, all_timestamps)
+
+        with _cache_lock:
+            _cache_put(
+                _day_cache, date_folder,
+                (keys, all_titles, id_to_name, all_timestamps), DAY_CACHE_SIZE
+            )
+
+        return all_titles, id_to_name, all_timestamps
+
+    def read_day_snapshots(self, date_folder: str) -> List[Tuple[str, float, Dict, Dict]]:
+        """
+        读取某一天的全部快照
+
+        优先读取快照库 snapshots.db，库中没有的时间点再解析 txt 文件
+        （旧数据或只导出了 txt 的情况）。
+
+        Args:
+            date_folder: 日期文件夹名
+
+        Returns:
+            按时间排序的 [(文件名, 时间戳, titles_by_id, id_to_name)]
+
+        Raises:
+            DataNotFoundError: 数据不存在
+        """
+        return [
+            (filename, timestamp, titles_by_id, id_to_name)
+            for filename, _, timestamp, titles_by_id, id_to_name
+            in self._load_day_snapshots(date_folder)
+        ]
 
-        # 尝试从缓存获取
-        # 对于历史数据（非今天），使用更长的缓存时间（1小时）
-        # 对于今天的数据，使用较短的缓存时间（15分钟），因为可能有新数据
-        is_today = (date is None) or (date.date() == datetime.now().date())
-        ttl = 900 if is_today else 3600  # 15分钟 vs 1小时
+    def _list_day_signatures(self, date_folder: str) -> Tuple[Path, Dict, Dict]:
+        """
+        列出某一天的快照及其签名（不读取内容）
 
-        cached = self.cache.get(cache_key, ttl=ttl)
-        if cached:
-            return cached
+        txt 文件以 (修改时间, 大小) 为签名，快照库中的时间槽以写入时间为签名。
 
-        # 缓存未命中，读取文件
-        date_folder = self.get_date_folder_name(date)
-        txt_dir = self.project_root / "output" / date_folder / "txt"
+        Returns:
+            (日期目录, {文件名: 签名}, {txt 文件名: 修改时间})
 
-        if not txt_dir.exists():
+        Raises:
+            DataNotFoundError: 数据目录不存在
+        """
+        date_dir = self.project_root / "output" / date_folder
+        txt_dir = date_dir / "txt"
+        db_path = date_dir / SNAPSHOT_DB_NAME
+
+        if not txt_dir.exists() and not db_path.exists():
             raise DataNotFoundError(
                 f"未找到 {date_folder} 的数据目录",
                 suggestion="请先运行爬虫或检查日期是否正确"
             )
 
-        all_titles = {}
-        id_to_name = {}
-        all_timestamps = {}
+        signatures = {}
+        mtimes = {}
+        if db_path.exists():
+            try:
+                reader = SnapshotReader(db_path)
+                try:
+                    for time_info, created_at in reader.list_slots():
+                        signatures[f"{time_info}.txt"] = ("db", created_at)
+                finally:
+                    reader.close()
+            except sqlite3.Error as e:
+                print(f"Warning: 读取快照库 {db_path} 失败，改为解析txt文件: {e}")
+                signatures = {}
+
+        if txt_dir.exists():
+            for txt_file in txt_dir.glob("*.txt"):
+                if txt_file.name in signatures:
+                    continue
+                stat = txt_file.stat()
+                signatures[txt_file.name] = ("txt", stat.st_mtime_ns, stat.st_size)
+                mtimes[txt_file.name] = stat.st_mtime
+
+        return date_dir, signatures, mtimes
+
+    @staticmethod
+    def _find_cached_snapshots(
+        date_dir: Path, signatures: Dict, mtimes: Dict
+    ) -> Tuple[Dict, List[str], Dict[str, float]]:
+        """
+        按签名查找已缓存的快照
 
-        # 读取所有txt文件
-        txt_files = sorted(txt_dir.glob("*.txt"))
+        Returns:
+            (已缓存的 {文件名: 快照}, 需要从快照库读取的时间槽, 需要解析的 {txt 文件名: 修改时间})
+        """
+        snapshots = {}
+        missing_slots = []
+        missing_txt = {}
+        with _cache_lock:
+            for filename, signature in signatures.items():
+                cache_key = str(date_dir / filename)
+                cached = _snapshot_cache.get(cache_key)
+                if cached and cached[0] == signature:
+                    _snapshot_cache.move_to_end(cache_key)
+                    snapshots[filename] = cached[1]
+                elif signature[0] == "db":
+                    missing_slots.append(filename[:-len(".txt")])
+                else:
+                    missing_txt[filename] = mtimes[filename]
+        return snapshots, missing_slots, missing_txt
+
+    def _load_day_snapshots(self, date_folder: str) -> List[Tuple]:
+        """
+        读取某一天的全部快照（带单快照缓存）
 
-        if not txt_files:
+        签名未变化的快照直接复用缓存的解析结果。
+
+        Returns:
+            按时间排序的 [(文件名, 签名, 时间戳, titles_by_id, id_to_name)]
+
+        Raises:
+            DataNotFoundError: 数据不存在
+        """
+        date_dir, signatures, mtimes = self._list_day_signatures(date_folder)
+        snapshots, missing_slots, missing_txt = self._find_cached_snapshots(
+            date_dir, signatures, mtimes
+        )
+
+        loaded = {}
+        if missing_slots or missing_txt:
+            loaded = _read_snapshot_files(str(date_dir), missing_slots, missing_txt)
+
+        with _cache_lock:
+            for filename, snapshot in loaded.items():
+                _cache_put(
+                    _snapshot_cache, str(date_dir / filename),
+                    (signatures[filename], snapshot), SNAPSHOT_CACHE_SIZE
+                )
+        snapshots.update(loaded)
+
+        if not snapshots:
             raise DataNotFoundError(
                 f"{date_folder} 没有数据文件",
                 suggestion="请等待爬虫任务完成"
             )
 
-        for txt_file in txt_files:
-            try:
-                titles_by_id, file_id_to_name = self.parse_txt_file(txt_file)
+        return [
+            (filename, signatures[filename], *snapshots[filename])
+            for filename in sorted(snapshots)
+        ]
+
+    def read_titles_for_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]] = None
+    ) -> List[Tuple[datetime, Dict, Dict, Dict]]:
+        """
+        读取日期范围内每天的标题数据
 
-                # 更新id_to_name
-                id_to_name.update(file_id_to_name)
+        未缓存的快照较多时按天分发到进程池并行解析，再逐天合并（结果与逐天调用
+        read_all_titles_for_date 相同，并同样写入缓存）。
 
-                # 合并标题数据
-                for platform_id, titles in titles_by_id.items():
-                    # 如果指定了平台过滤
-                    if platform_ids and platform_id not in platform_ids:
-                        continue
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期
+            platform_ids: 平台ID列表，None表示所有平台
+
+        Returns:
+            按日期顺序的 [(日期, all_titles, id_to_name, all_timestamps)]，没有数据的日期跳过
+        """
+        dates = []
+        current_date = start_date
+        while current_date <= end_date:
+            dates.append(current_date)
+            current_date += timedelta(days=1)
+        return self.read_titles_for_dates(dates, platform_ids)
+
+    def read_titles_for_dates(
+        self,
+        dates: List[datetime],
+        platform_ids: Optional[List[str]] = None
+    ) -> List[Tuple[datetime, Dict, Dict, Dict]]:
+        """
+        读取多个日期的标题数据（见 read_titles_for_range）
 
-                    if platform_id not in all_titles:
-                        all_titles[platform_id] = {}
+        Args:
+            dates: 日期列表
+            platform_ids: 平台ID列表，None表示所有平台
 
-                    for title, info in titles.items():
-                        if title in all_titles[platform_id]:
-                            # 合并排名
-                            all_titles[platform_id][title]["ranks"].extend(info["ranks"])
-                        else:
-                            all_titles[platform_id][title] = info.copy()
+        Returns:
+            按给定顺序的 [(日期, all_titles, id_to_name, all_timestamps)]，没有数据的日期跳过
+        """
+        preloaded = self._preload_days(
+            [self.get_date_folder_name(date) for date in dates]
+        )
 
-                # 记录文件时间戳
-                all_timestamps[txt_file.name] = txt_file.stat().st_mtime
+        result = []
+        for date in dates:
+            date_folder = self.get_date_folder_name(date)
+            try:
+                all_titles, id_to_name, all_timestamps = self._read_day(
+                    date_folder, platform_ids, preloaded.get(date_folder)
+                )
+            except DataNotFoundError:
+                continue
+            result.append((date, all_titles, id_to_name, all_timestamps))
+        return result
+
+    def _preload_days(self, date_folders: List[str]) -> Dict[str, Tuple]:
+        """
+        用进程池并行读取并合并多天的快照
 
-            except Exception as e:
-                # 忽略单个文件的解析错误，继续处理其他文件
-                print(f"Warning: 解析文件 {txt_file} 失败: {e}")
+        已有合并结果或快照均已缓存的日期不参与；只有两天以上需要读取、
+        且可用进程数大于 1 时才使用进程池。进程池不可用时返回空字典，由调用方逐天读取。
+
+        Returns:
+            {日期文件夹: _day_cache 条目}
+        """
+        pending = {}
+        for date_folder in dict.fromkeys(date_folders):
+            try:
+                date_dir, signatures, mtimes = self._list_day_signatures(date_folder)
+            except DataNotFoundError:
                 continue
 
-        if not all_titles:
-            raise DataNotFoundError(
-                f"{date_folder} 没有有效的数据",
-                suggestion="请检查数据文件格式或重新运行爬虫"
+            with _cache_lock:
+                cached = _day_cache.get(date_folder)
+            if cached and cached[0] == sorted(signatures.items()):
+                continue
+
+            _, missing_slots, missing_txt = self._find_cached_snapshots(
+                date_dir, signatures, mtimes
             )
+            if missing_slots or missing_txt:
+                pending[date_folder] = (str(date_dir), signatures, mtimes)
 
-        # 缓存结果
-        result = (all_titles, id_to_name, all_timestamps)
-        self.cache.set(cache_key, result)
+        if len(pending) < 2 or RANGE_LOAD_MAX_WORKERS < 2:
+            return {}
 
-        return result
+        try:
+            pool = _get_range_load_pool()
+            futures = {
+                date_folder: pool.submit(_load_merged_day, *args)
+                for date_folder, args in pending.items()
+            }
+            return {
+                date_folder: future.result()
+                for date_folder, future in futures.items()
+            }
+        except (BrokenProcessPool, OSError) as e:
+            print(f"Warning: 并行读取快照失败，改为逐天读取: {e}")
+            _reset_range_load_pool()
+            return {}
+
+    def list_day_snapshot_times(self, date_folder: str) -> Set[str]:
+        """
+        列出某一天全部快照的时间（不解析内容）
+
+        Args:
+            date_folder: 日期文件夹名
+
+        Returns:
+            快照时间集合（与 txt 文件名去掉扩展名相同），没有数据时为空集合
+        """
+        date_dir = self.project_root / "output" / date_folder
+        txt_dir = date_dir / "txt"
+        db_path = date_dir / SNAPSHOT_DB_NAME
+
+        time_infos = set()
+        if db_path.exists():
+            try:
+                reader = SnapshotReader(db_path)
+                try:
+                    time_infos.update(reader.list_time_infos())
+                finally:
+                    reader.close()
+            except sqlite3.Error as e:
+                print(f"Warning: 读取快照库 {db_path} 失败: {e}")
+
+        if txt_dir.exists():
+            time_infos.update(txt_file.stem for txt_file in txt_dir.glob("*.txt"))
+
+        return time_infos
 
     def parse_yaml_config(self, config_path: str = None) -> dict:
         """
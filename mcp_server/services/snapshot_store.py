@@ -0,0 +1,154 @@
+"""
+快照库读取服务
+
+读取爬虫写入的每日快照库（output/<日期>/snapshots.db）。
+库结构与项目根目录 utils/snapshot_store.py 的写入端保持一致：
+内容与当天已有时间槽相同的平台只记录 base_slot_id，标题记录从被引用的时间槽读取。
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+
+SNAPSHOT_DB_NAME = "snapshots.db"
+
+
+def connect_readonly(db_path: Path) -> sqlite3.Connection:
+    """
+    以只读方式打开 SQLite 库
+
+    路径需转成转义后的 file: URI，否则路径中的 #、?、% 会截断路径并丢掉 mode=ro。
+
+    Args:
+        db_path: 库文件路径
+
+    Returns:
+        只读连接
+    """
+    uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+    return sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+
+class SnapshotReader:
+    """每日快照库的只读访问"""
+
+    def __init__(self, db_path: Path):
+        """
+        打开快照库（只读）
+
+        Args:
+            db_path: 快照库文件路径
+        """
+        self.db_path = Path(db_path)
+        self.conn = connect_readonly(self.db_path)
+
+    def close(self) -> None:
+        """关闭连接"""
+        self.conn.close()
+
+    def list_time_infos(self) -> Set[str]:
+        """返回库中全部时间槽的 time_info"""
+        return {row[0] for row in self.conn.execute("SELECT time_info FROM slots")}
+
+    def _load_strings(self, table: str) -> List[str]:
+        """读取字典表，返回按 id 下标的字符串列表"""
+        values = [""]
+        for ref, value in self.conn.execute(f"SELECT id, value FROM {table} ORDER BY id"):
+            values.extend([""] * (ref - len(values)))
+            values.append(value)
+        return values
+
+    def _has_base_slots(self) -> bool:
+        """库中是否有 base_slot_id 列（旧版本建的库没有）"""
+        return any(
+            row[1] == "base_slot_id"
+            for row in self.conn.execute("PRAGMA table_info(slot_sources)")
+        )
+
+    def list_slots(self) -> List[Tuple[str, float]]:
+        """按时间顺序返回 [(time_info, 写入时间戳)]，不读取标题数据"""
+        return self.conn.execute(
+            "SELECT time_info, created_at FROM slots ORDER BY time_info"
+        ).fetchall()
+
+    def iter_snapshots(
+        self, time_infos: Optional[List[str]] = None
+    ) -> Iterator[Tuple[str, float, Dict, Dict]]:
+        """
+        按时间顺序读取时间槽
+
+        Args:
+            time_infos: 只读取这些时间槽，None 表示全部
+
+        Returns:
+            (time_info, 写入时间戳, titles_by_id, id_to_name) 迭代器，
+            titles_by_id 的结构与解析 txt 文件得到的结果一致
+        """
+        slot_filter = ""
+        params: List = []
+        if time_infos is not None:
+            if not time_infos:
+                return
+            slot_filter = f"WHERE sl.time_info IN ({','.join('?' * len(time_infos))})"
+            params = list(time_infos)
+
+        source_ids = self._load_strings("sources")
+        titles = self._load_strings("titles")
+        urls = self._load_strings("urls")
+
+        # 引用其他时间槽内容的平台，从被引用的时间槽读取标题记录
+        owner_column = (
+            "COALESCE(ss.base_slot_id, ss.slot_id)"
+            if self._has_base_slots()
+            else "ss.slot_id"
+        )
+
+        slots = {}
+        # {(保存内容的时间槽 id, 平台引用): [需要填充的标题字典]}
+        targets: Dict[Tuple[int, int], List[Dict]] = {}
+        for slot_id, time_info, created_at, source_ref, name, owner_id in self.conn.execute(
+            f"SELECT sl.id, sl.time_info, sl.created_at, ss.source_ref, ss.name, {owner_column} "
+            "FROM slots sl JOIN slot_sources ss ON ss.slot_id = sl.id "
+            f"{slot_filter} "
+            "ORDER BY sl.time_info, ss.position",
+            params,
+        ):
+            if slot_id not in slots:
+                slots[slot_id] = (time_info, created_at, {}, {})
+            source_titles = {}
+            slots[slot_id][2][source_ids[source_ref]] = source_titles
+            slots[slot_id][3][source_ids[source_ref]] = name
+            targets.setdefault((owner_id, source_ref), []).append(source_titles)
+
+        if not slots:
+            return
+
+        appearance_filter = ""
+        owner_ids = sorted({owner_id for owner_id, _ in targets})
+        if time_infos is not None:
+            appearance_filter = f"WHERE slot_id IN ({','.join('?' * len(owner_ids))})"
+
+        current_key = None
+        source_targets = ()
+        for slot_id, source_ref, title_ref, rank, url_ref, mobile_url_ref in self.conn.execute(
+            "SELECT slot_id, source_ref, title_ref, rank, url_ref, mobile_url_ref "
+            f"FROM appearances {appearance_filter} "
+            "ORDER BY slot_id, source_ref, position",
+            owner_ids if appearance_filter else [],
+        ):
+            if (slot_id, source_ref) != current_key:
+                current_key = (slot_id, source_ref)
+                source_targets = targets.get(current_key, ())
+            title = titles[title_ref]
+            url = urls[url_ref]
+            mobile_url = urls[mobile_url_ref]
+            for source_titles in source_targets:
+                source_titles[title] = {
+                    "ranks": [rank],
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+
+        for snapshot in sorted(slots.values(), key=lambda slot: slot[0]):
+            yield snapshot
@@ -19,6 +19,8 @@ from ..utils.validators import (
     validate_date_range
 )
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
+from ..utils.keyword_rollup import KeywordRollup
+from ..utils.tokenizer import extract_keywords
 
 
 def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
@@ -306,38 +308,33 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
+            # 一次取回日期范围内包含话题的标题
+            daily_titles = {
+                date.strftime("%Y-%m-%d"): all_titles
+                for date, all_titles, _ in self.data_service.iter_titles_by_date(
+                    start_date, end_date, keyword=topic
+                )
+            }
+
             # 收集趋势数据
             trend_data = []
             current_date = start_date
 
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该时间点的话题出现次数
-                    count = 0
-                    matched_titles = []
-
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-                                matched_titles.append(title)
-
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count,
-                        "sample_titles": matched_titles[:3]  # 只保留前3个样本
-                    })
+                date_str = current_date.strftime("%Y-%m-%d")
 
-                except DataNotFoundError:
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0,
-                        "sample_titles": []
-                    })
+                # 统计该时间点的话题出现次数
+                matched_titles = [
+                    title
+                    for titles in daily_titles.get(date_str, {}).values()
+                    for title in titles.keys()
+                ]
+
+                trend_data.append({
+                    "date": date_str,
+                    "count": len(matched_titles),
+                    "sample_titles": matched_titles[:3]  # 只保留前3个样本
+                })
 
                 # 按天增加时间
                 current_date += timedelta(days=1)
@@ -449,32 +446,23 @@ class AnalyticsTools:
             })
 
             # 遍历日期范围
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
+            for _, all_titles, id_to_name in self.data_service.iter_titles_by_date(
+                start_date, end_date
+            ):
+                for platform_id, titles in all_titles.items():
+                    platform_name = id_to_name.get(platform_id, platform_id)
 
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-
-                        for title in titles.keys():
-                            platform_stats[platform_name]["total_news"] += 1
-                            platform_stats[platform_name]["unique_titles"].add(title)
-
-                            # 如果指定了话题，统计包含话题的新闻
-                            if topic and topic.lower() in title.lower():
-                                platform_stats[platform_name]["topic_mentions"] += 1
+                    for title in titles.keys():
+                        platform_stats[platform_name]["total_news"] += 1
+                        platform_stats[platform_name]["unique_titles"].add(title)
 
-                            # 提取关键词（简单分词）
-                            keywords = self._extract_keywords(title)
-                            platform_stats[platform_name]["top_keywords"].update(keywords)
+                        # 如果指定了话题，统计包含话题的新闻
+                        if topic and topic.lower() in title.lower():
+                            platform_stats[platform_name]["topic_mentions"] += 1
 
-                except DataNotFoundError:
-                    pass
-
-                current_date += timedelta(days=1)
+                        # 提取关键词（简单分词）
+                        keywords = self._extract_keywords(title)
+                        platform_stats[platform_name]["top_keywords"].update(keywords)
 
             # 转换为可序列化的格式
             result_stats = {}
@@ -691,46 +679,31 @@ class AnalyticsTools:
                 # 默认今天
                 start_date = end_date = datetime.now()
 
-            # 收集新闻数据（支持多天）
+            # 收集新闻数据（支持多天，指定话题时只取回包含话题的标题）
             all_news_items = []
-            current_date = start_date
 
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
-
-                    # 收集该日期的新闻
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-                        for title, info in titles.items():
-                            # 如果指定了话题，只收集包含话题的标题
-                            if topic and topic.lower() not in title.lower():
-                                continue
-
-                            news_item = {
-                                "platform": platform_name,
-                                "title": title,
-                                "ranks": info.get("ranks", []),
-                                "count": len(info.get("ranks", [])),
-                                "date": current_date.strftime("%Y-%m-%d")
-                            }
-
-                            # 条件性添加 URL 字段
-                            if include_url:
-                                news_item["url"] = info.get("url", "")
-                                news_item["mobileUrl"] = info.get("mobileUrl", "")
-
-                            all_news_items.append(news_item)
+            for current_date, all_titles, id_to_name in self.data_service.iter_titles_by_date(
+                start_date, end_date, platforms=platforms, keyword=topic
+            ):
+                # 收集该日期的新闻
+                for platform_id, titles in all_titles.items():
+                    platform_name = id_to_name.get(platform_id, platform_id)
+                    for title, info in titles.items():
+                        news_item = {
+                            "platform": platform_name,
+                            "title": title,
+                            # 复制一份，去重合并时不能修改缓存中的排名列表
+                            "ranks": list(info.get("ranks", [])),
+                            "count": len(info.get("ranks", [])),
+                            "date": current_date.strftime("%Y-%m-%d")
+                        }
 
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
+                        # 条件性添加 URL 字段
+                        if include_url:
+                            news_item["url"] = info.get("url", "")
+                            news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-                # 下一天
-                current_date += timedelta(days=1)
+                        all_news_items.append(news_item)
 
             if not all_news_items:
                 time_desc = "今天" if start_date == end_date else f"{start_date.strftime('%Y-%m-%d')} 至 {end_date.strftime('%Y-%m-%d')}"
@@ -953,36 +926,34 @@ class AnalyticsTools:
 
             limit = validate_limit(limit, default=50)
 
-            # 读取数据
-            all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date()
+            # 读取数据（带相似度候选索引）
+            index, id_to_name = self.data_service.get_title_index()
 
-            # 计算相似度
+            # 只对字符重合度可能达到阈值的候选标题计算相似度（按原顺序）
             similar_items = []
 
-            for platform_id, titles in all_titles.items():
-                platform_name = id_to_name.get(platform_id, platform_id)
-
-                for title, info in titles.items():
-                    if title == reference_title:
-                        continue
+            for entry_id in sorted(index.similarity_candidates(reference_title, threshold)):
+                platform_id, title, info = index.entries[entry_id]
+                if title == reference_title:
+                    continue
 
-                    # 计算相似度
-                    similarity = self._calculate_similarity(reference_title, title)
+                # 计算相似度
+                similarity = self._calculate_similarity(reference_title, title)
 
-                    if similarity >= threshold:
-                        news_item = {
-                            "title": title,
-                            "platform": platform_id,
-                            "platform_name": platform_name,
-                            "similarity": round(similarity, 3),
-                            "rank": info["ranks"][0] if info["ranks"] else 0
-                        }
+                if similarity >= threshold:
+                    news_item = {
+                        "title": title,
+                        "platform": platform_id,
+                        "platform_name": id_to_name.get(platform_id, platform_id),
+                        "similarity": round(similarity, 3),
+                        "rank": info["ranks"][0] if info["ranks"] else 0
+                    }
 
-                        # 条件性添加 URL 字段
-                        if include_url:
-                            news_item["url"] = info.get("url", "")
+                    # 条件性添加 URL 字段
+                    if include_url:
+                        news_item["url"] = info.get("url", "")
 
-                        similar_items.append(news_item)
+                    similar_items.append(news_item)
 
             # 按相似度排序
             similar_items.sort(key=lambda x: x["similarity"], reverse=True)
@@ -1207,32 +1178,23 @@ class AnalyticsTools:
             all_platforms_news = defaultdict(int)
             all_titles_list = []
 
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-                        all_platforms_news[platform_name] += len(titles)
-
-                        for title in titles.keys():
-                            all_titles_list.append({
-                                "title": title,
-                                "platform": platform_name,
-                                "date": current_date.strftime("%Y-%m-%d")
-                            })
+            for current_date, all_titles, id_to_name, _ in self.data_service.parser.read_titles_for_range(
+                start_date, end_date
+            ):
+                for platform_id, titles in all_titles.items():
+                    platform_name = id_to_name.get(platform_id, platform_id)
+                    all_platforms_news[platform_name] += len(titles)
 
-                            # 提取关键词
-                            keywords = self._extract_keywords(title)
-                            all_keywords.update(keywords)
-
-                except DataNotFoundError:
-                    pass
+                    for title in titles.keys():
+                        all_titles_list.append({
+                            "title": title,
+                            "platform": platform_name,
+                            "date": current_date.strftime("%Y-%m-%d")
+                        })
 
-                current_date += timedelta(days=1)
+                        # 提取关键词
+                        keywords = self._extract_keywords(title)
+                        all_keywords.update(keywords)
 
             # 生成报告
             report_title = f"{'每日' if report_type == 'daily' else '每周'}新闻热点摘要"
@@ -1380,34 +1342,25 @@ class AnalyticsTools:
             })
 
             # 遍历日期范围
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-
-                        platform_activity[platform_name]["news_count"] += len(titles)
-                        platform_activity[platform_name]["days_active"].add(current_date.strftime("%Y-%m-%d"))
-
-                        # 统计更新次数（基于文件数量）
-                        platform_activity[platform_name]["total_updates"] += len(timestamps)
-
-                        # 统计时间分布（基于文件名中的时间）
-                        for filename in timestamps.keys():
-                            # 解析文件名中的小时（格式：HHMM.txt）
-                            match = re.match(r'(\d{2})(\d{2})\.txt', filename)
-                            if match:
-                                hour = int(match.group(1))
-                                platform_activity[platform_name]["hourly_distribution"][hour] += 1
-
-                except DataNotFoundError:
-                    pass
-
-                current_date += timedelta(days=1)
+            for current_date, all_titles, id_to_name, timestamps in self.data_service.parser.read_titles_for_range(
+                start_date, end_date
+            ):
+                for platform_id, titles in all_titles.items():
+                    platform_name = id_to_name.get(platform_id, platform_id)
+
+                    platform_activity[platform_name]["news_count"] += len(titles)
+                    platform_activity[platform_name]["days_active"].add(current_date.strftime("%Y-%m-%d"))
+
+                    # 统计更新次数（基于文件数量）
+                    platform_activity[platform_name]["total_updates"] += len(timestamps)
+
+                    # 统计时间分布（基于文件名中的时间）
+                    for filename in timestamps.keys():
+                        # 解析文件名中的小时（格式：HHMM.txt）
+                        match = re.match(r'(\d{2})(\d{2})\.txt', filename)
+                        if match:
+                            hour = int(match.group(1))
+                            platform_activity[platform_name]["hourly_distribution"][hour] += 1
 
             # 转换为可序列化的格式
             result_activity = {}
@@ -1507,32 +1460,23 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
+            # 一次取回日期范围内包含话题的标题
+            daily_counts = {
+                date.strftime("%Y-%m-%d"): sum(len(titles) for titles in all_titles.values())
+                for date, all_titles, _ in self.data_service.iter_titles_by_date(
+                    start_date, end_date, keyword=topic
+                )
+            }
+
             # 收集话题历史数据
             lifecycle_data = []
             current_date = start_date
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该日的话题出现次数
-                    count = 0
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count
-                    })
-
-                except DataNotFoundError:
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0
-                    })
+                date_str = current_date.strftime("%Y-%m-%d")
+                lifecycle_data.append({
+                    "date": date_str,
+                    "count": daily_counts.get(date_str, 0)
+                })
 
                 current_date += timedelta(days=1)
 
@@ -1659,43 +1603,22 @@ class AnalyticsTools:
 
             time_window = validate_limit(time_window, default=24, max_limit=72)
 
-            # 读取当前和之前的数据
-            current_all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
+            # 读取当前的关键词汇总
+            current_rollup = self.data_service.get_keyword_rollup()
 
-            # 读取昨天的数据作为基准
+            # 读取昨天的关键词汇总作为基准
             yesterday = datetime.now() - timedelta(days=1)
             try:
-                previous_all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                    date=yesterday
-                )
+                previous_rollup = self.data_service.get_keyword_rollup(date=yesterday)
             except DataNotFoundError:
-                previous_all_titles = {}
-
-            # 统计当前的关键词频率
-            current_keywords = Counter()
-            current_keyword_titles = defaultdict(list)
-
-            for _, titles in current_all_titles.items():
-                for title in titles.keys():
-                    keywords = self._extract_keywords(title)
-                    current_keywords.update(keywords)
-
-                    for kw in keywords:
-                        current_keyword_titles[kw].append(title)
-
-            # 统计之前的关键词频率
-            previous_keywords = Counter()
-
-            for _, titles in previous_all_titles.items():
-                for title in titles.keys():
-                    keywords = self._extract_keywords(title)
-                    previous_keywords.update(keywords)
+                previous_rollup = KeywordRollup({})
 
             # 检测异常热度
             viral_topics = []
 
-            for keyword, current_count in current_keywords.items():
-                previous_count = previous_keywords.get(keyword, 0)
+            for keyword, stats in current_rollup.keywords.items():
+                current_count = stats.count
+                previous_count = previous_rollup.count(keyword)
 
                 # 计算增长倍数
                 if previous_count == 0:
@@ -1715,7 +1638,7 @@ class AnalyticsTools:
                         "current_count": current_count,
                         "previous_count": previous_count,
                         "growth_rate": round(growth_rate, 2) if growth_rate != float('inf') else "新话题",
-                        "sample_titles": current_keyword_titles[keyword][:3],
+                        "sample_titles": list(stats.sample_titles),
                         "alert_level": "高" if growth_rate > threshold * 2 else "中"
                     })
 
@@ -1802,41 +1725,21 @@ class AnalyticsTools:
                 date = datetime.now() - timedelta(days=days_ago)
 
                 try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=date
-                    )
-
-                    # 统计关键词
-                    keywords_count = Counter()
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            keywords = self._extract_keywords(title)
-                            keywords_count.update(keywords)
+                    rollup = self.data_service.get_keyword_rollup(date=date)
 
                     # 记录每个关键词的历史数据
-                    for keyword, count in keywords_count.items():
-                        keyword_trends[keyword].append(count)
+                    for keyword, stats in rollup.keywords.items():
+                        keyword_trends[keyword].append(stats.count)
 
                 except DataNotFoundError:
                     pass
 
             # 添加今天的数据
             try:
-                all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
+                today_rollup = self.data_service.get_keyword_rollup()
 
-                keywords_count = Counter()
-                keyword_titles = defaultdict(list)
-
-                for _, titles in all_titles.items():
-                    for title in titles.keys():
-                        keywords = self._extract_keywords(title)
-                        keywords_count.update(keywords)
-
-                        for kw in keywords:
-                            keyword_titles[kw].append(title)
-
-                for keyword, count in keywords_count.items():
-                    keyword_trends[keyword].append(count)
+                for keyword, stats in today_rollup.keywords.items():
+                    keyword_trends[keyword].append(stats.count)
 
             except DataNotFoundError:
                 raise DataNotFoundError(
@@ -1885,7 +1788,7 @@ class AnalyticsTools:
                             "confidence": round(confidence, 2),
                             "trend_data": trend_data,
                             "prediction": "上升趋势，可能成为热点",
-                            "sample_titles": keyword_titles.get(keyword, [])[:3]
+                            "sample_titles": today_rollup.sample_titles(keyword)
                         })
 
             # 按置信度和增长率排序
@@ -1922,7 +1825,7 @@ class AnalyticsTools:
 
     def _extract_keywords(self, title: str, min_length: int = 2) -> List[str]:
         """
-        从标题中提取关键词（简单实现）
+        从标题中提取关键词（同一标题在进程内只分词一次）
 
         Args:
             title: 标题文本
@@ -1931,22 +1834,7 @@ class AnalyticsTools:
         Returns:
             关键词列表
         """
-        # 移除URL和特殊字符
-        title = re.sub(r'http[s]?://\S+', '', title)
-        title = re.sub(r'[^\w\s]', ' ', title)
-
-        # 简单分词（按空格和常见分隔符）
-        words = re.split(r'[\s，。！？、]+', title)
-
-        # 过滤停用词和短词
-        stopwords = {'的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这'}
-
-        keywords = [
-            word.strip() for word in words
-            if word.strip() and len(word.strip()) >= min_length and word.strip() not in stopwords
-        ]
-
-        return keywords
+        return extract_keywords(title, min_length)
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """
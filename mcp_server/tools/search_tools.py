@@ -4,7 +4,6 @@
 提供模糊搜索、链接查询、历史相关新闻检索等高级搜索功能。
 """
 
-import re
 from collections import Counter
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
@@ -12,7 +11,9 @@ from typing import Dict, List, Optional, Tuple
 
 from ..services.data_service import DataService
 from ..utils.validators import validate_keyword, validate_limit
-from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
+from ..utils.errors import MCPError, InvalidParameterError
+from ..utils.similarity_index import TitleSimilarityIndex
+from ..utils.tokenizer import SEARCH_STOPWORDS, extract_keywords
 
 
 class SearchTools:
@@ -27,13 +28,7 @@ class SearchTools:
         """
         self.data_service = DataService(project_root)
         # 中文停用词列表
-        self.stopwords = {
-            '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一',
-            '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有',
-            '看', '好', '自己', '这', '那', '来', '被', '与', '为', '对', '将', '从',
-            '以', '及', '等', '但', '或', '而', '于', '中', '由', '可', '可以', '已',
-            '已经', '还', '更', '最', '再', '因为', '所以', '如果', '虽然', '然而'
-        }
+        self.stopwords = SEARCH_STOPWORDS
 
     def search_news_unified(
         self,
@@ -122,24 +117,25 @@ class SearchTools:
 
             # 收集所有匹配的新闻
             all_matches = []
-            current_date = start_date
-
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
 
+            if search_mode == "fuzzy":
+                # 模糊模式按天使用相似度候选索引，只对候选标题做精确匹配
+                for current_date, index, id_to_name in self.data_service.iter_title_indexes(
+                    start_date, end_date, platforms=platforms
+                ):
+                    all_matches.extend(self._search_by_fuzzy_mode(
+                        query, index, id_to_name, current_date, threshold, include_url
+                    ))
+            else:
+                # keyword/entity 模式的结果一定包含查询词，只需取回包含查询词的标题
+                for current_date, all_titles, id_to_name in self.data_service.iter_titles_by_date(
+                    start_date, end_date, platforms=platforms, keyword=query
+                ):
                     # 根据搜索模式执行不同的搜索逻辑
                     if search_mode == "keyword":
                         matches = self._search_by_keyword_mode(
                             query, all_titles, id_to_name, current_date, include_url
                         )
-                    elif search_mode == "fuzzy":
-                        matches = self._search_by_fuzzy_mode(
-                            query, all_titles, id_to_name, current_date, threshold, include_url
-                        )
                     else:  # entity
                         matches = self._search_by_entity_mode(
                             query, all_titles, id_to_name, current_date, include_url
@@ -147,12 +143,6 @@ class SearchTools:
 
                     all_matches.extend(matches)
 
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
-
-                current_date += timedelta(days=1)
-
             if not all_matches:
                 # 获取可用日期范围用于错误提示
                 earliest, latest = self.data_service.get_available_date_range()
@@ -291,7 +281,7 @@ class SearchTools:
     def _search_by_fuzzy_mode(
         self,
         query: str,
-        all_titles: Dict,
+        index: TitleSimilarityIndex,
         id_to_name: Dict,
         current_date: datetime,
         threshold: float,
@@ -300,9 +290,12 @@ class SearchTools:
         """
         模糊搜索模式（使用相似度算法）
 
+        _fuzzy_match 命中的标题必然包含查询文本、字符重合度达到阈值、
+        或与查询有相同关键词之一，先用索引取出这三类候选，再逐条精确匹配。
+
         Args:
             query: 搜索内容
-            all_titles: 所有标题字典
+            index: 当天标题的相似度候选索引
             id_to_name: 平台ID到名称映射
             current_date: 当前日期
             threshold: 相似度阈值
@@ -312,31 +305,36 @@ class SearchTools:
         """
         matches = []
 
-        for platform_id, titles in all_titles.items():
-            platform_name = id_to_name.get(platform_id, platform_id)
+        candidates = index.containing_candidates(query, lower=True)
+        candidates |= index.similarity_candidates(query, threshold, lower=True)
+        candidates |= index.keyword_candidates(
+            self._extract_keywords(query), self._extract_keywords, "search_tools"
+        )
+
+        for entry_id in sorted(candidates):
+            platform_id, title, info = index.entries[entry_id]
+
+            # 模糊匹配
+            is_match, similarity = self._fuzzy_match(query, title, threshold)
+
+            if is_match:
+                news_item = {
+                    "title": title,
+                    "platform": platform_id,
+                    "platform_name": id_to_name.get(platform_id, platform_id),
+                    "date": current_date.strftime("%Y-%m-%d"),
+                    "similarity_score": round(similarity, 4),
+                    "ranks": info.get("ranks", []),
+                    "count": len(info.get("ranks", [])),
+                    "rank": info["ranks"][0] if info["ranks"] else 999
+                }
 
-            for title, info in titles.items():
-                # 模糊匹配
-                is_match, similarity = self._fuzzy_match(query, title, threshold)
+                # 条件性添加 URL 字段
+                if include_url:
+                    news_item["url"] = info.get("url", "")
+                    news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-                if is_match:
-                    news_item = {
-                        "title": title,
-                        "platform": platform_id,
-                        "platform_name": platform_name,
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "similarity_score": round(similarity, 4),
-                        "ranks": info.get("ranks", []),
-                        "count": len(info.get("ranks", [])),
-                        "rank": info["ranks"][0] if info["ranks"] else 999
-                    }
-
-                    # 条件性添加 URL 字段
-                    if include_url:
-                        news_item["url"] = info.get("url", "")
-                        news_item["mobileUrl"] = info.get("mobileUrl", "")
-
-                    matches.append(news_item)
+                matches.append(news_item)
 
         return matches
 
@@ -441,7 +439,7 @@ class SearchTools:
 
     def _extract_keywords(self, text: str, min_length: int = 2) -> List[str]:
         """
-        从文本中提取关键词
+        从文本中提取关键词（移除方括号内容，同一文本在进程内只分词一次）
 
         Args:
             text: 输入文本
@@ -450,46 +448,7 @@ class SearchTools:
         Returns:
             关键词列表
         """
-        # 移除URL和特殊字符
-        text = re.sub(r'http[s]?://\S+', '', text)
-        text = re.sub(r'\[.*?\]', '', text)  # 移除方括号内容
-
-        # 使用正则表达式分词（中文和英文）
-        words = re.findall(r'[\w]+', text)
-
-        # 过滤停用词和短词
-        keywords = [
-            word for word in words
-            if word and len(word) >= min_length and word not in self.stopwords
-        ]
-
-        return keywords
-
-    def _calculate_keyword_overlap(self, keywords1: List[str], keywords2: List[str]) -> float:
-        """
-        计算两个关键词列表的重合度
-
-        Args:
-            keywords1: 关键词列表1
-            keywords2: 关键词列表2
-
-        Returns:
-            重合度分数 (0-1之间)
-        """
-        if not keywords1 or not keywords2:
-            return 0.0
-
-        set1 = set(keywords1)
-        set2 = set(keywords2)
-
-        # Jaccard 相似度
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-
-        if union == 0:
-            return 0.0
-
-        return intersection / union
+        return extract_keywords(text, min_length, self.stopwords, strip_brackets=True)
 
     def search_related_news_history(
         self,
@@ -574,63 +533,72 @@ class SearchTools:
 
             # 收集所有相关新闻
             all_related_news = []
-            current_date = search_start
 
-            while current_date <= search_end:
+            for current_date, index, id_to_name in self.data_service.iter_title_indexes(
+                search_start, search_end
+            ):
                 try:
-                    # 读取该日期的数据
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(current_date)
+                    # 关键词重合度（去重后的 Jaccard 相似度）由倒排表直接算出，
+                    # 文本相似度取字符重合上界，综合得分上界达不到 threshold 的标题直接跳过；
+                    # 与参考文本没有相同字符的标题文本相似度为 0，不必计算
+                    keyword_overlaps = index.keyword_jaccards(
+                        reference_keywords, self._extract_keywords, "search_tools"
+                    )
+                    similarity_bounds = index.similarity_bounds(reference_text, lower=True)
+                    if threshold > 0:
+                        candidates = sorted(
+                            entry_id
+                            for entry_id in keyword_overlaps.keys() | similarity_bounds.keys()
+                            if keyword_overlaps.get(entry_id, 0.0) * 0.7
+                            + similarity_bounds.get(entry_id, 0.0) * 0.3
+                            >= threshold - 1e-9
+                        )
+                    else:
+                        candidates = range(len(index.entries))
 
                     # 搜索相关新闻
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
+                    for entry_id in candidates:
+                        platform_id, title, info = index.entries[entry_id]
 
-                        for title, info in titles.items():
-                            # 计算标题相似度
+                        # 计算标题相似度
+                        if entry_id in similarity_bounds:
                             title_similarity = self._calculate_similarity(reference_text, title)
+                        else:
+                            title_similarity = 0.0
+
+                        # 关键词重合度
+                        keyword_overlap = keyword_overlaps.get(entry_id, 0.0)
 
+                        # 综合相似度 (70% 关键词重合 + 30% 文本相似度)
+                        combined_score = keyword_overlap * 0.7 + title_similarity * 0.3
+
+                        if combined_score >= threshold:
                             # 提取标题关键词
                             title_keywords = self._extract_keywords(title)
 
-                            # 计算关键词重合度
-                            keyword_overlap = self._calculate_keyword_overlap(
-                                reference_keywords,
-                                title_keywords
-                            )
-
-                            # 综合相似度 (70% 关键词重合 + 30% 文本相似度)
-                            combined_score = keyword_overlap * 0.7 + title_similarity * 0.3
-
-                            if combined_score >= threshold:
-                                news_item = {
-                                    "title": title,
-                                    "platform": platform_id,
-                                    "platform_name": platform_name,
-                                    "date": current_date.strftime("%Y-%m-%d"),
-                                    "similarity_score": round(combined_score, 4),
-                                    "keyword_overlap": round(keyword_overlap, 4),
-                                    "text_similarity": round(title_similarity, 4),
-                                    "common_keywords": list(set(reference_keywords) & set(title_keywords)),
-                                    "rank": info["ranks"][0] if info["ranks"] else 0
-                                }
-
-                                # 条件性添加 URL 字段
-                                if include_url:
-                                    news_item["url"] = info.get("url", "")
-                                    news_item["mobileUrl"] = info.get("mobileUrl", "")
-
-                                all_related_news.append(news_item)
-
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
+                            news_item = {
+                                "title": title,
+                                "platform": platform_id,
+                                "platform_name": id_to_name.get(platform_id, platform_id),
+                                "date": current_date.strftime("%Y-%m-%d"),
+                                "similarity_score": round(combined_score, 4),
+                                "keyword_overlap": round(keyword_overlap, 4),
+                                "text_similarity": round(title_similarity, 4),
+                                "common_keywords": list(set(reference_keywords) & set(title_keywords)),
+                                "rank": info["ranks"][0] if info["ranks"] else 0
+                            }
+
+                            # 条件性添加 URL 字段
+                            if include_url:
+                                news_item["url"] = info.get("url", "")
+                                news_item["mobileUrl"] = info.get("mobileUrl", "")
+
+                            all_related_news.append(news_item)
+
                 except Exception as e:
                     # 记录错误但继续处理其他日期
                     print(f"Warning: 处理日期 {current_date.strftime('%Y-%m-%d')} 时出错: {e}")
 
-                # 移动到下一天
-                current_date += timedelta(days=1)
-
             if not all_related_news:
                 return {
                     "success": True,
@@ -339,6 +339,9 @@ class SystemManagementTools:
                     with open(html_file_path, "w", encoding="utf-8") as f:
                         f.write(html_content)
 
+                    # 让目录册在下次查询时立即统计新写入的文件
+                    self.data_service.catalog.invalidate()
+
                     print(f"数据已保存到:")
                     print(f"  TXT: {txt_file_path}")
                     print(f"  HTML: {html_file_path}")
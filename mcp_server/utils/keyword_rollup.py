@@ -0,0 +1,76 @@
+"""
+每日关键词汇总
+
+把一天的标题按关键词汇总为 {关键词: 出现次数、出现平台、最佳排名、样本标题}，
+按关键词首次出现的顺序排列（与逐条 Counter 统计的顺序一致）。
+热度检测、话题预测等工具直接读取汇总，不再逐条分词统计。
+"""
+
+from typing import Callable, Dict, List, Optional
+
+from .tokenizer import extract_keywords
+
+
+# 每个关键词保留的样本标题数
+SAMPLE_SIZE = 3
+
+
+class KeywordStats:
+    """单个关键词在一天内的统计"""
+
+    __slots__ = ("count", "platforms", "best_rank", "sample_titles")
+
+    def __init__(self):
+        self.count = 0
+        # 按首次出现顺序排列的平台ID（dict 作为有序集合）
+        self.platforms: Dict[str, None] = {}
+        self.best_rank: Optional[int] = None
+        self.sample_titles: List[str] = []
+
+
+class KeywordRollup:
+    """一天标题的关键词汇总"""
+
+    def __init__(
+        self,
+        all_titles: Dict,
+        extractor: Callable[[str], List[str]] = extract_keywords
+    ):
+        """
+        汇总一天的标题
+
+        Args:
+            all_titles: {platform_id: {title: info}}，与 read_all_titles_for_date 的结果一致
+            extractor: 标题关键词提取函数
+        """
+        self.keywords: Dict[str, KeywordStats] = {}
+
+        for platform_id, titles in all_titles.items():
+            for title, info in titles.items():
+                ranks = info.get("ranks")
+                best_rank = min(ranks) if ranks else None
+
+                # 同一标题中重复出现的关键词按次数计入，与 Counter.update 一致
+                for keyword in extractor(title):
+                    stats = self.keywords.get(keyword)
+                    if stats is None:
+                        stats = self.keywords[keyword] = KeywordStats()
+
+                    stats.count += 1
+                    stats.platforms[platform_id] = None
+                    if best_rank is not None and (
+                        stats.best_rank is None or best_rank < stats.best_rank
+                    ):
+                        stats.best_rank = best_rank
+                    if len(stats.sample_titles) < SAMPLE_SIZE:
+                        stats.sample_titles.append(title)
+
+    def count(self, keyword: str) -> int:
+        """关键词当天的出现次数，未出现时为 0"""
+        stats = self.keywords.get(keyword)
+        return stats.count if stats else 0
+
+    def sample_titles(self, keyword: str) -> List[str]:
+        """关键词当天的样本标题，未出现时为空列表"""
+        stats = self.keywords.get(keyword)
+        return list(stats.sample_titles) if stats else []
@@ -0,0 +1,216 @@
+"""
+标题相似度候选索引
+
+对一天的标题建立字符倒排表和关键词倒排表，查询时只返回"可能"满足相似度条件的
+候选标题，调用方再对候选逐条计算精确相似度。
+
+difflib.SequenceMatcher 的 ratio = 2*M / (len(a) + len(b))，其中匹配字符数 M
+不超过两串字符多重集合的交集大小，因此用倒排表累加出的交集大小可以得到 ratio 的
+上界；上界低于阈值的标题一定不满足条件，直接跳过。候选集合是精确结果的超集，
+筛选后的结果与逐条计算完全一致（不会像 MinHash 等概率方法那样漏掉阈值附近的标题）。
+"""
+
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+# 浮点比较的容差，保证候选集合不会因舍入漏掉边界上的标题
+_EPSILON = 1e-9
+
+
+class TitleSimilarityIndex:
+    """一天标题的相似度候选索引"""
+
+    def __init__(self, all_titles: Dict):
+        """
+        建立索引（倒排表在首次使用时按需构建）
+
+        Args:
+            all_titles: {platform_id: {title: info}}，与 read_all_titles_for_date 的结果一致
+        """
+        # 按原遍历顺序展开，候选编号升序即原顺序
+        self.entries: List[Tuple[str, str, Dict]] = [
+            (platform_id, title, info)
+            for platform_id, titles in all_titles.items()
+            for title, info in titles.items()
+        ]
+        self._char_postings: Dict[bool, Dict[str, List[Tuple[int, int]]]] = {}
+        self._text_lengths: Dict[bool, List[int]] = {}
+        self._keyword_postings: Dict[str, Dict[str, List[int]]] = {}
+        self._keyword_counts: Dict[str, List[int]] = {}
+
+    def _get_char_postings(self, lower: bool) -> Dict[str, List[Tuple[int, int]]]:
+        """字符倒排表 {字符: [(标题编号, 出现次数)]}"""
+        if lower not in self._char_postings:
+            postings: Dict[str, List[Tuple[int, int]]] = {}
+            lengths = []
+            for index, (_, title, _) in enumerate(self.entries):
+                text = title.lower() if lower else title
+                lengths.append(len(text))
+                for char, count in Counter(text).items():
+                    postings.setdefault(char, []).append((index, count))
+            # 先写入长度再写入倒排表：其他线程看到倒排表时长度一定已就绪
+            self._text_lengths[lower] = lengths
+            self._char_postings[lower] = postings
+        return self._char_postings[lower]
+
+    def char_overlaps(self, query: str, lower: bool = False) -> Dict[int, int]:
+        """
+        计算查询与各标题的字符多重集合交集大小（交集为空的标题不出现在结果中）
+
+        Args:
+            query: 查询文本
+            lower: 是否按小写比较（与调用方传给 SequenceMatcher 的文本一致）
+
+        Returns:
+            {标题编号: 交集大小}
+        """
+        postings = self._get_char_postings(lower)
+        text = query.lower() if lower else query
+
+        overlaps: Dict[int, int] = {}
+        for char, count in Counter(text).items():
+            for index, title_count in postings.get(char, ()):
+                overlaps[index] = overlaps.get(index, 0) + min(count, title_count)
+        return overlaps
+
+    def similarity_bounds(self, query: str, lower: bool = False) -> Dict[int, float]:
+        """
+        计算 SequenceMatcher(None, query, title).ratio() 的上界
+
+        与查询没有相同字符的标题 ratio 为 0，不出现在结果中。
+
+        Args:
+            query: 查询文本
+            lower: 是否按小写比较
+
+        Returns:
+            {标题编号: ratio 上界}
+        """
+        overlaps = self.char_overlaps(query, lower)
+        lengths = self._text_lengths[lower]
+        query_length = len(query.lower() if lower else query)
+        return {
+            index: 2 * overlap / (query_length + lengths[index])
+            for index, overlap in overlaps.items()
+        }
+
+    def similarity_candidates(
+        self, query: str, threshold: float, lower: bool = False
+    ) -> Set[int]:
+        """
+        返回 SequenceMatcher(None, query, title).ratio() 可能不低于阈值的标题编号
+
+        Args:
+            query: 查询文本
+            threshold: 相似度阈值
+            lower: 是否按小写比较
+
+        Returns:
+            候选标题编号集合
+        """
+        if threshold <= 0:
+            return set(range(len(self.entries)))
+
+        return {
+            index
+            for index, bound in self.similarity_bounds(query, lower).items()
+            if bound >= threshold - _EPSILON
+        }
+
+    def containing_candidates(self, query: str, lower: bool = False) -> Set[int]:
+        """
+        返回可能包含查询文本的标题编号（查询的每个字符都以足够次数出现）
+
+        Args:
+            query: 查询文本
+            lower: 是否按小写比较
+
+        Returns:
+            候选标题编号集合
+        """
+        text = query.lower() if lower else query
+        if not text:
+            return set(range(len(self.entries)))
+
+        return {
+            index
+            for index, overlap in self.char_overlaps(query, lower).items()
+            if overlap == len(text)
+        }
+
+    def _get_keyword_postings(
+        self,
+        extractor: Callable[[str], List[str]],
+        extractor_name: str
+    ) -> Dict[str, List[int]]:
+        """关键词倒排表 {关键词: [标题编号]}，同时记录各标题的不同关键词个数"""
+        postings = self._keyword_postings.get(extractor_name)
+        if postings is None:
+            postings = {}
+            counts = []
+            for index, (_, title, _) in enumerate(self.entries):
+                keywords = set(extractor(title))
+                counts.append(len(keywords))
+                for keyword in keywords:
+                    postings.setdefault(keyword, []).append(index)
+            # 先写入关键词个数再写入倒排表：其他线程看到倒排表时个数一定已就绪
+            self._keyword_counts[extractor_name] = counts
+            self._keyword_postings[extractor_name] = postings
+        return postings
+
+    def keyword_candidates(
+        self,
+        keywords: Iterable[str],
+        extractor: Callable[[str], List[str]],
+        extractor_name: str
+    ) -> Set[int]:
+        """
+        返回与给定关键词至少有一个相同关键词的标题编号
+
+        Args:
+            keywords: 查询的关键词
+            extractor: 标题关键词提取函数
+            extractor_name: 提取函数的名称（同一索引上不同提取函数的倒排表分开缓存）
+
+        Returns:
+            候选标题编号集合
+        """
+        postings = self._get_keyword_postings(extractor, extractor_name)
+
+        candidates: Set[int] = set()
+        for keyword in set(keywords):
+            candidates.update(postings.get(keyword, ()))
+        return candidates
+
+    def keyword_jaccards(
+        self,
+        keywords: Iterable[str],
+        extractor: Callable[[str], List[str]],
+        extractor_name: str
+    ) -> Dict[int, float]:
+        """
+        计算给定关键词与各标题关键词（均去重）的 Jaccard 相似度
+
+        由倒排表累加相同关键词个数直接得出，与逐条求集合交并的结果完全一致；
+        没有相同关键词的标题相似度为 0，不出现在结果中。
+
+        Args:
+            keywords: 查询的关键词
+            extractor: 标题关键词提取函数
+            extractor_name: 提取函数的名称
+
+        Returns:
+            {标题编号: Jaccard 相似度}
+        """
+        postings = self._get_keyword_postings(extractor, extractor_name)
+        counts = self._keyword_counts[extractor_name]
+        keywords = set(keywords)
+
+        shared: Dict[int, int] = {}
+        for keyword in keywords:
+            for index in postings.get(keyword, ()):
+                shared[index] = shared.get(index, 0) + 1
+        return {
+            index: count / (len(keywords) + counts[index] - count)
+            for index, count in shared.items()
+        }
@@ -0,0 +1,107 @@
+"""
+标题关键词提取
+
+分析工具和检索工具共用的分词实现：正则预编译、停用词表为不可变集合，
+同一标题在进程内只分词一次（按参数缓存结果）。
+
+默认按连续的文字/数字切分，与原先各工具内的实现结果一致；设置环境变量
+MCP_KEYWORD_SEGMENTER=jieba 且已安装 jieba 时，对包含中文的片段改用 jieba 词典分词。
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import FrozenSet, List, Tuple
+
+
+# 基础停用词（分析工具使用）
+STOPWORDS: FrozenSet[str] = frozenset({
+    '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一',
+    '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有',
+    '看', '好', '自己', '这'
+})
+
+# 检索工具使用的扩展停用词
+SEARCH_STOPWORDS: FrozenSet[str] = STOPWORDS | frozenset({
+    '那', '来', '被', '与', '为', '对', '将', '从', '以', '及', '等', '但',
+    '或', '而', '于', '中', '由', '可', '可以', '已', '已经', '还', '更', '最',
+    '再', '因为', '所以', '如果', '虽然', '然而'
+})
+
+# 每个进程缓存的分词结果条数
+TOKENIZE_CACHE_SIZE = 65536
+
+_URL_PATTERN = re.compile(r'http[s]?://\S+')
+_BRACKET_PATTERN = re.compile(r'\[.*?\]')
+_WORD_PATTERN = re.compile(r'\w+')
+_CJK_PATTERN = re.compile(r'[一-鿿]')
+
+
+def _load_segmenter():
+    """按环境变量加载可选的中文分词器，未启用或未安装时返回 None"""
+    if os.environ.get("MCP_KEYWORD_SEGMENTER", "").strip().lower() != "jieba":
+        return None
+    try:
+        import jieba
+    except ImportError:
+        print("Warning: MCP_KEYWORD_SEGMENTER=jieba 但未安装 jieba，使用默认分词")
+        return None
+    jieba.setLogLevel(60)
+    return jieba
+
+
+_segmenter = _load_segmenter()
+
+
+@lru_cache(maxsize=TOKENIZE_CACHE_SIZE)
+def _tokenize(
+    text: str,
+    min_length: int,
+    stopwords: FrozenSet[str],
+    strip_brackets: bool
+) -> Tuple[str, ...]:
+    """分词并过滤停用词和短词（结果按参数缓存，返回不可变元组）"""
+    text = _URL_PATTERN.sub('', text)
+    if strip_brackets:
+        text = _BRACKET_PATTERN.sub('', text)
+
+    words = _WORD_PATTERN.findall(text)
+    if _segmenter is not None:
+        words = [
+            token
+            for word in words
+            for token in (
+                _segmenter.lcut(word) if _CJK_PATTERN.search(word) else (word,)
+            )
+        ]
+
+    return tuple(
+        word for word in words
+        if len(word) >= min_length and word not in stopwords
+    )
+
+
+def extract_keywords(
+    text: str,
+    min_length: int = 2,
+    stopwords: FrozenSet[str] = STOPWORDS,
+    strip_brackets: bool = False
+) -> List[str]:
+    """
+    从文本中提取关键词
+
+    Args:
+        text: 输入文本
+        min_length: 最小词长
+        stopwords: 停用词集合（需为 frozenset，作为缓存键的一部分）
+        strip_brackets: 是否先移除方括号内容
+
+    Returns:
+        关键词列表（按出现顺序，可能重复）
+    """
+    return list(_tokenize(text, min_length, stopwords, strip_brackets))
+
+
+def clear_tokenize_cache() -> None:
+    """清空分词结果缓存"""
+    _tokenize.cache_clear()
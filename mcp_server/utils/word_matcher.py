@@ -0,0 +1,79 @@
+"""
+多模式匹配工具
+
+提供 Aho–Corasick 自动机，一次扫描找出文本中出现的全部关键词。
+实现与项目根目录 utils/word_matcher.py 保持一致（MCP 包独立安装，不依赖根目录模块）。
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+
+class AhoCorasick:
+    """Aho–Corasick 多模式匹配自动机，一次扫描找出文本中出现的全部模式"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[tuple] = [()]
+        self._empty_ids: List[int] = []
+
+        own_outputs: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(patterns):
+            self.patterns.append(pattern)
+            if not pattern:
+                # 空模式在任何文本中都"出现"，与 "" in text 的语义一致
+                self._empty_ids.append(pattern_id)
+                continue
+
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    own_outputs.append([])
+                state = next_state
+            own_outputs[state].append(pattern_id)
+
+        # 广度优先构建失败指针，并沿失败链合并输出
+        self._output = [()] * len(self._goto)
+        queue = deque()
+        for state in self._goto[0].values():
+            self._output[state] = tuple(own_outputs[state])
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fail_state = self._fail[state]
+                while fail_state and char not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+                self._fail[next_state] = self._goto[fail_state].get(char, 0)
+                self._output[next_state] = tuple(own_outputs[next_state]) + self._output[
+                    self._fail[next_state]
+                ]
+                queue.append(next_state)
+
+    def find_all(self, text: str) -> Set[int]:
+        """返回文本中出现过的模式编号集合"""
+        found = set(self._empty_ids)
+        if len(self._goto) == 1:
+            return found
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+
+        return found
@@ -0,0 +1,371 @@
+"""
+count_word_frequency 回归测试
+
+用项目自带的 output/ 数据，对比单次匹配实现与原先逐词组匹配实现（保留在本文件中作参照）
+得到的 stats 和 total_titles 是否完全一致，覆盖必须词、过滤词、@数量限制、全局数量限制
+以及三种报告模式。
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+os.environ.setdefault("CONFIG_PATH", str(ROOT / "config" / "config.yaml"))
+sys.path.insert(0, str(ROOT))
+
+import main  # noqa: E402
+
+
+OUTPUT_DIR = ROOT / "output"
+
+# 取最早、中间和最新的三天
+_DAY_DIRS = sorted(
+    path for path in OUTPUT_DIR.iterdir() if path.is_dir() and (path / "txt").is_dir()
+)
+DAYS = [_DAY_DIRS[0], _DAY_DIRS[len(_DAY_DIRS) // 2], _DAY_DIRS[-1]] if _DAY_DIRS else []
+
+FREQUENCY_WORDS = """\
+中国
+美国
+!台湾
+
++特朗普
+回应
+@5
+
+AI
+ai
+苹果
+华为
+小米
+!iPhone
+
+日本
+俄
+乌克兰
+
++男子
++警方
+@3
+
+股
+经济
+公司
+!汽车
+
+比赛
+NBA
+足球
+演唱会
+"""
+
+
+# === 参照实现：逐词组匹配（单次匹配改造之前的逻辑） ===
+def reference_matches_word_groups(
+    title: str, word_groups: List[Dict], filter_words: List[str]
+) -> bool:
+    if not isinstance(title, str):
+        title = str(title) if title is not None else ""
+    if not title.strip():
+        return False
+    if not word_groups:
+        return True
+
+    title_lower = title.lower()
+    if any(filter_word.lower() in title_lower for filter_word in filter_words):
+        return False
+
+    for group in word_groups:
+        required_words = group["required"]
+        normal_words = group["normal"]
+        if required_words and not all(
+            word.lower() in title_lower for word in required_words
+        ):
+            continue
+        if normal_words and not any(
+            word.lower() in title_lower for word in normal_words
+        ):
+            continue
+        return True
+    return False
+
+
+def reference_count_word_frequency(
+    results: Dict,
+    word_groups: List[Dict],
+    filter_words: List[str],
+    id_to_name: Dict,
+    title_info: Optional[Dict],
+    rank_threshold: int,
+    new_titles: Optional[Dict],
+    mode: str,
+    is_first_today: bool,
+) -> Tuple[List[Dict], int]:
+    if not word_groups:
+        word_groups = [{"required": [], "normal": [], "group_key": "全部新闻"}]
+        filter_words = []
+    all_news_mode = len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
+
+    if mode == "incremental":
+        results_to_process = results if is_first_today else (new_titles or {})
+        all_news_are_new = True
+    elif mode == "current":
+        results_to_process = results
+        if title_info:
+            latest_time = None
+            for source_titles in title_info.values():
+                for title_data in source_titles.values():
+                    last_time = title_data.get("last_time", "")
+                    if last_time and (latest_time is None or last_time > latest_time):
+                        latest_time = last_time
+            if latest_time:
+                results_to_process = {}
+                for source_id, source_titles in results.items():
+                    if source_id not in title_info:
+                        continue
+                    filtered_titles = {
+                        title: title_data
+                        for title, title_data in source_titles.items()
+                        if title in title_info[source_id]
+                        and title_info[source_id][title].get("last_time") == latest_time
+                    }
+                    if filtered_titles:
+                        results_to_process[source_id] = filtered_titles
+        all_news_are_new = False
+    else:
+        results_to_process = results
+        all_news_are_new = False
+
+    title_info = title_info or {}
+    new_titles = new_titles or {}
+    word_stats = {group["group_key"]: {"count": 0, "titles": {}} for group in word_groups}
+    total_titles = 0
+    processed_titles = {}
+
+    for source_id, titles_data in results_to_process.items():
+        total_titles += len(titles_data)
+        processed_titles.setdefault(source_id, {})
+
+        for title, title_data in titles_data.items():
+            if title in processed_titles[source_id]:
+                continue
+            if not reference_matches_word_groups(title, word_groups, filter_words):
+                continue
+
+            title_lower = title.lower()
+            for group in word_groups:
+                if not all_news_mode:
+                    if group["required"] and not all(
+                        word.lower() in title_lower for word in group["required"]
+                    ):
+                        continue
+                    if group["normal"] and not any(
+                        word.lower() in title_lower for word in group["normal"]
+                    ):
+                        continue
+
+                group_key = group["group_key"]
+                word_stats[group_key]["count"] += 1
+                word_stats[group_key]["titles"].setdefault(source_id, [])
+
+                first_time = ""
+                last_time = ""
+                count_info = 1
+                ranks = title_data.get("ranks", []) or []
+                url = title_data.get("url", "")
+                mobile_url = title_data.get("mobileUrl", "")
+                if source_id in title_info and title in title_info[source_id]:
+                    info = title_info[source_id][title]
+                    first_time = info.get("first_time", "")
+                    last_time = info.get("last_time", "")
+                    count_info = info.get("count", 1)
+                    if info.get("ranks"):
+                        ranks = info["ranks"]
+                    url = info.get("url", url)
+                    mobile_url = info.get("mobileUrl", mobile_url)
+                if not ranks:
+                    ranks = [99]
+
+                if all_news_are_new:
+                    is_new = True
+                else:
+                    is_new = source_id in new_titles and title in new_titles[source_id]
+
+                word_stats[group_key]["titles"][source_id].append(
+                    {
+                        "title": title,
+                        "source_name": id_to_name.get(source_id, source_id),
+                        "first_time": first_time,
+                        "last_time": last_time,
+                        "time_display": main.format_time_display(first_time, last_time),
+                        "count": count_info,
+                        "ranks": ranks,
+                        "rank_threshold": rank_threshold,
+                        "url": url,
+                        "mobileUrl": mobile_url,
+                        "is_new": is_new,
+                    }
+                )
+                processed_titles[source_id][title] = True
+                break
+
+    stats = []
+    for position, group in enumerate(word_groups):
+        group_key = group["group_key"]
+        data = word_stats[group_key]
+        all_titles = [
+            title_data
+            for title_list in data["titles"].values()
+            for title_data in title_list
+        ]
+        sorted_titles = sorted(
+            all_titles,
+            key=lambda x: (
+                -main.calculate_news_weight(x, rank_threshold),
+                min(x["ranks"]) if x["ranks"] else 999,
+                -x["count"],
+            ),
+        )
+        max_count = group.get("max_count", 0) or main.CONFIG.get("MAX_NEWS_PER_KEYWORD", 0)
+        if max_count > 0:
+            sorted_titles = sorted_titles[:max_count]
+
+        stats.append(
+            {
+                "word": group_key,
+                "count": data["count"],
+                "position": position,
+                "titles": sorted_titles,
+                "percentage": (
+                    round(data["count"] / total_titles * 100, 2) if total_titles > 0 else 0
+                ),
+            }
+        )
+
+    if main.CONFIG.get("SORT_BY_POSITION_FIRST", False):
+        stats.sort(key=lambda x: (x["position"], -x["count"]))
+    else:
+        stats.sort(key=lambda x: (-x["count"], x["position"]))
+    return stats, total_titles
+
+
+# === 测试数据 ===
+_day_cache: Dict[Path, Tuple[Dict, Dict, Dict, Dict]] = {}
+
+
+def load_day(day_dir: Path) -> Tuple[Dict, Dict, Dict, Dict]:
+    """读取一天的 txt 快照，返回 (results, id_to_name, title_info, new_titles)"""
+    if day_dir in _day_cache:
+        return _day_cache[day_dir]
+
+    results: Dict = {}
+    id_to_name: Dict = {}
+    title_info: Dict = {}
+    first_seen: Dict = {}
+    snapshot_files = sorted((day_dir / "txt").glob("*.txt"))
+    for file_path in snapshot_files:
+        time_info = file_path.stem
+        titles_by_id, file_id_to_name = main.parse_file_titles(file_path)
+        id_to_name.update(file_id_to_name)
+        for source_id, titles in titles_by_id.items():
+            for title, data in titles.items():
+                results.setdefault(source_id, {})[title] = data
+                first_seen.setdefault((source_id, title), time_info)
+                info = title_info.setdefault(source_id, {}).get(title)
+                if info is None:
+                    title_info[source_id][title] = {
+                        "first_time": time_info,
+                        "last_time": time_info,
+                        "count": 1,
+                        "ranks": list(data["ranks"]),
+                        "url": data.get("url", ""),
+                        "mobileUrl": data.get("mobileUrl", ""),
+                    }
+                else:
+                    info["last_time"] = time_info
+                    info["count"] += 1
+                    info["ranks"].extend(
+                        rank for rank in data["ranks"] if rank not in info["ranks"]
+                    )
+
+    latest_time = snapshot_files[-1].stem
+    new_titles: Dict = {}
+    latest_titles, _ = main.parse_file_titles(snapshot_files[-1])
+    for source_id, titles in latest_titles.items():
+        source_new = {
+            title: data
+            for title, data in titles.items()
+            if first_seen[(source_id, title)] == latest_time
+        }
+        if source_new:
+            new_titles[source_id] = source_new
+
+    _day_cache[day_dir] = (results, id_to_name, title_info, new_titles)
+    return _day_cache[day_dir]
+
+
+@pytest.fixture
+def word_groups(tmp_path, request):
+    if request.param == "all":
+        return [], []
+    frequency_file = tmp_path / "frequency_words.txt"
+    frequency_file.write_text(FREQUENCY_WORDS, encoding="utf-8")
+    return main.load_frequency_words(str(frequency_file))
+
+
+@pytest.mark.skipif(not DAYS, reason="没有自带的 output/ 数据")
+@pytest.mark.parametrize("day_dir", DAYS, ids=lambda path: path.name)
+@pytest.mark.parametrize("word_groups", ["groups", "all"], indirect=True)
+@pytest.mark.parametrize(
+    "mode, is_first_today",
+    [("daily", False), ("current", False), ("incremental", False), ("incremental", True)],
+)
+@pytest.mark.parametrize("max_news_per_keyword", [0, 4])
+@pytest.mark.parametrize("sort_by_position_first", [False, True])
+def test_matches_reference_implementation(
+    monkeypatch,
+    day_dir,
+    word_groups,
+    mode,
+    is_first_today,
+    max_news_per_keyword,
+    sort_by_position_first,
+):
+    monkeypatch.setitem(main.CONFIG, "MAX_NEWS_PER_KEYWORD", max_news_per_keyword)
+    monkeypatch.setitem(main.CONFIG, "SORT_BY_POSITION_FIRST", sort_by_position_first)
+    monkeypatch.setattr(main, "is_first_crawl_today", lambda: is_first_today)
+
+    groups, filter_words = word_groups
+    results, id_to_name, title_info, new_titles = load_day(day_dir)
+    rank_threshold = 5
+
+    expected = reference_count_word_frequency(
+        results,
+        groups,
+        filter_words,
+        id_to_name,
+        title_info,
+        rank_threshold,
+        new_titles,
+        mode,
+        is_first_today,
+    )
+    actual = main.count_word_frequency(
+        results,
+        groups,
+        filter_words,
+        id_to_name,
+        title_info,
+        rank_threshold,
+        new_titles,
+        mode=mode,
+    )
+
+    assert actual[1] == expected[1]
+    assert actual[0] == expected[0]
+    # 确认用例确实覆盖到了匹配结果和数量限制
+    assert sum(stat["count"] for stat in expected[0]) > 0
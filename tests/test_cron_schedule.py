@@ -0,0 +1,61 @@
+"""
+cron 表达式解析与下一次执行时间测试（期望值均按日历手工推算）
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utils.cron_schedule import CronSchedule  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "expr, moment, expected",
+    [
+        # 每 15 分钟
+        ("*/15 * * * *", datetime(2026, 10, 18, 10, 7), datetime(2026, 10, 18, 10, 15)),
+        # 严格晚于给定时间
+        ("*/15 * * * *", datetime(2026, 10, 18, 10, 15), datetime(2026, 10, 18, 10, 30)),
+        ("*/15 * * * *", datetime(2026, 10, 18, 10, 14, 59), datetime(2026, 10, 18, 10, 15)),
+        # 跨天
+        ("0 0 * * *", datetime(2026, 10, 18, 23, 59), datetime(2026, 10, 19, 0, 0)),
+        # a/n 从 a 开始每隔 n：5、25、45
+        ("5/20 * * * *", datetime(2026, 10, 18, 10, 45), datetime(2026, 10, 18, 11, 5)),
+        # 范围加步长：9、13、17 点，周一到周五；周五 17 点之后是下周一 9 点
+        ("0 9-17/4 * * 1-5", datetime(2026, 10, 23, 17, 0), datetime(2026, 10, 26, 9, 0)),
+        # 7 也表示周日；2026-10-18 是周日
+        ("0 0 * * 7", datetime(2026, 10, 18, 0, 0), datetime(2026, 10, 25, 0, 0)),
+        # 跳过没有 31 日的 11 月
+        ("0 0 31 * *", datetime(2026, 10, 31, 0, 0), datetime(2026, 12, 31, 0, 0)),
+        # 2 月 29 日只在闰年出现
+        ("0 12 29 2 *", datetime(2026, 3, 1), datetime(2028, 2, 29, 12, 0)),
+        # 日和周都有限制时满足其一即可：周一 10-19 先于 11-01
+        ("30 8 1,15 * 1", datetime(2026, 10, 18, 10, 0), datetime(2026, 10, 19, 8, 30)),
+        ("30 8 1,15 * 1", datetime(2026, 10, 26, 9, 0), datetime(2026, 11, 1, 8, 30)),
+        # 以 * 开头的日字段不算限制，日和周需同时满足：奇数日且周三
+        ("0 9 */2 * 3", datetime(2026, 10, 18, 10, 0), datetime(2026, 10, 21, 9, 0)),
+        # 以 * 开头的周字段同理：1 日且周日、周二、周四或周六（2026-11-01 是周日）
+        ("0 9 1 * */2", datetime(2026, 10, 18, 10, 0), datetime(2026, 11, 1, 9, 0)),
+    ],
+)
+def test_next_after(expr, moment, expected):
+    assert CronSchedule(expr).next_after(moment) == expected
+
+
+@pytest.mark.parametrize(
+    "expr",
+    ["* * * *", "60 * * * *", "*/0 * * * *", "0 0 0 * *", "0 0 * 13 *", "0 0 * * 8", "5-1 * * * *", "a * * * *"],
+)
+def test_invalid_expression(expr):
+    with pytest.raises(ValueError):
+        CronSchedule(expr)
+
+
+def test_expression_without_run_time():
+    with pytest.raises(ValueError):
+        CronSchedule("0 0 30 2 *").next_after(datetime(2026, 10, 18))
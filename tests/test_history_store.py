@@ -0,0 +1,43 @@
+"""
+历史库读写测试
+
+覆盖爬虫端 utils/history_store.py 的 HistoryStore 和 MCP 端的 HistoryReader。
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from mcp_server.services.history_store import HistoryReader  # noqa: E402
+from utils.history_store import HISTORY_DB_NAME, HistoryStore  # noqa: E402
+
+
+@pytest.mark.parametrize("dir_name", ["rt#x", "rt?x", "rt%20x", "历史 #1"])
+def test_readonly_open_escapes_path(tmp_path, dir_name):
+    db_path = tmp_path / dir_name / HISTORY_DB_NAME
+    store = HistoryStore(db_path)
+    store.add_snapshot(
+        "2025-11-05",
+        "10时00分",
+        100,
+        {"zhihu": {"标题A": {"ranks": [1], "url": "", "mobileUrl": ""}}},
+        {"zhihu": "知乎"},
+    )
+    store.close()
+    before = sorted(path.name for path in tmp_path.iterdir())
+
+    reader = HistoryReader(db_path)
+    try:
+        assert reader.list_day_snapshots(["2025-11-05"]) == {"2025-11-05": {"10时00分"}}
+        with pytest.raises(sqlite3.OperationalError):
+            reader.conn.execute("DELETE FROM days")
+    finally:
+        reader.close()
+
+    # 路径被截断时会在上级目录留下空库文件
+    assert sorted(path.name for path in tmp_path.iterdir()) == before
@@ -0,0 +1,31 @@
+"""
+HTML 报告文件写入测试
+"""
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utils import html_renderer  # noqa: E402
+
+
+def test_publish_uses_default_mode_without_touching_umask(tmp_path, monkeypatch):
+    source = tmp_path / "report.html"
+    source.write_text("<html></html>", encoding="utf-8")
+    os.chmod(source, 0o600)
+    target = tmp_path / "index.html"
+
+    # 写入过程中修改 umask 会影响同进程其他线程新建的文件
+    def fail_umask(mask):
+        raise AssertionError("不应在写入时修改 umask")
+
+    monkeypatch.setattr(html_renderer.os, "umask", fail_umask)
+    html_renderer.publish_html_copy(source, target)
+
+    assert target.read_text(encoding="utf-8") == "<html></html>"
+    assert stat.S_IMODE(target.stat().st_mode) == html_renderer._NEW_FILE_MODE
+    assert [path.name for path in tmp_path.iterdir() if path.name.endswith(".tmp")] == []
@@ -0,0 +1,70 @@
+"""
+标题相似度候选索引测试
+
+用项目自带的 output/ 数据，对比 TitleSimilarityIndex 的上界和关键词重合度与逐条计算的结果。
+"""
+
+import sys
+from datetime import datetime
+from difflib import SequenceMatcher
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from mcp_server.services.parser_service import ParserService  # noqa: E402
+from mcp_server.utils.similarity_index import TitleSimilarityIndex  # noqa: E402
+from mcp_server.utils.tokenizer import SEARCH_STOPWORDS, extract_keywords  # noqa: E402
+
+_DAY_DIRS = sorted(
+    path for path in (ROOT / "output").iterdir() if path.is_dir() and (path / "txt").is_dir()
+)
+
+QUERIES = ["美国政府关门", "特斯拉降价", "iPhone 17 发布", "日本首相高市早苗发表讲话", "AI"]
+
+
+def extract(text):
+    return extract_keywords(text, 2, SEARCH_STOPWORDS, strip_brackets=True)
+
+
+@pytest.fixture(scope="module")
+def index():
+    if not _DAY_DIRS:
+        pytest.skip("没有自带的 output/ 数据")
+    date = datetime.strptime(_DAY_DIRS[-1].name, "%Y年%m月%d日")
+    all_titles, _, _ = ParserService(str(ROOT)).read_all_titles_for_date(date)
+    return TitleSimilarityIndex(all_titles)
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_similarity_bounds_cover_ratio(index, query):
+    bounds = index.similarity_bounds(query, lower=True)
+    for entry_id, (_, title, _) in enumerate(index.entries):
+        ratio = SequenceMatcher(None, query.lower(), title.lower()).ratio()
+        if entry_id in bounds:
+            assert ratio <= bounds[entry_id] + 1e-9, title
+        else:
+            assert ratio == 0.0, title
+
+
+def test_keyword_jaccards_match_set_jaccard(index):
+    # 用当天标题的关键词（以及两个标题关键词的并集）作为查询，保证有重合
+    queries = []
+    for _, title, _ in index.entries[::50]:
+        queries.append(set(extract(title)))
+    queries += [first | second for first, second in zip(queries, queries[1:])]
+
+    matched = 0
+    for query_keywords in queries:
+        jaccards = index.keyword_jaccards(query_keywords, extract, "test")
+        for entry_id, (_, title, _) in enumerate(index.entries):
+            title_keywords = set(extract(title))
+            shared = query_keywords & title_keywords
+            if shared:
+                assert jaccards[entry_id] == len(shared) / len(query_keywords | title_keywords)
+                matched += 1
+            else:
+                assert entry_id not in jaccards
+    assert matched > len(queries)
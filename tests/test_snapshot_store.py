@@ -0,0 +1,288 @@
+"""
+快照库读写测试
+
+覆盖爬虫端 utils/snapshot_store.py 的 SnapshotStore 和 MCP 端的 SnapshotReader。
+"""
+
+import copy
+import random
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from mcp_server.services.snapshot_store import SnapshotReader  # noqa: E402
+from utils.snapshot_store import SNAPSHOT_DB_NAME, SnapshotStore  # noqa: E402
+
+
+def make_titles(*titles, source_id="zhihu"):
+    return {
+        source_id: {
+            title: {
+                "ranks": [rank],
+                "url": f"https://example.com/{rank}",
+                "mobileUrl": "",
+            }
+            for rank, title in enumerate(titles, 1)
+        }
+    }
+
+
+def read_reader(db_path):
+    reader = SnapshotReader(db_path)
+    try:
+        return [
+            (time_info, titles_by_id, id_to_name)
+            for time_info, _, titles_by_id, id_to_name in reader.iter_snapshots()
+        ]
+    finally:
+        reader.close()
+
+
+@pytest.mark.parametrize("dir_name", ["rt#x", "rt?x", "rt%20x", "快照 #1"])
+def test_readonly_open_escapes_path(tmp_path, dir_name):
+    db_path = tmp_path / dir_name / SNAPSHOT_DB_NAME
+    store = SnapshotStore(db_path)
+    store.save_snapshot("10时00分", make_titles("标题A", "标题B"), {"zhihu": "知乎"}, [], 100)
+    store.close()
+    before = sorted(path.name for path in tmp_path.iterdir())
+
+    readonly_store = SnapshotStore(db_path, readonly=True)
+    try:
+        assert [time_info for time_info, _, _ in readonly_store.list_snapshots()] == ["10时00分"]
+        with pytest.raises(sqlite3.OperationalError):
+            readonly_store.conn.execute("DELETE FROM slots")
+    finally:
+        readonly_store.close()
+
+    assert read_reader(db_path) == [
+        ("10时00分", make_titles("标题A", "标题B"), {"zhihu": "知乎"})
+    ]
+    # 路径被截断时会在上级目录留下空库文件
+    assert sorted(path.name for path in tmp_path.iterdir()) == before
+
+
+# === 内容指纹与时间槽引用 ===
+SOURCES = ["a", "b", "c", "d"]
+TITLE_POOL = [f"t{i}" for i in range(10)]
+
+
+def random_source(rng):
+    return {
+        title: {
+            "ranks": [rank],
+            "url": rng.choice(["", "u" + title]),
+            "mobileUrl": rng.choice(["", "m" + title]),
+        }
+        for rank, title in enumerate(rng.sample(TITLE_POOL, rng.randint(0, 6)), 1)
+    }
+
+
+def read_all(store):
+    return {
+        time_info: (titles_by_id, id_to_name)
+        for time_info, titles_by_id, id_to_name in store.iter_snapshots()
+    }
+
+
+def test_random_histories_round_trip(tmp_path):
+    """随机的抓取历史（内容重复、来回变化、乱序写入、替换已有时间槽、中途重新打开）
+    写入后，两端读出的内容都与写入的内容一致"""
+    for seed in range(300):
+        rng = random.Random(seed)
+        db_path = tmp_path / f"{seed}.db"
+        store = SnapshotStore(db_path)
+        # {time_info: titles_by_id}，即每个时间槽当前应有的内容
+        written = {}
+        last_content = {}
+
+        for step in range(rng.randint(1, 12)):
+            # 约三成写入较早的时间，可能与已有时间槽同名（整体替换）
+            if rng.random() < 0.3:
+                time_info = f"{rng.randint(0, 6):02d}时00分"
+            else:
+                time_info = f"{10 + step:02d}时00分"
+
+            titles_by_id = {}
+            for source_id in rng.sample(SOURCES, rng.randint(0, 4)):
+                if source_id in last_content and rng.random() < 0.5:
+                    titles_by_id[source_id] = copy.deepcopy(last_content[source_id])
+                else:
+                    titles_by_id[source_id] = random_source(rng)
+            id_to_name = {source_id: source_id.upper() for source_id in titles_by_id}
+
+            earlier = sorted(t for t in written if t < time_info)
+            if earlier:
+                previous = written[earlier[-1]]
+                expected_changes = [
+                    source_id
+                    for source_id in titles_by_id
+                    if previous.get(source_id) != titles_by_id[source_id]
+                ] + [source_id for source_id in previous if source_id not in titles_by_id]
+            else:
+                expected_changes = list(titles_by_id)
+
+            changed = store.save_snapshot(time_info, titles_by_id, id_to_name, [], 1)
+            assert changed == expected_changes, (seed, step)
+
+            written[time_info] = copy.deepcopy(titles_by_id)
+            last_content.update(copy.deepcopy(titles_by_id))
+            if rng.random() < 0.3:
+                store.close()
+                store = SnapshotStore(db_path)
+
+        # 没有任何平台的时间槽不会被读出
+        expected = {
+            time_info: (titles_by_id, {source_id: source_id.upper() for source_id in titles_by_id})
+            for time_info, titles_by_id in written.items()
+            if titles_by_id
+        }
+        assert read_all(store) == expected, seed
+        store.close()
+
+        readonly_store = SnapshotStore(db_path, readonly=True)
+        reader = SnapshotReader(db_path)
+        try:
+            for _ in range(5 if expected else 0):
+                subset = rng.sample(sorted(expected), rng.randint(1, len(expected)))
+                assert {
+                    time_info: (titles_by_id, id_to_name)
+                    for time_info, titles_by_id, id_to_name in readonly_store.iter_snapshots(subset)
+                } == {time_info: expected[time_info] for time_info in subset}, seed
+                assert {
+                    time_info: (titles_by_id, id_to_name)
+                    for time_info, _, titles_by_id, id_to_name in reader.iter_snapshots(subset)
+                } == {time_info: expected[time_info] for time_info in subset}, seed
+
+            # 引用同一份内容的时间槽各自得到独立的字典
+            source_dicts = [
+                id(source_titles)
+                for _, titles_by_id, _ in readonly_store.iter_snapshots()
+                for source_titles in titles_by_id.values()
+            ]
+            assert len(source_dicts) == len(set(source_dicts)), seed
+        finally:
+            readonly_store.close()
+            reader.close()
+
+
+def test_unchanged_sources_are_stored_as_references(tmp_path):
+    db_path = tmp_path / SNAPSHOT_DB_NAME
+    store = SnapshotStore(db_path)
+    first = make_titles("标题A", "标题B")
+    second = make_titles("标题C")
+
+    assert store.save_snapshot("10时00分", first, {"zhihu": "知乎"}, [], 1) == ["zhihu"]
+    assert store.save_snapshot("10时30分", first, {"zhihu": "知乎"}, [], 1) == []
+    assert store.save_snapshot("11时00分", second, {"zhihu": "知乎"}, [], 1) == ["zhihu"]
+    # 内容变回第一次的样子，仍然引用第一个时间槽
+    assert store.save_snapshot("11时30分", first, {"zhihu": "知乎"}, [], 1) == ["zhihu"]
+
+    rows = store.conn.execute(
+        "SELECT sl.time_info, ss.base_slot_id IS NOT NULL FROM slot_sources ss "
+        "JOIN slots sl ON sl.id = ss.slot_id ORDER BY sl.time_info"
+    ).fetchall()
+    assert rows == [("10时00分", 0), ("10时30分", 1), ("11时00分", 0), ("11时30分", 1)]
+    assert store.conn.execute("SELECT COUNT(*) FROM appearances").fetchone()[0] == 3
+    store.close()
+
+
+def test_replacing_referenced_slot_keeps_dependents(tmp_path):
+    db_path = tmp_path / SNAPSHOT_DB_NAME
+    store = SnapshotStore(db_path)
+    first = make_titles("标题A", "标题B")
+    for time_info in ("10时00分", "10时30分", "11时00分"):
+        store.save_snapshot(time_info, first, {"zhihu": "知乎"}, [], 1)
+
+    replacement = make_titles("标题C")
+    store.save_snapshot("10时00分", replacement, {"zhihu": "知乎"}, [], 1)
+    store.close()
+
+    expected = {
+        "10时00分": (replacement, {"zhihu": "知乎"}),
+        "10时30分": (first, {"zhihu": "知乎"}),
+        "11时00分": (first, {"zhihu": "知乎"}),
+    }
+    store = SnapshotStore(db_path, readonly=True)
+    assert read_all(store) == expected
+    store.close()
+    assert {
+        time_info: (titles_by_id, id_to_name)
+        for time_info, titles_by_id, id_to_name in read_reader(db_path)
+    } == expected
+
+    # 第一份内容复制给了最早的引用方，之后的引用方改为引用它
+    store = SnapshotStore(db_path)
+    assert store.save_snapshot("11时30分", first, {"zhihu": "知乎"}, [], 1) == []
+    owner = store.conn.execute(
+        "SELECT id FROM slots WHERE time_info = '10时30分'"
+    ).fetchone()[0]
+    assert store.conn.execute(
+        "SELECT sl.time_info, ss.base_slot_id FROM slot_sources ss "
+        "JOIN slots sl ON sl.id = ss.slot_id "
+        "WHERE sl.time_info != '10时00分' ORDER BY sl.time_info"
+    ).fetchall() == [("10时30分", None), ("11时00分", owner), ("11时30分", owner)]
+    store.close()
+
+
+def test_failed_write_leaves_store_consistent(tmp_path, monkeypatch):
+    db_path = tmp_path / SNAPSHOT_DB_NAME
+    store = SnapshotStore(db_path)
+    first = make_titles("标题A")
+    store.save_snapshot("10时00分", first, {"zhihu": "知乎"}, [], 1)
+
+    original_intern = store._intern
+
+    def failing_intern(table, value):
+        if value == "标题B":
+            raise RuntimeError("写入中断")
+        return original_intern(table, value)
+
+    monkeypatch.setattr(store, "_intern", failing_intern)
+    with pytest.raises(RuntimeError):
+        store.save_snapshot(
+            "10时30分", make_titles("标题B", source_id="weibo"), {"weibo": "微博"}, [], 1
+        )
+    monkeypatch.undo()
+
+    # 中断的时间槽整体回滚，之后的写入仍能正确判断内容引用
+    assert store.save_snapshot("11时00分", first, {"zhihu": "知乎"}, [], 1) == []
+    assert read_all(store) == {
+        "10时00分": (first, {"zhihu": "知乎"}),
+        "11时00分": (first, {"zhihu": "知乎"}),
+    }
+    store.close()
+
+
+def test_reads_and_upgrades_old_schema(tmp_path):
+    """没有内容指纹列的旧版本库：两端都能读取，写入端打开时补充列后继续使用"""
+    db_path = tmp_path / SNAPSHOT_DB_NAME
+    first = make_titles("标题A", "标题B")
+    store = SnapshotStore(db_path)
+    store.save_snapshot("10时00分", first, {"zhihu": "知乎"}, [], 1)
+    store.close()
+
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("ALTER TABLE slot_sources DROP COLUMN fingerprint")
+    conn.execute("ALTER TABLE slot_sources DROP COLUMN base_slot_id")
+    conn.commit()
+    conn.close()
+
+    store = SnapshotStore(db_path, readonly=True)
+    assert read_all(store) == {"10时00分": (first, {"zhihu": "知乎"})}
+    store.close()
+    assert read_reader(db_path) == [("10时00分", first, {"zhihu": "知乎"})]
+
+    store = SnapshotStore(db_path)
+    # 旧记录没有指纹，第一次写入视为有变化并保存完整内容
+    assert store.save_snapshot("10时30分", first, {"zhihu": "知乎"}, [], 1) == ["zhihu"]
+    assert store.save_snapshot("11时00分", first, {"zhihu": "知乎"}, [], 1) == []
+    assert read_all(store) == {
+        time_info: (first, {"zhihu": "知乎"})
+        for time_info in ("10时00分", "10时30分", "11时00分")
+    }
+    store.close()
@@ -0,0 +1,129 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+
+CRAWL_SCHEDULE_FILE = "crawl_schedule.json"
+
+# 新样本在变化速度估计中的权重（指数滑动平均）
+_RATE_SMOOTHING = 0.3
+
+# 距上次抓取达到间隔的该比例即视为到期，避免定时任务的执行抖动让平台多等一轮
+_DUE_RATIO = 0.9
+
+
+def new_title_ratio(previous: Iterable[str], current: Iterable[str]) -> float:
+    """current 中不在 previous 里的标题占 current 的比例，current 为空时为 0"""
+    previous = set(previous)
+    current = list(current)
+    if not current:
+        return 0.0
+    return sum(1 for title in current if title not in previous) / len(current)
+
+
+class AdaptiveCrawlScheduler:
+    """按各平台榜单的变化速度安排抓取
+
+    变化速度为"每分钟新增标题占榜单的比例"，每次抓取后用指数滑动平均更新；
+    平台的抓取间隔为预计新增比例达到 target_new_ratio 所需的分钟数，
+    限制在 [min_interval, max_interval] 内，变化速度未知时按最短间隔抓取。
+    状态（上次抓取时间、变化速度）保存在 JSON 文件中，跨天保留。
+    """
+
+    def __init__(
+        self,
+        state_path: Path,
+        min_interval: float,
+        max_interval: float,
+        target_new_ratio: float,
+        platform_bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+    ):
+        self.state_path = Path(state_path)
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.target_new_ratio = target_new_ratio
+        # {平台ID: (最短间隔, 最长间隔)}，覆盖全局上下限
+        self.platform_bounds = platform_bounds or {}
+        # {平台ID: {"last_crawl": 时间戳, "rate": 变化速度或 None}}
+        self.platforms: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """读取状态文件，文件不存在或损坏时从空状态开始"""
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("version") == 1:
+                return state["platforms"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"读取抓取频率状态失败: {e}")
+        return {}
+
+    def save(self) -> None:
+        """原子写入状态文件"""
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": 1, "platforms": self.platforms},
+                    f,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_path, self.state_path)
+        except Exception as e:
+            print(f"保存抓取频率状态失败: {e}")
+
+    def has_platform(self, platform_id: str) -> bool:
+        return platform_id in self.platforms
+
+    def seed_rate(self, platform_id: str, rate: float) -> None:
+        """用历史快照估计的变化速度初始化尚无记录的平台"""
+        self.platforms.setdefault(platform_id, {"last_crawl": None, "rate": None})
+        if self.platforms[platform_id]["rate"] is None:
+            self.platforms[platform_id]["rate"] = rate
+
+    def get_interval(self, platform_id: str) -> float:
+        """平台当前的抓取间隔（分钟）"""
+        min_interval, max_interval = self.platform_bounds.get(
+            platform_id, (self.min_interval, self.max_interval)
+        )
+        rate = self.platforms.get(platform_id, {}).get("rate")
+        if rate is None:
+            return min_interval
+        if rate <= 0:
+            return max_interval
+        return min(max(self.target_new_ratio / rate, min_interval), max_interval)
+
+    def is_due(self, platform_id: str, now: float) -> bool:
+        """平台是否到了抓取时间（now 为时间戳）"""
+        last_crawl = self.platforms.get(platform_id, {}).get("last_crawl")
+        if last_crawl is None:
+            return True
+        elapsed = (now - last_crawl) / 60
+        return elapsed < 0 or elapsed >= self.get_interval(platform_id) * _DUE_RATIO
+
+    def record_crawl(
+        self, platform_id: str, now: float, new_ratio: Optional[float] = None
+    ) -> None:
+        """记录一次成功抓取
+
+        Args:
+            platform_id: 平台ID
+            now: 抓取时间戳
+            new_ratio: 与上次抓取内容相比的新增标题比例，无法比较时为 None
+        """
+        entry = self.platforms.setdefault(
+            platform_id, {"last_crawl": None, "rate": None}
+        )
+        last_crawl = entry["last_crawl"]
+        if new_ratio is not None and last_crawl is not None and now > last_crawl:
+            sample = new_ratio / ((now - last_crawl) / 60)
+            if entry["rate"] is None:
+                entry["rate"] = sample
+            else:
+                entry["rate"] += _RATE_SMOOTHING * (sample - entry["rate"])
+        entry["last_crawl"] = now
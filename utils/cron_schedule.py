@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+from typing import Set, Tuple
+
+
+# (字段名, 最小值, 最大值)
+_CRON_FIELDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 7),
+)
+
+# 找不到下一次执行时间时最多向后搜索的天数（覆盖闰年的 2 月 29 日）
+_MAX_SEARCH_DAYS = 366 * 5
+
+
+def _parse_field(expr: str, min_value: int, max_value: int) -> Tuple[Set[int], bool]:
+    """解析单个 cron 字段，返回 (允许的取值, 是否以 * 开头)"""
+    values = set()
+    for part in expr.split(","):
+        step = 1
+        if "/" in part:
+            part, step_str = part.split("/", 1)
+            step = int(step_str)
+            if step <= 0:
+                raise ValueError(f"步长必须为正整数: {expr}")
+
+        if part == "*":
+            start, end = min_value, max_value
+        elif "-" in part:
+            start_str, end_str = part.split("-", 1)
+            start, end = int(start_str), int(end_str)
+        else:
+            start = int(part)
+            # "5/10" 表示从 5 开始每隔 10
+            end = max_value if step > 1 else start
+
+        if start < min_value or end > max_value or start > end:
+            raise ValueError(f"取值超出范围 {min_value}-{max_value}: {expr}")
+        values.update(range(start, end + 1, step))
+
+    # 与 Vixie cron 一致：以 * 开头的字段（如 */2）都视为不限制，日和周按"且"匹配
+    return values, expr.startswith("*")
+
+
+class CronSchedule:
+    """五段式 cron 表达式（分 时 日 月 周），与 crontab 的匹配规则一致
+
+    支持 *、数字、范围 a-b、列表 a,b 和步长 */n、a-b/n；周取值 0-7，0 和 7 都表示周日。
+    日和周字段都不以 * 开头时，两者满足其一即可执行。
+    """
+
+    def __init__(self, expr: str):
+        parts = expr.split()
+        if len(parts) != len(_CRON_FIELDS):
+            raise ValueError(f"cron 表达式需要 5 个字段: {expr}")
+
+        try:
+            parsed = [
+                _parse_field(part, min_value, max_value)
+                for part, (_, min_value, max_value) in zip(parts, _CRON_FIELDS)
+            ]
+        except ValueError as e:
+            raise ValueError(f"无效的 cron 表达式 '{expr}': {e}") from None
+
+        self.expr = expr
+        self.minutes = parsed[0][0]
+        self.hours = parsed[1][0]
+        self.days = parsed[2][0]
+        self.months = parsed[3][0]
+        self.weekdays = {value % 7 for value in parsed[4][0]}
+        self._day_any = parsed[2][1]
+        self._weekday_any = parsed[4][1]
+
+    def _matches_day(self, moment: datetime) -> bool:
+        """日期是否满足日和周字段"""
+        # datetime.weekday() 周一为 0，cron 周日为 0
+        weekday = (moment.weekday() + 1) % 7
+        day_ok = moment.day in self.days
+        weekday_ok = weekday in self.weekdays
+        if self._day_any or self._weekday_any:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """返回严格晚于 moment 的下一次执行时间（精确到分钟，保留时区信息）"""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        deadline = candidate + timedelta(days=_MAX_SEARCH_DAYS)
+
+        while candidate < deadline:
+            if candidate.month not in self.months or not self._matches_day(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+
+        raise ValueError(f"cron 表达式 '{self.expr}' 没有可执行的时间")
@@ -0,0 +1,244 @@
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict
+
+
+HISTORY_DB_NAME = "history.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS platforms (
+    id INTEGER PRIMARY KEY,
+    platform_id TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS titles (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS days (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS day_snapshots (
+    day_id INTEGER NOT NULL,
+    time_info TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (day_id, time_info)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS day_platforms (
+    day_id INTEGER NOT NULL,
+    platform_ref INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (day_id, platform_ref)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS appearances (
+    id INTEGER PRIMARY KEY,
+    day_id INTEGER NOT NULL,
+    platform_ref INTEGER NOT NULL,
+    title_ref INTEGER NOT NULL,
+    ranks TEXT NOT NULL,
+    url TEXT NOT NULL,
+    mobile_url TEXT NOT NULL,
+    first_time TEXT NOT NULL,
+    last_time TEXT NOT NULL,
+    UNIQUE (day_id, platform_ref, title_ref)
+);
+CREATE INDEX IF NOT EXISTS idx_appearances_title ON appearances (title_ref, day_id);
+CREATE TABLE IF NOT EXISTS title_grams (
+    gram TEXT NOT NULL,
+    title_ref INTEGER NOT NULL,
+    PRIMARY KEY (gram, title_ref)
+) WITHOUT ROWID;
+"""
+
+# trigram 分词器需要 SQLite 3.34+，不可用时只建普通表，查询端退回全量匹配
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS titles_fts USING fts5(
+    title, content='titles', content_rowid='id', tokenize='trigram'
+);
+"""
+
+
+def title_bigrams(title: str) -> set:
+    """标题（转小写后）中出现的全部相邻两字符组合"""
+    text = title.lower()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class HistoryStore:
+    """跨日期的历史库（SQLite）
+
+    所有日期共用一个库文件（output/history.db）。每天每个平台的每个标题一行，
+    记录当天按快照顺序累积的排名、首个快照中的链接以及首次/最后出现时间，
+    与 MCP 端按天合并快照得到的结果一致；标题全局去重，并建立 FTS5 trigram
+    全文索引和二元组倒排表（title_grams），供 MCP 的日期范围查询按关键词直接定位；
+    trigram 覆盖不到的两个字的中文关键词由倒排表命中。
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.executescript(_SCHEMA)
+        try:
+            self.conn.executescript(_FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError as e:
+            print(f"当前 SQLite 不支持 FTS5 trigram，历史库不建立全文索引: {e}")
+            self.has_fts = False
+        self._index_missing_title_grams()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _get_day_id(self, date: str) -> int:
+        row = self.conn.execute("SELECT id FROM days WHERE date = ?", (date,)).fetchone()
+        if row:
+            return row[0]
+        return self.conn.execute("INSERT INTO days (date) VALUES (?)", (date,)).lastrowid
+
+    def _get_platform_ref(self, platform_id: str) -> int:
+        row = self.conn.execute(
+            "SELECT id FROM platforms WHERE platform_id = ?", (platform_id,)
+        ).fetchone()
+        if row:
+            return row[0]
+        return self.conn.execute(
+            "INSERT INTO platforms (platform_id) VALUES (?)", (platform_id,)
+        ).lastrowid
+
+    def _get_title_ref(self, title: str) -> int:
+        row = self.conn.execute("SELECT id FROM titles WHERE title = ?", (title,)).fetchone()
+        if row:
+            return row[0]
+        ref = self.conn.execute("INSERT INTO titles (title) VALUES (?)", (title,)).lastrowid
+        if self.has_fts:
+            self.conn.execute(
+                "INSERT INTO titles_fts (rowid, title) VALUES (?, ?)", (ref, title)
+            )
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO title_grams VALUES (?, ?)",
+            [(gram, ref) for gram in title_bigrams(title)],
+        )
+        return ref
+
+    def _index_missing_title_grams(self) -> None:
+        """为倒排表建立之前写入的标题补建二元组（标题 id 递增，只需检查最大 id 之后的）"""
+        with self.conn:
+            last_ref = self.conn.execute(
+                "SELECT IFNULL(MAX(title_ref), 0) FROM title_grams"
+            ).fetchone()[0]
+            rows = []
+            for ref, title in self.conn.execute(
+                "SELECT id, title FROM titles WHERE id > ?", (last_ref,)
+            ):
+                rows.extend((gram, ref) for gram in title_bigrams(title))
+            self.conn.executemany("INSERT OR IGNORE INTO title_grams VALUES (?, ?)", rows)
+
+    def list_day_snapshots(self, date: str) -> Dict[str, int]:
+        """返回某天已写入的快照 {time_info: 内容字节数}"""
+        return dict(
+            self.conn.execute(
+                "SELECT s.time_info, s.size FROM day_snapshots s "
+                "JOIN days d ON d.id = s.day_id WHERE d.date = ?",
+                (date,),
+            )
+        )
+
+    def reset_day(self, date: str) -> None:
+        """清空某天的数据（标题字典保留），用于快照被替换后重建"""
+        with self.conn:
+            row = self.conn.execute("SELECT id FROM days WHERE date = ?", (date,)).fetchone()
+            if not row:
+                return
+            for table in ("appearances", "day_platforms", "day_snapshots"):
+                self.conn.execute(f"DELETE FROM {table} WHERE day_id = ?", (row[0],))
+
+    def add_snapshot(
+        self,
+        date: str,
+        time_info: str,
+        size: int,
+        titles_by_id: Dict,
+        id_to_name: Dict,
+    ) -> None:
+        """把一个快照合并进当天的数据，快照需按时间顺序写入
+
+        Args:
+            date: 日期，格式 YYYY-MM-DD
+            time_info: 快照时间（与 txt 文件名相同）
+            size: 快照内容字节数，用于判断快照是否被替换
+            titles_by_id: {source_id: {title: {ranks, url, mobileUrl}}}
+            id_to_name: {source_id: 平台名称}
+        """
+        with self.conn:
+            day_id = self._get_day_id(date)
+
+            positions = dict(
+                self.conn.execute(
+                    "SELECT platform_ref, position FROM day_platforms WHERE day_id = ?",
+                    (day_id,),
+                )
+            )
+            existing = {
+                (platform_ref, title_ref): (row_id, ranks)
+                for row_id, platform_ref, title_ref, ranks in self.conn.execute(
+                    "SELECT id, platform_ref, title_ref, ranks FROM appearances "
+                    "WHERE day_id = ?",
+                    (day_id,),
+                )
+            }
+
+            new_rows = []
+            updated_rows = []
+            for source_id, title_data in titles_by_id.items():
+                platform_ref = self._get_platform_ref(source_id)
+                name = id_to_name.get(source_id, source_id)
+                if platform_ref not in positions:
+                    positions[platform_ref] = len(positions)
+                    self.conn.execute(
+                        "INSERT INTO day_platforms VALUES (?, ?, ?, ?)",
+                        (day_id, platform_ref, positions[platform_ref], name),
+                    )
+                else:
+                    self.conn.execute(
+                        "UPDATE day_platforms SET name = ? "
+                        "WHERE day_id = ? AND platform_ref = ?",
+                        (name, day_id, platform_ref),
+                    )
+
+                for title, info in title_data.items():
+                    title_ref = self._get_title_ref(title)
+                    ranks = info.get("ranks") or [1]
+                    row = existing.get((platform_ref, title_ref))
+                    if row:
+                        merged_ranks = json.loads(row[1]) + ranks
+                        updated_rows.append((json.dumps(merged_ranks), time_info, row[0]))
+                    else:
+                        new_rows.append(
+                            (
+                                day_id,
+                                platform_ref,
+                                title_ref,
+                                json.dumps(ranks),
+                                info.get("url", ""),
+                                info.get("mobileUrl", ""),
+                                time_info,
+                                time_info,
+                            )
+                        )
+
+            self.conn.executemany(
+                "INSERT INTO appearances (day_id, platform_ref, title_ref, ranks, url, "
+                "mobile_url, first_time, last_time) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                new_rows,
+            )
+            self.conn.executemany(
+                "UPDATE appearances SET ranks = ?, last_time = ? WHERE id = ?",
+                updated_rows,
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO day_snapshots VALUES (?, ?, ?)",
+                (day_id, time_info, size),
+            )
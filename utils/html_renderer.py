@@ -1,18 +1,14 @@
-from typing import Dict, Optional
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
 from datetime import datetime
 from .html_escape import html_escape
 from .time_utils import get_beijing_time
 
 
-def render_html_content(
-    report_data: Dict,
-    total_titles: int,
-    is_daily_summary: bool = False,
-    mode: str = "daily",
-    update_info: Optional[Dict] = None,
-) -> str:
-    """渲染HTML内容"""
-    html = """
+_HTML_HEAD = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -537,267 +533,8 @@ def render_html_content(
                         <span class="info-label">报告类型</span>
                         <span class="info-value">"""
 
-    # 处理报告类型显示
-    if is_daily_summary:
-        if mode == "current":
-            html += "当前榜单"
-        elif mode == "incremental":
-            html += "增量模式"
-        else:
-            html += "当日汇总"
-    else:
-        html += "实时分析"
-
-    html += """
-                    </span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">新闻总数</span>
-                        <span class="info-value">"""
-
-    html += f"{total_titles} 条"
 
-    # 计算筛选后的热点新闻数量
-    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
-
-    html += """
-                    </span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">热点新闻</span>
-                        <span class="info-value">"""
-
-    html += f"{hot_news_count} 条"
-
-    html += """
-                    </span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">生成时间</span>
-                        <span class="info-value">"""
-
-    now = get_beijing_time()
-    html += now.strftime("%m-%d %H:%M")
-
-    html += """
-                    </span>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="content">"""
-
-    # 处理失败ID错误信息
-    if report_data["failed_ids"]:
-        html += """
-                <div class="error-section">
-                    <div class="error-title">⚠️ 请求失败的平台</div>
-                    <ul class="error-list">"""
-        for id_value in report_data["failed_ids"]:
-            html += f'<li class="error-item">{html_escape(id_value)}</li>'
-        html += """
-                    </ul>
-                </div>"""
-
-    # 处理新增新闻区域（放在上面）
-    if report_data["new_titles"]:
-        html += f"""
-                <div class="new-section">
-                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>
-                    <div class="new-platforms-container">"""
-
-        for source_data in report_data["new_titles"]:
-            escaped_source = html_escape(source_data["source_name"])
-            titles_count = len(source_data["titles"])
-
-            html += f"""
-                        <div class="new-platform-card">
-                            <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""
-
-            # 为新增新闻也添加序号
-            for idx, title_data in enumerate(source_data["titles"], 1):
-                ranks = title_data.get("ranks", [])
-
-                # 处理新增新闻的排名显示
-                rank_class = ""
-                if ranks:
-                    min_rank = min(ranks)
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= title_data.get("rank_threshold", 10):
-                        rank_class = "high"
-
-                    if len(ranks) == 1:
-                        rank_text = str(ranks[0])
-                    else:
-                        rank_text = f"{min(ranks)}-{max(ranks)}"
-                else:
-                    rank_text = "?"
-
-                html += f"""
-                            <div class="new-item">
-                                <div class="new-item-number">{idx}</div>
-                                <div class="new-item-rank {rank_class}">{rank_text}</div>
-                                <div class="new-item-content">
-                                    <div class="new-item-title">"""
-
-                # 处理新增新闻的链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
-
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" style="color: #2196f3; text-decoration: none;">{escaped_title}</a>'
-                else:
-                    html += escaped_title
-
-                html += """
-                                    </div>
-                                </div>
-                            </div>"""
-
-            html += """
-                        </div>"""
-
-        html += """
-                    </div>
-                </div>"""
-
-    # 按平台分组所有新闻
-    all_platform_news = {}
-    for stat in report_data["stats"]:
-        for title_data in stat["titles"]:
-            source_name = title_data["source_name"]
-            if source_name not in all_platform_news:
-                all_platform_news[source_name] = []
-            all_platform_news[source_name].append(title_data)
-    
-    # 处理主要统计数据 - 按平台卡片展示
-    if all_platform_news:
-        # 平台名称映射到CSS类名
-        platform_css_map = {
-            "今日头条": "toutiao",
-            "百度热搜": "baidu",
-            "微博": "weibo",
-            "抖音": "douyin",
-            "知乎": "zhihu",
-            "bilibili 热搜": "bilibili",
-            "贴吧": "tieba",
-            "凤凰网": "ifeng",
-            "华尔街见闻": "wallstreetcn",
-            "财联社热门": "cls"
-        }
-        
-        html += """
-                <div class="platforms-container">"""
-        
-        # 遍历每个平台，创建平台卡片
-        for platform, titles in all_platform_news.items():
-            total = len(titles)
-            show_more = total > 10
-            visible_titles = titles[:10]
-            hidden_titles = titles[10:]
-            
-            # 生成唯一的平台ID用于标识
-            platform_id = f"platform-{platform.replace(' ', '-').lower()}"
-            
-            # 获取平台对应的CSS类名
-            platform_css = platform_css_map.get(platform, "default")
-            
-            html += f"""
-                    <div class="platform-card {platform_css}">
-                        <div class="platform-header">
-                            <h3 class="platform-title">{html_escape(platform)}</h3>
-                            <span class="platform-stats">{total} 条</span>
-                        </div>
-                        <div class="platform-news">"""
-            
-            # 显示所有新闻
-            for idx, title_data in enumerate(titles, 1):
-                is_new = title_data.get("is_new", False)
-                
-                # 处理排名显示
-                ranks = title_data.get("ranks", [])
-                rank_text = ""
-                rank_class = ""
-                if ranks:
-                    min_rank = min(ranks)
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= title_data.get("rank_threshold", 10):
-                        rank_class = "high"
-                    
-                    if len(ranks) == 1:
-                        rank_text = str(ranks[0])
-                    else:
-                        rank_text = f"{min(ranks)}-{max(ranks)}"
-                
-                # 处理时间显示
-                time_display = title_data.get("time_display", "")
-                if time_display:
-                    simplified_time = time_display.replace(" ~ ", "~").replace("[", "").replace("]", "")
-                
-                # 处理出现次数
-                count_info = title_data.get("count", 1)
-                
-                # 处理标题和链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
-                
-                html += f"""
-                            <div class="news-item">
-                                <div class="news-rank {rank_class}">{rank_text}</div>
-                                <div class="news-content">
-                                    <div class="news-title">"""
-                
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank">{escaped_title}</a>'
-                else:
-                    html += escaped_title
-                
-                html += f"""
-                                    </div>
-                                    <div class="news-meta">"""
-                
-                if time_display:
-                    html += f'<span class="news-time">{html_escape(simplified_time)}</span>'
-                
-                if count_info > 1:
-                    html += f'<span class="news-count">{count_info}次</span>'
-                
-                html += f"""
-                                    </div>
-                                </div>
-                            </div>"""
-            
-            html += f"""
-                        </div>"""
-            
-            html += f"""
-                    </div>"""
-        
-        html += """
-                </div>"""
-
-    html += """
-            </div>
-            
-            <div class="footer">
-                <div class="footer-content">
-                    由 <span class="project-name">TrendRadar</span> 生成 · 
-                    <a href="https://github.com/sansan0/TrendRadar" target="_blank" class="footer-link">
-                        GitHub 开源项目
-                    </a>"""
-
-    if update_info:
-        html += f"""
-                    <br>
-                    <span style="color: #ea580c; font-weight: 500;">
-                        发现新版本 {update_info['remote_version']}，当前版本 {update_info['current_version']}
-                    </span>"""
-
-    html += """
+_HTML_TAIL = """
                 </div>
             </div>
         </div>
@@ -1142,4 +879,344 @@ def render_html_content(
     </body>
     </html>
     """
-    return html
+
+
+# 报告头部信息栏（报告类型、新闻总数、热点新闻、生成时间）
+_HEADER_INFO_TEMPLATE = """{report_type}
+                    </span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">新闻总数</span>
+                        <span class="info-value">{total_titles} 条
+                    </span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">热点新闻</span>
+                        <span class="info-value">{hot_news_count} 条
+                    </span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">生成时间</span>
+                        <span class="info-value">{generated_at}
+                    </span>
+                    </div>
+                </div>
+            </div>
+            
+            <div class="content">"""
+
+_NEW_SOURCE_TEMPLATE = """
+                        <div class="new-platform-card">
+                            <div class="new-source-title">{source} · {count}条</div>"""
+
+_NEW_ITEM_TEMPLATE = """
+                            <div class="new-item">
+                                <div class="new-item-number">{idx}</div>
+                                <div class="new-item-rank {rank_class}">{rank_text}</div>
+                                <div class="new-item-content">
+                                    <div class="new-item-title">{title}
+                                    </div>
+                                </div>
+                            </div>"""
+
+_PLATFORM_CARD_TEMPLATE = """
+                    <div class="platform-card {css}">
+                        <div class="platform-header">
+                            <h3 class="platform-title">{platform}</h3>
+                            <span class="platform-stats">{total} 条</span>
+                        </div>
+                        <div class="platform-news">"""
+
+_NEWS_ITEM_TEMPLATE = """
+                            <div class="news-item">
+                                <div class="news-rank {rank_class}">{rank_text}</div>
+                                <div class="news-content">
+                                    <div class="news-title">{title}
+                                    </div>
+                                    <div class="news-meta">{meta}
+                                    </div>
+                                </div>
+                            </div>"""
+
+_FOOTER_TEMPLATE = """
+            </div>
+            
+            <div class="footer">
+                <div class="footer-content">
+                    由 <span class="project-name">TrendRadar</span> 生成 · 
+                    <a href="https://github.com/sansan0/TrendRadar" target="_blank" class="footer-link">
+                        GitHub 开源项目
+                    </a>"""
+
+# 平台名称映射到CSS类名
+_PLATFORM_CSS_MAP = {
+    "今日头条": "toutiao",
+    "百度热搜": "baidu",
+    "微博": "weibo",
+    "抖音": "douyin",
+    "知乎": "zhihu",
+    "bilibili 热搜": "bilibili",
+    "贴吧": "tieba",
+    "凤凰网": "ifeng",
+    "华尔街见闻": "wallstreetcn",
+    "财联社热门": "cls",
+}
+
+# 流式写入时累积到该字符数再写一次文件
+_WRITE_CHUNK_SIZE = 64 * 1024
+
+
+def _get_new_file_mode() -> int:
+    """open() 新建文件时的默认权限（0o666 去掉 umask）"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# 只能通过临时修改 umask 读取，且会影响同进程其他线程新建的文件，
+# 因此在导入时（尚未启动工作线程）读取一次
+_NEW_FILE_MODE = _get_new_file_mode()
+
+
+def _rank_display(title_data: Dict, missing: str = "") -> Tuple[str, str]:
+    """返回 (排名CSS类名, 排名文本)，没有排名时文本为 missing"""
+    ranks = title_data.get("ranks", [])
+    if not ranks:
+        return "", missing
+
+    min_rank = min(ranks)
+    rank_class = ""
+    if min_rank <= 3:
+        rank_class = "top"
+    elif min_rank <= title_data.get("rank_threshold", 10):
+        rank_class = "high"
+
+    if len(ranks) == 1:
+        return rank_class, str(ranks[0])
+    return rank_class, f"{min_rank}-{max(ranks)}"
+
+
+def iter_html_chunks(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+) -> Iterator[str]:
+    """逐段生成HTML内容（每条新闻一段），供拼接或直接流式写入文件"""
+    yield _HTML_HEAD
+
+    # 处理报告类型显示
+    if is_daily_summary:
+        if mode == "current":
+            report_type = "当前榜单"
+        elif mode == "incremental":
+            report_type = "增量模式"
+        else:
+            report_type = "当日汇总"
+    else:
+        report_type = "实时分析"
+
+    # 计算筛选后的热点新闻数量
+    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
+
+    yield _HEADER_INFO_TEMPLATE.format(
+        report_type=report_type,
+        total_titles=total_titles,
+        hot_news_count=hot_news_count,
+        generated_at=get_beijing_time().strftime("%m-%d %H:%M"),
+    )
+
+    # 处理失败ID错误信息
+    if report_data["failed_ids"]:
+        yield """
+                <div class="error-section">
+                    <div class="error-title">⚠️ 请求失败的平台</div>
+                    <ul class="error-list">"""
+        yield "".join(
+            f'<li class="error-item">{html_escape(id_value)}</li>'
+            for id_value in report_data["failed_ids"]
+        )
+        yield """
+                    </ul>
+                </div>"""
+
+    # 处理新增新闻区域（放在上面）
+    if report_data["new_titles"]:
+        yield f"""
+                <div class="new-section">
+                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>
+                    <div class="new-platforms-container">"""
+
+        for source_data in report_data["new_titles"]:
+            yield _NEW_SOURCE_TEMPLATE.format(
+                source=html_escape(source_data["source_name"]),
+                count=len(source_data["titles"]),
+            )
+
+            # 为新增新闻也添加序号
+            for idx, title_data in enumerate(source_data["titles"], 1):
+                rank_class, rank_text = _rank_display(title_data, missing="?")
+
+                escaped_title = html_escape(title_data["title"])
+                link_url = title_data.get("mobile_url") or title_data.get("url", "")
+                if link_url:
+                    title_html = f'<a href="{html_escape(link_url)}" target="_blank" style="color: #2196f3; text-decoration: none;">{escaped_title}</a>'
+                else:
+                    title_html = escaped_title
+
+                yield _NEW_ITEM_TEMPLATE.format(
+                    idx=idx, rank_class=rank_class, rank_text=rank_text, title=title_html
+                )
+
+            yield """
+                        </div>"""
+
+        yield """
+                    </div>
+                </div>"""
+
+    # 按平台分组所有新闻
+    all_platform_news = {}
+    for stat in report_data["stats"]:
+        for title_data in stat["titles"]:
+            all_platform_news.setdefault(title_data["source_name"], []).append(title_data)
+
+    # 处理主要统计数据 - 按平台卡片展示
+    if all_platform_news:
+        yield """
+                <div class="platforms-container">"""
+
+        # 遍历每个平台，创建平台卡片
+        for platform, titles in all_platform_news.items():
+            yield _PLATFORM_CARD_TEMPLATE.format(
+                css=_PLATFORM_CSS_MAP.get(platform, "default"),
+                platform=html_escape(platform),
+                total=len(titles),
+            )
+
+            for title_data in titles:
+                rank_class, rank_text = _rank_display(title_data)
+
+                escaped_title = html_escape(title_data["title"])
+                link_url = title_data.get("mobile_url") or title_data.get("url", "")
+                if link_url:
+                    title_html = f'<a href="{html_escape(link_url)}" target="_blank">{escaped_title}</a>'
+                else:
+                    title_html = escaped_title
+
+                # 处理时间显示和出现次数
+                meta = ""
+                time_display = title_data.get("time_display", "")
+                if time_display:
+                    simplified_time = time_display.replace(" ~ ", "~").replace("[", "").replace("]", "")
+                    meta += f'<span class="news-time">{html_escape(simplified_time)}</span>'
+                count_info = title_data.get("count", 1)
+                if count_info > 1:
+                    meta += f'<span class="news-count">{count_info}次</span>'
+
+                yield _NEWS_ITEM_TEMPLATE.format(
+                    rank_class=rank_class, rank_text=rank_text, title=title_html, meta=meta
+                )
+
+            yield """
+                        </div>
+                    </div>"""
+
+        yield """
+                </div>"""
+
+    yield _FOOTER_TEMPLATE
+
+    if update_info:
+        yield f"""
+                    <br>
+                    <span style="color: #ea580c; font-weight: 500;">
+                        发现新版本 {update_info['remote_version']}，当前版本 {update_info['current_version']}
+                    </span>"""
+
+    yield _HTML_TAIL
+
+
+def render_html_content(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+) -> str:
+    """渲染HTML内容"""
+    return "".join(
+        iter_html_chunks(report_data, total_titles, is_daily_summary, mode, update_info)
+    )
+
+
+def write_html_report(
+    file_path: Union[str, Path],
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+) -> None:
+    """
+    将HTML内容流式写入文件
+
+    先写入同目录下的临时文件，再原子替换目标文件，
+    渲染中途出错或进程退出时不会留下写了一半的报告。
+    """
+    file_path = Path(file_path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            buffer = []
+            buffered = 0
+            for chunk in iter_html_chunks(
+                report_data, total_titles, is_daily_summary, mode, update_info
+            ):
+                buffer.append(chunk)
+                buffered += len(chunk)
+                if buffered >= _WRITE_CHUNK_SIZE:
+                    f.write("".join(buffer))
+                    buffer.clear()
+                    buffered = 0
+            f.write("".join(buffer))
+        _replace_file(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def publish_html_copy(source_path: Union[str, Path], target_path: Union[str, Path]) -> None:
+    """
+    将已生成的报告发布到另一个路径（如根目录 index.html）
+
+    优先创建硬链接再原子替换目标文件；跨文件系统等无法硬链接时退回到复制临时文件。
+    """
+    source_path = Path(source_path)
+    target_path = Path(target_path)
+    target_dir = target_path.parent
+    tmp_path = str(target_dir / f".{target_path.name}.{os.getpid()}.tmp")
+    try:
+        try:
+            os.link(source_path, tmp_path)
+        except OSError:
+            shutil.copyfile(source_path, tmp_path)
+        _replace_file(tmp_path, target_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _replace_file(tmp_path: str, file_path: Path) -> None:
+    """用临时文件原子替换目标文件，沿用 open() 新建文件时的默认权限"""
+    os.chmod(tmp_path, _NEW_FILE_MODE)
+    os.replace(tmp_path, file_path)
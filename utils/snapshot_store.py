@@ -0,0 +1,395 @@
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+SNAPSHOT_DB_NAME = "snapshots.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS titles (
+    id INTEGER PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS urls (
+    id INTEGER PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS slots (
+    id INTEGER PRIMARY KEY,
+    time_info TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    failed_ids TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS slot_sources (
+    slot_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    source_ref INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    fingerprint TEXT,
+    base_slot_id INTEGER,
+    PRIMARY KEY (slot_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS appearances (
+    slot_id INTEGER NOT NULL,
+    source_ref INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    title_ref INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    url_ref INTEGER NOT NULL,
+    mobile_url_ref INTEGER NOT NULL,
+    PRIMARY KEY (slot_id, source_ref, position)
+) WITHOUT ROWID;
+"""
+
+# 旧版本建的库缺少的 slot_sources 列
+_SLOT_SOURCE_COLUMNS = (("fingerprint", "TEXT"), ("base_slot_id", "INTEGER"))
+
+
+def connect_readonly(db_path: Path) -> sqlite3.Connection:
+    """以只读方式打开 SQLite 库
+
+    路径需转成转义后的 file: URI，否则路径中的 #、?、% 会截断路径并丢掉 mode=ro。
+    """
+    uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+    return sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+
+def fingerprint_titles(title_data: Dict) -> str:
+    """平台标题列表的内容指纹（按顺序覆盖入库的标题、排名和链接）"""
+    digest = hashlib.sha1()
+    for title, info in title_data.items():
+        ranks = info.get("ranks") or [1]
+        digest.update(
+            "\x1f".join(
+                (title, str(ranks[0]), info.get("url", ""), info.get("mobileUrl", ""))
+            ).encode("utf-8")
+        )
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+class SnapshotStore:
+    """当日快照库（SQLite）
+
+    每个日期目录一个库文件，标题、链接和平台 ID 均做字符串驻留（字典表只存一份文本，
+    驻留映射在内存中维护，不建文本索引），每次抓取是一个时间槽（time_info 与 txt
+    文件名相同），每条记录只存整数引用和排名。
+    每个平台记录内容指纹，与当天已有时间槽内容相同的平台只记录 base_slot_id
+    （引用保存了这份内容的时间槽），不再重复写入标题记录。
+    读取结果与解析对应 txt 文件得到的 (titles_by_id, id_to_name) 完全一致。
+    """
+
+    _STRING_TABLES = ("sources", "titles", "urls")
+
+    def __init__(self, db_path: Path, readonly: bool = False):
+        self.db_path = Path(db_path)
+        if readonly:
+            self.conn = connect_readonly(self.db_path)
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self.conn.executescript(_SCHEMA)
+            self._migrate()
+        self._strings: Optional[Dict[str, List[str]]] = None
+        self._refs: Optional[Dict[str, Dict[str, int]]] = None
+        # {(平台引用, 内容指纹): 保存该内容的时间槽 id}
+        self._owners: Optional[Dict[Tuple[int, str], int]] = None
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _migrate(self) -> None:
+        """为旧版本建的库补充内容指纹相关的列"""
+        columns = {
+            row[1] for row in self.conn.execute("PRAGMA table_info(slot_sources)")
+        }
+        with self.conn:
+            for column, column_type in _SLOT_SOURCE_COLUMNS:
+                if column not in columns:
+                    self.conn.execute(
+                        f"ALTER TABLE slot_sources ADD COLUMN {column} {column_type}"
+                    )
+
+    def _has_base_slots(self) -> bool:
+        """库中是否有 base_slot_id 列（只读打开的旧库没有）"""
+        return any(
+            row[1] == "base_slot_id"
+            for row in self.conn.execute("PRAGMA table_info(slot_sources)")
+        )
+
+    def _load_owners(self) -> Dict[Tuple[int, str], int]:
+        """读取 {(平台引用, 内容指纹): 保存该内容的时间槽 id}"""
+        if self._owners is None:
+            self._owners = {
+                (source_ref, fingerprint): slot_id
+                for slot_id, source_ref, fingerprint in self.conn.execute(
+                    "SELECT slot_id, source_ref, fingerprint FROM slot_sources "
+                    "WHERE base_slot_id IS NULL AND fingerprint IS NOT NULL"
+                )
+            }
+        return self._owners
+
+    def _previous_fingerprints(self, time_info: str) -> Dict[int, Optional[str]]:
+        """早于 time_info 的最近一个时间槽中各平台的内容指纹"""
+        return dict(
+            self.conn.execute(
+                "SELECT source_ref, fingerprint FROM slot_sources WHERE slot_id = "
+                "(SELECT id FROM slots WHERE time_info < ? "
+                "ORDER BY time_info DESC LIMIT 1)",
+                (time_info,),
+            )
+        )
+
+    def _detach_dependents(self, slot_id: int) -> None:
+        """删除时间槽前，把引用它的平台内容复制给最早的引用方，其余引用方改为引用该时间槽"""
+        dependents = self.conn.execute(
+            "SELECT ss.slot_id, ss.source_ref FROM slot_sources ss "
+            "JOIN slots sl ON sl.id = ss.slot_id "
+            "WHERE ss.base_slot_id = ? ORDER BY sl.time_info",
+            (slot_id,),
+        ).fetchall()
+
+        new_owners = {}
+        for dependent_id, source_ref in dependents:
+            owner_id = new_owners.get(source_ref)
+            if owner_id is None:
+                new_owners[source_ref] = dependent_id
+                self.conn.execute(
+                    "INSERT INTO appearances SELECT ?, source_ref, position, title_ref, "
+                    "rank, url_ref, mobile_url_ref FROM appearances "
+                    "WHERE slot_id = ? AND source_ref = ?",
+                    (dependent_id, slot_id, source_ref),
+                )
+            self.conn.execute(
+                "UPDATE slot_sources SET base_slot_id = ? "
+                "WHERE slot_id = ? AND source_ref = ?",
+                (owner_id, dependent_id, source_ref),
+            )
+
+    def _load_strings(self) -> Dict[str, List[str]]:
+        """读取字典表，返回 {表名: 按 id 下标的字符串列表}"""
+        if self._strings is None:
+            self._strings = {}
+            for table in self._STRING_TABLES:
+                values = [""]
+                for ref, value in self.conn.execute(
+                    f"SELECT id, value FROM {table} ORDER BY id"
+                ):
+                    values.extend([""] * (ref - len(values)))
+                    values.append(value)
+                self._strings[table] = values
+        return self._strings
+
+    def _intern(self, table: str, value: str) -> int:
+        if self._refs is None:
+            self._refs = {
+                name: {value: ref for ref, value in enumerate(values) if ref}
+                for name, values in self._load_strings().items()
+            }
+        ref = self._refs[table].get(value)
+        if ref is None:
+            ref = self.conn.execute(
+                f"INSERT INTO {table} (value) VALUES (?)", (value,)
+            ).lastrowid
+            self._refs[table][value] = ref
+            strings = self._strings[table]
+            strings.extend([""] * (ref - len(strings)))
+            strings.append(value)
+        return ref
+
+    def save_snapshot(
+        self,
+        time_info: str,
+        titles_by_id: Dict,
+        id_to_name: Dict,
+        failed_ids: List,
+        size: int,
+    ) -> List[str]:
+        """写入一个时间槽，同名时间槽已存在时整体替换
+
+        返回与上一个时间槽相比内容有变化的平台 ID（含新出现和消失的平台），
+        没有上一个时间槽时返回全部平台。
+        """
+        previous = self._previous_fingerprints(time_info)
+        changed = []
+
+        try:
+            with self.conn:
+                row = self.conn.execute(
+                    "SELECT id FROM slots WHERE time_info = ?", (time_info,)
+                ).fetchone()
+                if row:
+                    self._detach_dependents(row[0])
+                    for table in ("slot_sources", "appearances", "slots"):
+                        column = "id" if table == "slots" else "slot_id"
+                        self.conn.execute(
+                            f"DELETE FROM {table} WHERE {column} = ?", (row[0],)
+                        )
+                    self._owners = None
+
+                slot_id = self.conn.execute(
+                    "INSERT INTO slots (time_info, size, created_at, failed_ids) "
+                    "VALUES (?, ?, ?, ?)",
+                    (time_info, size, time.time(), json.dumps(failed_ids)),
+                ).lastrowid
+
+                owners = self._load_owners()
+                new_owners = []
+                slot_sources = []
+                appearances = []
+                for source_position, (source_id, title_data) in enumerate(
+                    titles_by_id.items()
+                ):
+                    source_ref = self._intern("sources", source_id)
+                    fingerprint = fingerprint_titles(title_data)
+                    if previous.pop(source_ref, None) != fingerprint:
+                        changed.append(source_id)
+
+                    # 内容与当天已有时间槽相同：只记录引用
+                    base_slot_id = owners.get((source_ref, fingerprint))
+                    slot_sources.append(
+                        (
+                            slot_id,
+                            source_position,
+                            source_ref,
+                            id_to_name.get(source_id, source_id),
+                            fingerprint,
+                            base_slot_id,
+                        )
+                    )
+                    if base_slot_id is not None:
+                        continue
+
+                    new_owners.append((source_ref, fingerprint))
+                    for position, (title, info) in enumerate(title_data.items()):
+                        ranks = info.get("ranks") or [1]
+                        appearances.append(
+                            (
+                                slot_id,
+                                source_ref,
+                                position,
+                                self._intern("titles", title),
+                                ranks[0],
+                                self._intern("urls", info.get("url", "")),
+                                self._intern("urls", info.get("mobileUrl", "")),
+                            )
+                        )
+
+                self.conn.executemany(
+                    "INSERT INTO slot_sources VALUES (?, ?, ?, ?, ?, ?)", slot_sources
+                )
+                self.conn.executemany(
+                    "INSERT INTO appearances VALUES (?, ?, ?, ?, ?, ?, ?)", appearances
+                )
+        except BaseException:
+            # 事务已回滚，内容引用缓存可能与库不一致
+            self._owners = None
+            raise
+
+        # 提交成功后再登记本时间槽保存的内容
+        for key in new_owners:
+            owners[key] = slot_id
+
+        # 上一个时间槽有、本次没有的平台
+        if previous:
+            source_ids = self._load_strings()["sources"]
+            changed.extend(source_ids[source_ref] for source_ref in previous)
+        return changed
+
+    def list_snapshots(self) -> List[Tuple[str, int, float]]:
+        """按时间顺序返回 [(time_info, 内容字节数, 写入时间戳)]"""
+        return self.conn.execute(
+            "SELECT time_info, size, created_at FROM slots ORDER BY time_info"
+        ).fetchall()
+
+    def iter_snapshots(
+        self, time_infos: Optional[List[str]] = None
+    ) -> Iterator[Tuple[str, Dict, Dict]]:
+        """按时间顺序读取时间槽，产出 (time_info, titles_by_id, id_to_name)
+
+        time_infos 为 None 时读取全部时间槽，无论多少个时间槽都只需两次查询。
+        """
+        slot_filter = ""
+        params: List = []
+        if time_infos is not None:
+            if not time_infos:
+                return
+            slot_filter = f"WHERE sl.time_info IN ({','.join('?' * len(time_infos))})"
+            params = list(time_infos)
+
+        strings = self._load_strings()
+        source_ids = strings["sources"]
+        titles = strings["titles"]
+        urls = strings["urls"]
+
+        # 引用其他时间槽内容的平台，从被引用的时间槽读取标题记录
+        owner_column = (
+            "COALESCE(ss.base_slot_id, ss.slot_id)"
+            if self._has_base_slots()
+            else "ss.slot_id"
+        )
+
+        slots = {}
+        # {(保存内容的时间槽 id, 平台引用): [需要填充的标题字典]}
+        targets: Dict[Tuple[int, int], List[Dict]] = {}
+        for slot_id, time_info, source_ref, name, owner_id in self.conn.execute(
+            f"SELECT sl.id, sl.time_info, ss.source_ref, ss.name, {owner_column} "
+            "FROM slots sl JOIN slot_sources ss ON ss.slot_id = sl.id "
+            f"{slot_filter} "
+            "ORDER BY sl.time_info, ss.position",
+            params,
+        ):
+            if slot_id not in slots:
+                slots[slot_id] = (time_info, {}, {})
+            source_titles = {}
+            slots[slot_id][1][source_ids[source_ref]] = source_titles
+            slots[slot_id][2][source_ids[source_ref]] = name
+            targets.setdefault((owner_id, source_ref), []).append(source_titles)
+
+        if not slots:
+            return
+
+        appearance_filter = ""
+        owner_ids = sorted({owner_id for owner_id, _ in targets})
+        if time_infos is not None:
+            appearance_filter = f"WHERE slot_id IN ({','.join('?' * len(owner_ids))})"
+
+        current_key = None
+        source_targets = ()
+        for slot_id, source_ref, title_ref, rank, url_ref, mobile_url_ref in self.conn.execute(
+            "SELECT slot_id, source_ref, title_ref, rank, url_ref, mobile_url_ref "
+            f"FROM appearances {appearance_filter} "
+            "ORDER BY slot_id, source_ref, position",
+            owner_ids if appearance_filter else [],
+        ):
+            if (slot_id, source_ref) != current_key:
+                current_key = (slot_id, source_ref)
+                source_targets = targets.get(current_key, ())
+            title = titles[title_ref]
+            url = urls[url_ref]
+            mobile_url = urls[mobile_url_ref]
+            for source_titles in source_targets:
+                source_titles[title] = {
+                    "ranks": [rank],
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+
+        for time_info, titles_by_id, id_to_name in sorted(
+            slots.values(), key=lambda slot: slot[0]
+        ):
+            yield time_info, titles_by_id, id_to_name
+
+    def load_snapshot(self, time_info: str) -> Optional[Tuple[Dict, Dict]]:
+        """读取单个时间槽，不存在时返回 None"""
+        for _, titles_by_id, id_to_name in self.iter_snapshots([time_info]):
+            return titles_by_id, id_to_name
+        return None
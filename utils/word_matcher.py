@@ -0,0 +1,148 @@
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class AhoCorasick:
+    """Aho–Corasick 多模式匹配自动机，一次扫描找出文本中出现的全部模式"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[tuple] = [()]
+        self._empty_ids: List[int] = []
+
+        own_outputs: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(patterns):
+            self.patterns.append(pattern)
+            if not pattern:
+                # 空模式在任何文本中都"出现"，与 "" in text 的语义一致
+                self._empty_ids.append(pattern_id)
+                continue
+
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    own_outputs.append([])
+                state = next_state
+            own_outputs[state].append(pattern_id)
+
+        # 广度优先构建失败指针，并沿失败链合并输出
+        self._output = [()] * len(self._goto)
+        queue = deque()
+        for state in self._goto[0].values():
+            self._output[state] = tuple(own_outputs[state])
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fail_state = self._fail[state]
+                while fail_state and char not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+                self._fail[next_state] = self._goto[fail_state].get(char, 0)
+                self._output[next_state] = tuple(own_outputs[next_state]) + self._output[
+                    self._fail[next_state]
+                ]
+                queue.append(next_state)
+
+    def find_all(self, text: str) -> Set[int]:
+        """返回文本中出现过的模式编号集合"""
+        found = set(self._empty_ids)
+        if len(self._goto) == 1:
+            return found
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+
+        return found
+
+
+class WordGroupMatcher:
+    """编译后的频率词匹配器
+
+    所有过滤词、必须词和普通词统一转为小写后构建一个 Aho–Corasick 自动机，
+    每个标题只扫描一次即可得到命中的词，再据此判定过滤词和所属词组。
+    判定规则与逐词 `in` 检查完全一致：命中任一过滤词则排除；否则返回第一个
+    必须词全部出现、且（若有普通词）至少出现一个普通词的词组。
+    """
+
+    def __init__(self, word_groups: List[Dict], filter_words: List[str]):
+        self.word_groups = word_groups
+        self.filter_words = filter_words
+
+        word_ids: Dict[str, int] = {}
+
+        def intern(word: str) -> int:
+            word = word.lower()
+            if word not in word_ids:
+                word_ids[word] = len(word_ids)
+            return word_ids[word]
+
+        self._filter_ids = frozenset(intern(word) for word in filter_words)
+        self._groups = []
+        # 没有任何词的词组（如"全部新闻"虚拟词组）对所有标题都成立
+        self._wordless_groups: List[int] = []
+        word_to_groups: Dict[int, List[int]] = {}
+        for index, group in enumerate(word_groups):
+            required = frozenset(intern(word) for word in group["required"])
+            normal = frozenset(intern(word) for word in group["normal"])
+            self._groups.append((required, normal))
+            if not required and not normal:
+                self._wordless_groups.append(index)
+            for word_id in required | normal:
+                word_to_groups.setdefault(word_id, []).append(index)
+
+        self._word_to_groups = word_to_groups
+        self._automaton = AhoCorasick(word_ids)
+
+    def match_group(self, title: str) -> Optional[int]:
+        """返回标题所属词组的下标；被过滤或未命中任何词组时返回 None
+
+        未配置任何词组时所有有效标题都匹配，返回 -1。
+        """
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        if not title.strip():
+            return None
+
+        # 没有配置词组时匹配所有标题
+        if not self._groups:
+            return -1
+
+        found = self._automaton.find_all(title.lower())
+        if found & self._filter_ids:
+            return None
+
+        # 只有包含命中词的词组才可能匹配
+        candidates = set(self._wordless_groups)
+        for word_id in found:
+            candidates.update(self._word_to_groups.get(word_id, ()))
+
+        for index in sorted(candidates):
+            required, normal = self._groups[index]
+            if required and not required <= found:
+                continue
+            if normal and not normal & found:
+                continue
+            return index
+
+        return None
+
+    def matches(self, title: str) -> bool:
+        """标题是否通过过滤词并命中任一词组"""
+        return self.match_group(title) is not None